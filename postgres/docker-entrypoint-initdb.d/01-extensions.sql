@@ -2,3 +2,4 @@
 CREATE EXTENSION IF NOT EXISTS vector;
 CREATE EXTENSION IF NOT EXISTS postgis;
 
+CREATE EXTENSION IF NOT EXISTS pg_stat_statements;
@@ -0,0 +1,15 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Run opt-in benchmarks against the running emulators.
+# Results are printed in the pytest summary and written to ${BENCH_OUTPUT_DIR:-bench-results}/.
+# Usage: bash scripts/run-benchmarks.sh [path] [pytest opts...]
+
+command -v uv >/dev/null 2>&1 || { echo "uv not found. Install: https://github.com/astral-sh/uv" >&2; exit 127; }
+
+path="${1:-tests/bench}"
+(( $# > 0 )) && shift
+
+echo "Running benchmarks: ${path}"
+RUN_BENCH=1 uv run pytest "$path" -v -m bench -ra "$@"
+echo "Done."
@@ -6,6 +6,6 @@ set -euo pipefail
 
 command -v uv >/dev/null 2>&1 || { echo "uv not found. Install: https://github.com/astral-sh/uv" >&2; exit 127; }
 
-echo "Running unit/integration tests (not e2e)"
-uv run pytest tests/ -v -m "not e2e"
+echo "Running unit/integration tests (not e2e, not bench)"
+uv run pytest tests/ -v -m "not e2e and not bench"
 echo "Done."
@@ -0,0 +1,57 @@
+"""Fixtures for opt-in benchmarks against the running emulators.
+
+- Tests under `tests/bench/` are auto-marked `bench`.
+- They are skipped unless `RUN_BENCH=1` (see `just bench`), so regular
+  `just test` runs are not slowed down by long sweeps.
+- Results registered through `bench_report` are printed in the terminal
+  summary and written as JSON under `BENCH_OUTPUT_DIR` (default: `bench-results/`).
+"""
+
+import os
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from tests.utils.bench import BenchReport
+
+_REPORTS: list[BenchReport] = []
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    bench_root = Path(__file__).parent.resolve()
+    enabled = os.environ.get("RUN_BENCH", "") == "1"
+    skip = pytest.mark.skip(
+        reason="benchmarks are opt-in: set RUN_BENCH=1 or run `just bench`"
+    )
+    for item in items:
+        path = Path(str(getattr(item, "path", ""))).resolve()
+        if path.is_relative_to(bench_root):
+            item.add_marker(pytest.mark.bench)
+            if not enabled:
+                item.add_marker(skip)
+
+
+def pytest_terminal_summary(terminalreporter) -> None:
+    if not _REPORTS:
+        return
+    out_dir = Path(os.environ.get("BENCH_OUTPUT_DIR", "bench-results"))
+    terminalreporter.section("benchmark results")
+    for report in _REPORTS:
+        for line in report.render():
+            terminalreporter.write_line(line)
+        path = report.write_json(out_dir)
+        terminalreporter.write_line(f"(written to {path})")
+        terminalreporter.write_line("")
+
+
+@pytest.fixture
+def bench_report() -> Callable[[str], BenchReport]:
+    """Return a callable that creates and registers a named report."""
+
+    def _new(name: str) -> BenchReport:
+        report = BenchReport(name=name)
+        _REPORTS.append(report)
+        return report
+
+    return _new
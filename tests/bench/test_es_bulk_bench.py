@@ -0,0 +1,93 @@
+"""Elasticsearch streaming `_bulk` ingestion benchmark.
+
+Streams the synthetic article corpus (`tests.utils.es.make_corpus`) through
+`stream_bulk` for every (chunk size, concurrency) combination into a fresh
+index, and reports docs/sec, MB/sec, chunk latency, 429 retries and per-item
+errors. `refresh_interval` is disabled during the load and the final document
+count is checked after an explicit `_refresh`.
+
+Knobs:
+
+- `ES_BULK_DOCS` (default 100000)
+- `ES_BULK_CHUNK_DOCS` (default `500,2000,5000`): max actions per `_bulk`
+- `ES_BULK_CHUNK_MB` (default 5): max bytes per `_bulk`, MiB
+- `ES_BULK_CONCURRENCY` (default `1,4,8`): in-flight requests
+
+`elasticsearch-exporter` metrics (JVM GC, merges, thread-pool rejections) are
+sampled during each load next to the client's acknowledged-docs counter and
+attached as `metrics.<chunk>x<concurrency>` (`PROM_INTERVAL` seconds apart).
+"""
+
+import aiohttp
+import pytest
+from aiohttp import ClientSession, ClientTimeout
+
+from tests.utils.bench import env_float, env_int, env_ints
+from tests.utils.es import (
+    CORPUS_MAPPINGS,
+    BulkResult,
+    es_request,
+    index_actions,
+    make_corpus,
+    recreate_index,
+    stream_bulk,
+)
+from tests.utils.prom import MetricsSampler, default_targets
+
+INDEX = "bench_bulk"
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(0)
+async def test_es_streaming_bulk(bench_report) -> None:
+    docs = env_int("ES_BULK_DOCS", 100_000)
+    chunk_docs = env_ints("ES_BULK_CHUNK_DOCS", "500,2000,5000")
+    chunk_bytes = int(env_float("ES_BULK_CHUNK_MB", 5) * 2**20)
+    concurrencies = env_ints("ES_BULK_CONCURRENCY", "1,4,8")
+
+    async with ClientSession(timeout=ClientTimeout(total=300)) as http:
+        try:
+            await es_request(http, "GET", "_cluster/health")
+        except aiohttp.ClientConnectionError as e:
+            pytest.skip(f"Elasticsearch not reachable: {e}")
+
+        report = bench_report("es_bulk")
+        report.note(f"docs={docs} chunk_mb={chunk_bytes / 2**20:g}")
+        for max_docs in chunk_docs:
+            for concurrency in concurrencies:
+                await recreate_index(
+                    http,
+                    INDEX,
+                    {
+                        "settings": {
+                            "number_of_shards": 1,
+                            "number_of_replicas": 0,
+                            "refresh_interval": "-1",
+                        },
+                        "mappings": CORPUS_MAPPINGS,
+                    },
+                )
+                result = BulkResult()
+                async with MetricsSampler(
+                    http,
+                    targets=[default_targets()["elasticsearch"]],
+                    client={"acked_docs": lambda: result.docs},
+                ) as sampler:
+                    await stream_bulk(
+                        http,
+                        index_actions(INDEX, make_corpus(docs), id_field="id"),
+                        max_docs=max_docs,
+                        max_bytes=chunk_bytes,
+                        concurrency=concurrency,
+                        result=result,
+                    )
+                sampler.attach(report, f"metrics.{max_docs}x{concurrency}")
+                await es_request(http, "POST", f"{INDEX}/_refresh")
+                count = (await es_request(http, "GET", f"{INDEX}/_count"))["count"]
+                assert count == result.docs, f"indexed {count}, acked {result.docs}"
+                report.add(
+                    chunk_docs=max_docs, concurrency=concurrency, **result.summary()
+                )
+                if result.errors:
+                    report.note(f"first error: {result.errors[0]}")
+        await es_request(http, "DELETE", INDEX, ok=(404,))
@@ -0,0 +1,165 @@
+"""Elasticsearch `_msearch` batching benchmark (typeahead fan-out).
+
+Seeds the synthetic corpus, then simulates typeahead users: every keystroke
+fans out `ES_MSEARCH_FANOUT` prefix queries (one per category filter) and
+waits for all of them. Queries are issued either one `_search` each
+(`single`) or through `MsearchBatcher` with different batch sizes, with the
+same bound on in-flight requests. Each mode reports keystroke latency and, per
+query, server `took` vs client-observed latency so transport and queueing
+overhead show up separately.
+
+Knobs:
+
+- `ES_MSEARCH_DOCS` (default 50000)
+- `ES_MSEARCH_KEYSTROKES` (default 200): per simulated user
+- `ES_MSEARCH_USERS` (default 4): concurrent typists
+- `ES_MSEARCH_FANOUT` (default 24): queries per keystroke
+- `ES_MSEARCH_BATCHES` (default `8,32,96`): `max_batch` sizes
+- `ES_MSEARCH_CONCURRENCY` (default 4): in-flight requests
+"""
+
+import asyncio
+import random
+import time
+
+import aiohttp
+import pytest
+from aiohttp import ClientSession, ClientTimeout
+
+from tests.utils.bench import env_int, env_ints, latency_summary, rate
+from tests.utils.es import (
+    CORPUS_MAPPINGS,
+    MsearchBatcher,
+    SearchTimings,
+    es_request,
+    index_actions,
+    make_corpus,
+    recreate_index,
+    stream_bulk,
+)
+
+INDEX = "bench_msearch"
+
+
+def _keystrokes(users: int, per_user: int, seed: int = 5) -> list[list[str]]:
+    """Per user, a sequence of growing prefixes of words seen in titles."""
+    rng = random.Random(seed)
+    words = [w for doc in make_corpus(2000) for w in doc["title"].split() if len(w) > 4]
+    out: list[list[str]] = []
+    for _ in range(users):
+        prefixes: list[str] = []
+        while len(prefixes) < per_user:
+            word = rng.choice(words)
+            prefixes += [word[:n] for n in range(2, len(word) + 1)]
+        out.append(prefixes[:per_user])
+    return out
+
+
+def _fanout(prefix: str, fanout: int) -> list[dict]:
+    return [
+        {
+            "size": 5,
+            "_source": ["id", "title"],
+            "query": {
+                "bool": {
+                    "must": [{"match_phrase_prefix": {"title": prefix}}],
+                    "filter": [{"term": {"category": f"cat-{i % 20}"}}],
+                }
+            },
+        }
+        for i in range(fanout)
+    ]
+
+
+async def _run_mode(
+    http: ClientSession,
+    keystrokes: list[list[str]],
+    fanout: int,
+    concurrency: int,
+    batch: int | None,
+) -> tuple[SearchTimings, list[float], float]:
+    keystroke_s: list[float] = []
+    if batch is None:
+        timings = SearchTimings()
+        slots = asyncio.Semaphore(concurrency)
+
+        async def search(body: dict) -> dict:
+            t0 = time.perf_counter()
+            async with slots:
+                resp = await es_request(http, "POST", f"{INDEX}/_search", body)
+            timings.requests += 1
+            timings.record(resp["took"], time.perf_counter() - t0)
+            return resp
+
+    else:
+        batcher = MsearchBatcher(http, max_batch=batch, concurrency=concurrency)
+        timings = batcher.timings
+
+        async def search(body: dict) -> dict:
+            return await batcher.search(INDEX, body)
+
+    async def user(prefixes: list[str]) -> None:
+        for prefix in prefixes:
+            t0 = time.perf_counter()
+            await asyncio.gather(*(search(b) for b in _fanout(prefix, fanout)))
+            keystroke_s.append(time.perf_counter() - t0)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(user(p) for p in keystrokes))
+    elapsed = time.perf_counter() - start
+    if batch is not None:
+        await batcher.aclose()
+    return timings, keystroke_s, elapsed
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(0)
+async def test_es_msearch_batching(bench_report) -> None:
+    docs = env_int("ES_MSEARCH_DOCS", 50_000)
+    per_user = env_int("ES_MSEARCH_KEYSTROKES", 200)
+    users = env_int("ES_MSEARCH_USERS", 4)
+    fanout = env_int("ES_MSEARCH_FANOUT", 24)
+    batches = env_ints("ES_MSEARCH_BATCHES", "8,32,96")
+    concurrency = env_int("ES_MSEARCH_CONCURRENCY", 4)
+
+    async with ClientSession(timeout=ClientTimeout(total=300)) as http:
+        try:
+            await es_request(http, "GET", "_cluster/health")
+        except aiohttp.ClientConnectionError as e:
+            pytest.skip(f"Elasticsearch not reachable: {e}")
+
+        await recreate_index(
+            http,
+            INDEX,
+            {
+                "settings": {"number_of_shards": 1, "number_of_replicas": 0},
+                "mappings": CORPUS_MAPPINGS,
+            },
+        )
+        load = await stream_bulk(
+            http, index_actions(INDEX, make_corpus(docs), id_field="id"), refresh="true"
+        )
+        assert load.docs == docs, f"seeded {load.docs}/{docs} docs"
+
+        keystrokes = _keystrokes(users, per_user)
+        total = users * per_user * fanout
+        report = bench_report("es_msearch")
+        report.note(
+            f"docs={docs} users={users} keystrokes={per_user} fanout={fanout} "
+            f"concurrency={concurrency}"
+        )
+        for batch in [None, *batches]:
+            timings, keystroke_s, elapsed = await _run_mode(
+                http, keystrokes, fanout, concurrency, batch
+            )
+            assert len(timings.client_ms) == total
+            ks = latency_summary(keystroke_s)
+            report.add(
+                mode="single" if batch is None else "msearch",
+                batch=batch or 1,
+                qps=rate(total, elapsed),
+                keystroke_p50_ms=ks["p50_ms"],
+                keystroke_p99_ms=ks["p99_ms"],
+                **timings.summary(),
+            )
+        await es_request(http, "DELETE", INDEX, ok=(404,))
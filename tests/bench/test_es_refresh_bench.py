@@ -0,0 +1,154 @@
+"""Elasticsearch refresh / segment tuning benchmark for write-then-read loads.
+
+For each index configuration a writer streams the synthetic corpus in small
+`_bulk` chunks as fast as it can, while probes measure write-to-searchable
+latency for a sample of chunks: the time from sending the chunk until a
+`_search` (not the realtime `_get`) returns its last document. Throughput and
+visibility are therefore measured under the same load. Refresh strategies:
+
+- `interval:<value>`: plain bulk; visibility comes from `refresh_interval`
+- `wait_for`: bulk with `refresh=wait_for` (`refresh_interval` 1s)
+- `explicit`: bulk followed by `POST _refresh` (`refresh_interval` -1)
+
+Each strategy is crossed with `number_of_shards` and
+`index.translog.durability` (`request` fsyncs every bulk, `async` every 5s).
+Segment count after the load is reported too.
+
+Knobs:
+
+- `ES_REFRESH_DOCS` (default 20000): docs written per configuration
+- `ES_REFRESH_CHUNK` (default 200): docs per `_bulk`
+- `ES_REFRESH_INTERVALS` (default `1s,5s,30s`)
+- `ES_REFRESH_MODES` (default `interval,wait_for,explicit`)
+- `ES_REFRESH_SHARDS` (default `1,3`)
+- `ES_REFRESH_DURABILITY` (default `request,async`)
+- `ES_REFRESH_PROBE_EVERY` (default 5): probe every n-th chunk
+"""
+
+import asyncio
+import itertools
+import time
+
+import aiohttp
+import pytest
+from aiohttp import ClientSession, ClientTimeout
+
+from tests.utils.bench import env_int, env_ints, env_list, latency_summary, rate
+from tests.utils.es import (
+    CORPUS_MAPPINGS,
+    base_url,
+    es_request,
+    index_actions,
+    make_corpus,
+    recreate_index,
+)
+from tests.utils.http import HttpError
+
+INDEX = "bench_refresh"
+PROBE_POLL_S = 0.01
+PROBE_TIMEOUT_S = 90.0
+
+
+def _strategies(modes: list[str], intervals: list[str]) -> list[tuple[str, str]]:
+    """(label, refresh_interval) pairs; wait_for needs a periodic refresh."""
+    out: list[tuple[str, str]] = []
+    for mode in modes:
+        if mode == "interval":
+            out += [(f"interval:{i}", i) for i in intervals]
+        elif mode == "wait_for":
+            out.append(("wait_for", "1s"))
+        elif mode == "explicit":
+            out.append(("explicit", "-1"))
+        else:
+            raise ValueError(f"unknown refresh mode: {mode}")
+    return out
+
+
+async def _probe(http: ClientSession, doc_id: int, sent_at: float) -> float:
+    body = {"size": 0, "query": {"term": {"id": doc_id}}, "track_total_hits": True}
+    deadline = sent_at + PROBE_TIMEOUT_S
+    while time.perf_counter() < deadline:
+        resp = await es_request(http, "POST", f"{INDEX}/_search", body)
+        if resp["hits"]["total"]["value"]:
+            return time.perf_counter() - sent_at
+        await asyncio.sleep(PROBE_POLL_S)
+    raise TimeoutError(f"doc {doc_id} not searchable after {PROBE_TIMEOUT_S}s")
+
+
+async def _run(
+    http: ClientSession, strategy: str, docs: int, chunk: int, probe_every: int
+) -> tuple[float, list[float]]:
+    params = {"refresh": "wait_for"} if strategy == "wait_for" else {}
+    headers = {"Content-Type": "application/x-ndjson"}
+    actions = index_actions(INDEX, make_corpus(docs), id_field="id")
+    probes: list[asyncio.Task] = []
+    start = time.perf_counter()
+    for n, lo in enumerate(range(0, docs, chunk)):
+        payload = b"".join(itertools.islice(actions, chunk))
+        sent_at = time.perf_counter()
+        async with http.post(
+            f"{base_url()}/_bulk", data=payload, headers=headers, params=params
+        ) as resp:
+            body = await resp.json(content_type=None)
+            if resp.status >= 300 or body.get("errors"):
+                raise HttpError(resp.status, str(body)[:500])
+        if strategy == "explicit":
+            await es_request(http, "POST", f"{INDEX}/_refresh")
+        if n % probe_every == 0:
+            last_id = min(lo + chunk, docs) - 1
+            probes.append(asyncio.create_task(_probe(http, last_id, sent_at)))
+    elapsed = time.perf_counter() - start
+    return elapsed, list(await asyncio.gather(*probes))
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(0)
+async def test_es_refresh_tradeoffs(bench_report) -> None:
+    docs = env_int("ES_REFRESH_DOCS", 20_000)
+    chunk = env_int("ES_REFRESH_CHUNK", 200)
+    strategies = _strategies(
+        env_list("ES_REFRESH_MODES", "interval,wait_for,explicit"),
+        env_list("ES_REFRESH_INTERVALS", "1s,5s,30s"),
+    )
+    shard_counts = env_ints("ES_REFRESH_SHARDS", "1,3")
+    durabilities = env_list("ES_REFRESH_DURABILITY", "request,async")
+    probe_every = env_int("ES_REFRESH_PROBE_EVERY", 5)
+
+    async with ClientSession(timeout=ClientTimeout(total=300)) as http:
+        try:
+            await es_request(http, "GET", "_cluster/health")
+        except aiohttp.ClientConnectionError as e:
+            pytest.skip(f"Elasticsearch not reachable: {e}")
+
+        report = bench_report("es_refresh")
+        report.note(f"docs={docs} chunk={chunk} probe_every={probe_every}")
+        for (strategy, interval), shards, durability in itertools.product(
+            strategies, shard_counts, durabilities
+        ):
+            await recreate_index(
+                http,
+                INDEX,
+                {
+                    "settings": {
+                        "number_of_shards": shards,
+                        "number_of_replicas": 0,
+                        "refresh_interval": interval,
+                        "index.translog.durability": durability,
+                    },
+                    "mappings": CORPUS_MAPPINGS,
+                },
+            )
+            elapsed, visible = await _run(http, strategy, docs, chunk, probe_every)
+            stats = await es_request(http, "GET", f"{INDEX}/_stats/segments")
+            lat = latency_summary(visible)
+            report.add(
+                strategy=strategy,
+                shards=shards,
+                durability=durability,
+                docs_s=rate(docs, elapsed),
+                visible_p50_ms=lat["p50_ms"],
+                visible_p95_ms=lat["p95_ms"],
+                visible_max_ms=lat["max_ms"],
+                segments=stats["_all"]["primaries"]["segments"]["count"],
+            )
+        await es_request(http, "DELETE", INDEX, ok=(404,))
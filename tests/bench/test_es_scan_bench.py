@@ -0,0 +1,155 @@
+"""Elasticsearch deep-scan benchmark: PIT + search_after vs from/size.
+
+Seeds an index with the synthetic corpus, then walks every document with:
+
+- `from_size`: naive `from`/`size` paging (the index's `max_result_window`
+  is raised so it can go deep; each page re-collects `from + size` hits)
+- `pit`: `pit_scan` with one slice, with and without next-page prefetch
+- `pit_sliced`: `pit_scan` split into parallel `slice`s
+
+A simulated per-page processing cost (`ES_SCAN_WORK_MS`) models a reindex or
+verification job, so prefetch has caller work to overlap with. Every mode must
+return each document exactly once.
+
+Knobs:
+
+- `ES_SCAN_DOCS` (default 200000)
+- `ES_SCAN_PAGE` (default 1000)
+- `ES_SCAN_SLICES` (default `2,4`)
+- `ES_SCAN_WORK_MS` (default 5)
+- `ES_SCAN_NAIVE_MAX` (default 50000): docs walked with from/size; its cost
+  grows with depth, so its docs/sec covers only this prefix
+"""
+
+import asyncio
+import time
+
+import aiohttp
+import pytest
+from aiohttp import ClientSession, ClientTimeout
+
+from tests.utils.bench import env_float, env_int, env_ints, latency_summary, rate
+from tests.utils.es import (
+    CORPUS_MAPPINGS,
+    es_request,
+    index_actions,
+    make_corpus,
+    pit_scan,
+    recreate_index,
+    stream_bulk,
+)
+
+INDEX = "bench_scan"
+
+
+async def _from_size(
+    http: ClientSession, page: int, limit: int, work_s: float
+) -> tuple[set[str], list[float]]:
+    seen: set[str] = set()
+    waits: list[float] = []
+    for offset in range(0, limit, page):
+        t0 = time.perf_counter()
+        resp = await es_request(
+            http,
+            "POST",
+            f"{INDEX}/_search",
+            {
+                "from": offset,
+                "size": min(page, limit - offset),
+                "sort": [{"id": "asc"}],
+                "track_total_hits": False,
+            },
+        )
+        waits.append(time.perf_counter() - t0)
+        hits = resp["hits"]["hits"]
+        if not hits:
+            break
+        seen.update(h["_id"] for h in hits)
+        await asyncio.sleep(work_s)
+    return seen, waits
+
+
+async def _pit(
+    http: ClientSession, page: int, slices: int, prefetch: bool, work_s: float
+) -> tuple[list[str], list[float]]:
+    ids: list[str] = []
+    waits: list[float] = []
+    t0 = time.perf_counter()
+    async for hits in pit_scan(
+        http, INDEX, size=page, slices=slices, prefetch=prefetch
+    ):
+        waits.append(time.perf_counter() - t0)
+        ids.extend(h["_id"] for h in hits)
+        await asyncio.sleep(work_s)
+        t0 = time.perf_counter()
+    return ids, waits
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(0)
+async def test_es_pit_scan_vs_from_size(bench_report) -> None:
+    docs = env_int("ES_SCAN_DOCS", 200_000)
+    page = env_int("ES_SCAN_PAGE", 1000)
+    slice_counts = env_ints("ES_SCAN_SLICES", "2,4")
+    work_s = env_float("ES_SCAN_WORK_MS", 5) / 1000
+    naive_max = min(docs, env_int("ES_SCAN_NAIVE_MAX", 50_000))
+
+    async with ClientSession(timeout=ClientTimeout(total=600)) as http:
+        try:
+            await es_request(http, "GET", "_cluster/health")
+        except aiohttp.ClientConnectionError as e:
+            pytest.skip(f"Elasticsearch not reachable: {e}")
+
+        await recreate_index(
+            http,
+            INDEX,
+            {
+                "settings": {
+                    "number_of_shards": 2,
+                    "number_of_replicas": 0,
+                    "max_result_window": naive_max + page,
+                },
+                "mappings": CORPUS_MAPPINGS,
+            },
+        )
+        load = await stream_bulk(
+            http, index_actions(INDEX, make_corpus(docs), id_field="id"), refresh="true"
+        )
+        assert load.docs == docs, f"seeded {load.docs}/{docs} docs: {load.errors[:1]}"
+
+        report = bench_report("es_scan")
+        report.note(f"docs={docs} page={page} work_ms={work_s * 1000:g}")
+
+        start = time.perf_counter()
+        seen, waits = await _from_size(http, page, naive_max, work_s)
+        elapsed = time.perf_counter() - start
+        assert len(seen) == naive_max
+        lat = latency_summary(waits)
+        report.add(
+            mode="from_size",
+            slices=1,
+            docs=naive_max,
+            docs_s=rate(naive_max, elapsed),
+            page_wait_p50_ms=lat["p50_ms"],
+            page_wait_max_ms=lat["max_ms"],
+        )
+
+        runs = [("pit", 1, False), ("pit_prefetch", 1, True)]
+        runs += [("pit_sliced", s, True) for s in slice_counts]
+        for mode, slices, prefetch in runs:
+            start = time.perf_counter()
+            ids, waits = await _pit(http, page, slices, prefetch, work_s)
+            elapsed = time.perf_counter() - start
+            assert len(ids) == docs and len(set(ids)) == docs, (
+                f"{mode}/{slices}: {len(ids)} hits, {len(set(ids))} unique"
+            )
+            lat = latency_summary(waits)
+            report.add(
+                mode=mode,
+                slices=slices,
+                docs=docs,
+                docs_s=rate(docs, elapsed),
+                page_wait_p50_ms=lat["p50_ms"],
+                page_wait_max_ms=lat["max_ms"],
+            )
+        await es_request(http, "DELETE", INDEX, ok=(404,))
@@ -0,0 +1,86 @@
+"""Elasticsearch fixture reset: snapshot restore vs re-ingesting the corpus.
+
+For each corpus size, seeds an index once with `stream_bulk`, snapshots it to
+the filesystem repository (`path.repo` in compose) and then times
+`ES_SNAPSHOT_REPEATS` resets each way:
+
+- `reingest`: recreate the index and bulk-load the corpus again
+- `restore`: delete the index and restore it from the snapshot
+  (`wait_for_completion`, no health polling)
+
+Knobs:
+
+- `ES_SNAPSHOT_DOCS` (default `10000,100000`)
+- `ES_SNAPSHOT_REPEATS` (default 3)
+"""
+
+import time
+
+import aiohttp
+import pytest
+from aiohttp import ClientSession, ClientTimeout
+
+from tests.utils.bench import env_int, env_ints, latency_summary
+from tests.utils.es import (
+    SNAPSHOT_REPO,
+    create_snapshot,
+    ensure_fs_repository,
+    es_request,
+    restore_snapshot,
+    seed_corpus,
+)
+from tests.utils.http import HttpError
+
+INDEX = "bench_snapshot"
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(0)
+async def test_es_snapshot_restore_vs_reingest(bench_report) -> None:
+    sizes = env_ints("ES_SNAPSHOT_DOCS", "10000,100000")
+    repeats = env_int("ES_SNAPSHOT_REPEATS", 3)
+
+    async with ClientSession(timeout=ClientTimeout(total=900)) as http:
+        try:
+            await ensure_fs_repository(http)
+        except aiohttp.ClientConnectionError as e:
+            pytest.skip(f"Elasticsearch not reachable: {e}")
+        except HttpError as e:
+            pytest.skip(f"snapshot repository unavailable (path.repo set?): {e}")
+
+        report = bench_report("es_snapshot")
+        for docs in sizes:
+            snapshot = f"bench-{docs}"
+            await seed_corpus(http, INDEX, docs)
+            start = time.perf_counter()
+            await create_snapshot(http, snapshot, [INDEX])
+            report.note(
+                f"docs={docs}: snapshot took {time.perf_counter() - start:.2f}s"
+            )
+
+            timings: dict[str, list[float]] = {"reingest": [], "restore": []}
+            for _ in range(repeats):
+                start = time.perf_counter()
+                await seed_corpus(http, INDEX, docs)
+                timings["reingest"].append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                await restore_snapshot(http, snapshot, [INDEX])
+                timings["restore"].append(time.perf_counter() - start)
+                count = await es_request(http, "GET", f"{INDEX}/_count")
+                assert count["count"] == docs, f"restored {count['count']}/{docs}"
+
+            base = latency_summary(timings["reingest"])["p50_ms"]
+            for mode, samples in timings.items():
+                lat = latency_summary(samples)
+                report.add(
+                    docs=docs,
+                    mode=mode,
+                    p50_ms=lat["p50_ms"],
+                    max_ms=lat["max_ms"],
+                    speedup=round(base / lat["p50_ms"], 2) if lat["p50_ms"] else 0.0,
+                )
+            await es_request(
+                http, "DELETE", f"_snapshot/{SNAPSHOT_REPO}/{snapshot}", ok=(404,)
+            )
+        await es_request(http, "DELETE", INDEX, ok=(404,))
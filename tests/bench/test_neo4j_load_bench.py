@@ -0,0 +1,108 @@
+"""Neo4j bulk load benchmark: UNWIND-batched MERGE over Bolt.
+
+Generates a social graph with NumPy (`Person` nodes and `KNOWS` edges with a
+fixed out-degree) and streams it through `tests.utils.neo4j_graph` for every
+(batch size, concurrency) combination, reporting nodes/sec and rels/sec. After
+the last load, 2-hop traversal latency is sampled over the resulting graph.
+
+Knobs:
+
+- `NEO4J_LOAD_NODES` (default 100000; use 1000000 for traversal testing)
+- `NEO4J_LOAD_DEGREE` (default 5): outgoing `KNOWS` per node
+- `NEO4J_LOAD_BATCHES` (default `1000,10000`): rows per `UNWIND $rows`
+- `NEO4J_LOAD_CONCURRENCY` (default `1,4`): parallel writer sessions
+- `NEO4J_LOAD_TRAVERSALS` (default 200)
+"""
+
+import time
+from typing import Iterator
+
+import numpy as np
+import pytest
+from neo4j.exceptions import ServiceUnavailable
+
+from tests.utils.bench import env_int, env_ints, latency_summary
+from tests.utils.neo4j_graph import delete_label, driver, load_nodes, load_rels
+
+LABEL = "Person"
+KEY = "id"
+
+
+def people(n: int) -> Iterator[dict]:
+    for i in range(n):
+        yield {"id": i, "name": f"person-{i}", "age": 18 + i % 60}
+
+
+def knows(n: int, degree: int, seed: int = 11) -> Iterator[dict]:
+    """`degree` random targets per node (self-loops skipped), block by block."""
+    rng = np.random.default_rng(seed)
+    block = 50_000
+    for lo in range(0, n, block):
+        src = np.repeat(np.arange(lo, min(lo + block, n)), degree)
+        dst = rng.integers(0, n, size=len(src))
+        since = rng.integers(2000, 2026, size=len(src))
+        for s, d, y in zip(src.tolist(), dst.tolist(), since.tolist()):
+            if s != d:
+                yield {"src": s, "dst": d, "props": {"since": y}}
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(0)
+async def test_neo4j_unwind_bulk_load(bench_report) -> None:
+    nodes = env_int("NEO4J_LOAD_NODES", 100_000)
+    degree = env_int("NEO4J_LOAD_DEGREE", 5)
+    batches = env_ints("NEO4J_LOAD_BATCHES", "1000,10000")
+    concurrencies = env_ints("NEO4J_LOAD_CONCURRENCY", "1,4")
+    traversals = env_int("NEO4J_LOAD_TRAVERSALS", 200)
+
+    drv = driver()
+    try:
+        await drv.verify_connectivity()
+    except (OSError, ServiceUnavailable) as e:
+        await drv.close()
+        pytest.skip(f"Neo4j not reachable: {e}")
+
+    report = bench_report("neo4j_bulk_load")
+    report.note(f"nodes={nodes} degree={degree}")
+    try:
+        for batch in batches:
+            for concurrency in concurrencies:
+                await delete_label(drv, LABEL)
+                n = await load_nodes(drv, LABEL, KEY, people(nodes), batch, concurrency)
+                r = await load_rels(
+                    drv,
+                    LABEL,
+                    LABEL,
+                    "KNOWS",
+                    KEY,
+                    knows(nodes, degree),
+                    batch,
+                    concurrency,
+                )
+                assert n.items == nodes and n.created == nodes
+                report.add(**n.summary())
+                report.add(**r.summary())
+
+        records, _, _ = await drv.execute_query(
+            f"MATCH (n:{LABEL}) RETURN count(n) AS c"
+        )
+        assert records[0]["c"] == nodes
+
+        starts = np.random.default_rng(3).integers(0, nodes, size=traversals)
+        samples: list[float] = []
+        for start_id in starts.tolist():
+            t0 = time.perf_counter()
+            await drv.execute_query(
+                f"MATCH (:{LABEL} {{{KEY}: $id}})-[:KNOWS*2]->(f) "
+                "RETURN count(DISTINCT f) AS c",
+                id=start_id,
+            )
+            samples.append(time.perf_counter() - t0)
+        lat = latency_summary(samples)
+        report.note(
+            f"2-hop traversal over {traversals} starts: "
+            f"p50={lat['p50_ms']}ms p99={lat['p99_ms']}ms"
+        )
+        await delete_label(drv, LABEL)
+    finally:
+        await drv.close()
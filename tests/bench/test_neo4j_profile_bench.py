@@ -0,0 +1,66 @@
+"""Cypher workload profiling: PROFILE plans with and without declared schema.
+
+Runs a workload file (see `tests.utils.cypher_profile`) against the Neo4j
+service: every query is profiled and timed with the workload's indexes and
+constraints dropped, then again with them created. The report has one row
+per query (median latency, speedup, db hits, whether the operator tree
+changed). The operator trees and their unified diff are attached as
+artifacts and written as `neo4j_profile.<workload>.*.txt` under
+`BENCH_OUTPUT_DIR`, so plans can be diffed across runs.
+
+Knobs:
+
+- `NEO4J_PROFILE_WORKLOAD` (default `tests/bench/workloads/neo4j_social.yaml`)
+- `NEO4J_PROFILE_REPEATS` (default 5): timed runs per query and phase
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+from neo4j.exceptions import ServiceUnavailable
+
+from tests.utils.bench import env_int
+from tests.utils.cypher_profile import (
+    compare,
+    load_workload,
+    render_plan_diff,
+    render_profiles,
+    run_workload,
+)
+from tests.utils.neo4j_graph import driver
+
+DEFAULT_WORKLOAD = Path(__file__).parent / "workloads" / "neo4j_social.yaml"
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(0)
+async def test_cypher_workload_profile(bench_report) -> None:
+    workload = load_workload(
+        Path(os.environ.get("NEO4J_PROFILE_WORKLOAD", DEFAULT_WORKLOAD))
+    )
+    repeats = env_int("NEO4J_PROFILE_REPEATS", 5)
+
+    drv = driver()
+    try:
+        await drv.verify_connectivity()
+    except (OSError, ServiceUnavailable) as e:
+        await drv.close()
+        pytest.skip(f"Neo4j not reachable: {e}")
+
+    try:
+        profiles = await run_workload(drv, workload, repeats)
+    finally:
+        await drv.close()
+
+    report = bench_report("neo4j_profile")
+    report.note(f"workload={workload.name} schema={len(workload.schema)} statements")
+    for row in compare(profiles["without"], profiles["with"]):
+        report.add(**row)
+    report.attach(f"{workload.name}.without", render_profiles(profiles["without"]))
+    report.attach(f"{workload.name}.with", render_profiles(profiles["with"]))
+    report.attach(
+        f"{workload.name}.diff",
+        render_plan_diff(profiles["without"], profiles["with"]),
+    )
+    assert len(report.rows) == len(workload.queries)
@@ -0,0 +1,124 @@
+"""Neo4j vector index benchmark: QPS, latency and recall@k.
+
+Loads the shared embedding dataset (`tests.utils.vectors`, configured by
+`VEC_*`) as `VecItem.embedding` node properties, builds a cosine vector index
+and runs `db.index.vector.queryNodes` in batches (one `UNWIND` round trip per
+batch). Recall@k is measured against exact NumPy ground truth, so numbers line
+up with the Qdrant benchmarks on the same dataset.
+
+Knobs:
+
+- `NEO4J_VEC_K` (default 10)
+- `NEO4J_VEC_BATCHES` (default `1,16,64`): queries per round trip
+- `NEO4J_VEC_CONCURRENCY` (default `1,4`): parallel query sessions
+"""
+
+import asyncio
+import time
+
+import pytest
+from neo4j import AsyncDriver
+from neo4j.exceptions import ServiceUnavailable
+
+from tests.utils.bench import env_int, env_ints, latency_summary, rate
+from tests.utils.neo4j_graph import delete_label, driver, load_nodes
+from tests.utils.vectors import dataset_from_env, ground_truth, recall_at_k
+
+LABEL = "VecItem"
+INDEX = "vec_item_embedding"
+QUERY = (
+    "UNWIND range(0, size($vecs) - 1) AS qi "
+    "CALL db.index.vector.queryNodes($index, $k, $vecs[qi]) YIELD node, score "
+    "WITH qi, node ORDER BY qi, score DESC "
+    "RETURN qi, collect(node.id) AS ids"
+)
+
+
+async def _search(
+    drv: AsyncDriver, queries: list[list[float]], k: int, batch: int, concurrency: int
+) -> tuple[list[list[int]], list[float], float]:
+    found: list[list[int]] = [[] for _ in queries]
+    samples: list[float] = []
+    starts = iter(range(0, len(queries), batch))
+
+    async def worker() -> None:
+        async with drv.session() as session:
+            for lo in starts:
+                t0 = time.perf_counter()
+                result = await session.run(
+                    QUERY, vecs=queries[lo : lo + batch], index=INDEX, k=k
+                )
+                async for record in result:
+                    found[lo + record["qi"]] = record["ids"]
+                samples.append(time.perf_counter() - t0)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return found, samples, time.perf_counter() - start
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(0)
+async def test_neo4j_vector_index_recall_and_qps(bench_report) -> None:
+    k = env_int("NEO4J_VEC_K", 10)
+    batches = env_ints("NEO4J_VEC_BATCHES", "1,16,64")
+    concurrencies = env_ints("NEO4J_VEC_CONCURRENCY", "1,4")
+    data = dataset_from_env()
+    truth = ground_truth(data.vectors, data.queries, k)
+    queries = data.queries.tolist()
+
+    drv = driver()
+    try:
+        await drv.verify_connectivity()
+    except (OSError, ServiceUnavailable) as e:
+        await drv.close()
+        pytest.skip(f"Neo4j not reachable: {e}")
+
+    report = bench_report("neo4j_vector")
+    try:
+        await drv.execute_query(f"DROP INDEX {INDEX} IF EXISTS")
+        await delete_label(drv, LABEL)
+        load = await load_nodes(
+            drv,
+            LABEL,
+            "id",
+            ({"id": i, "embedding": v} for i, v in enumerate(data.vectors.tolist())),
+            batch_size=2000,
+        )
+        start = time.perf_counter()
+        await drv.execute_query(
+            f"CREATE VECTOR INDEX {INDEX} IF NOT EXISTS "
+            f"FOR (n:{LABEL}) ON n.embedding OPTIONS {{indexConfig: {{"
+            f"`vector.dimensions`: {data.dim}, "
+            "`vector.similarity_function`: 'cosine'}}"
+        )
+        await drv.execute_query("CALL db.awaitIndexes(1800)")
+        build_s = time.perf_counter() - start
+        report.note(
+            f"vectors={len(data.vectors)} dim={data.dim} queries={len(queries)} "
+            f"k={k} load={rate(load.items, load.seconds)} nodes/s "
+            f"index_build={build_s:.2f}s"
+        )
+
+        for batch in batches:
+            for concurrency in concurrencies:
+                found, samples, elapsed = await _search(
+                    drv, queries, k, batch, concurrency
+                )
+                lat = latency_summary(samples)
+                report.add(
+                    batch=batch,
+                    concurrency=concurrency,
+                    qps=rate(len(queries), elapsed),
+                    batch_p50_ms=lat["p50_ms"],
+                    batch_p99_ms=lat["p99_ms"],
+                    recall=recall_at_k(found, truth, k),
+                )
+        await drv.execute_query(f"DROP INDEX {INDEX} IF EXISTS")
+        await delete_label(drv, LABEL)
+    finally:
+        await drv.close()
+
+    assert all(row["recall"] > 0 for row in report.rows), (
+        "vector search returned nothing"
+    )
@@ -0,0 +1,81 @@
+"""pgAdapter read-write contention benchmark (Spanner lock-and-abort).
+
+Drives concurrent read-modify-write transactions straight at pgAdapter
+(`localhost:55432`) with asyncpg over configurable hot-key distributions,
+retries aborted transactions (SQLSTATE 40001) and reports commits/sec, abort
+rate and retry latency.
+
+The Spanner emulator serializes read-write transactions, so absolute abort
+rates are higher than on a real instance; use the curves to compare key
+distributions and retry policies, not to size production.
+
+Knobs:
+
+- `PGA_LOAD_WORKERS` (default `1,4,16`)
+- `PGA_LOAD_DISTRIBUTIONS` (default `uniform,zipf,hotspot`)
+- `PGA_LOAD_KEYS` (default 1000): rows in the accounts table
+- `PGA_LOAD_TXNS` (default 500): transactions per run
+- `PGA_LOAD_MAX_ATTEMPTS` (default 10)
+"""
+
+import itertools
+
+import pytest
+
+from tests.utils.bench import env_int, env_ints, env_list
+from tests.utils.pgadapter import (
+    connect,
+    create_pool,
+    key_sampler,
+    run_contention,
+    seed_accounts,
+)
+
+TABLE = "load_accounts"
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(0)
+async def test_pgadapter_contention_abort_rate(bench_report) -> None:
+    workers = env_ints("PGA_LOAD_WORKERS", "1,4,16")
+    distributions = env_list("PGA_LOAD_DISTRIBUTIONS", "uniform,zipf,hotspot")
+    keys = env_int("PGA_LOAD_KEYS", 1000)
+    txns = env_int("PGA_LOAD_TXNS", 500)
+    max_attempts = env_int("PGA_LOAD_MAX_ATTEMPTS", 10)
+
+    try:
+        conn = await connect()
+    except OSError as e:
+        pytest.skip(f"pgAdapter not reachable: {e}")
+    try:
+        await seed_accounts(conn, TABLE, keys)
+    finally:
+        await conn.close()
+
+    report = bench_report("pgadapter_contention")
+    report.note(f"keys={keys} txns={txns} max_attempts={max_attempts}")
+    for n_workers, dist in itertools.product(workers, distributions):
+        pool = await create_pool(n_workers)
+        try:
+            result = await run_contention(
+                pool,
+                TABLE,
+                workers=n_workers,
+                transactions=txns,
+                sampler=key_sampler(dist, keys),
+                distribution=dist,
+                max_attempts=max_attempts,
+            )
+        finally:
+            await pool.close()
+        report.add(**result.summary())
+        assert result.commits + result.failures == txns
+
+    conn = await connect()
+    try:
+        # Transfers are zero-sum, so committed work must net out.
+        total = await conn.fetchval(f"SELECT sum(balance) FROM {TABLE}")
+        assert total == 0, f"lost update detected: sum(balance)={total}"
+        await conn.execute(f"DROP TABLE IF EXISTS {TABLE}")
+    finally:
+        await conn.close()
@@ -0,0 +1,98 @@
+"""pgAdapter bulk-load benchmark: COPY FROM STDIN vs batched INSERT.
+
+Loads generated rows into Spanner through pgAdapter along three paths and
+reports rows/sec for each:
+
+- `insert_batches`: multi-row `INSERT ... VALUES` statements (baseline)
+- `atomic`: `COPY ... FROM STDIN` split client-side into commits that fit
+  Spanner's 80k-mutation limit
+- `partitioned`: one streaming COPY under
+  `spanner.autocommit_dml_mode = 'partitioned_non_atomic'`
+
+Knobs:
+
+- `PGA_COPY_ROWS` (default 100000)
+- `PGA_COPY_INSERT_BATCH` (default 500): rows per INSERT statement
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Iterator
+
+import pytest
+
+from tests.utils.bench import env_int, rate
+from tests.utils.pgadapter import connect, copy_rows, rows_per_commit
+
+TABLE = "copy_bench"
+COLUMNS = ["id", "name", "score", "created_at"]
+EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def generate_rows(start: int, count: int) -> Iterator[tuple]:
+    for i in range(start, start + count):
+        yield (
+            i,
+            f"item-{i}",
+            (i * 37 % 1000) / 10.0,
+            (EPOCH + timedelta(seconds=i)).isoformat(),
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(0)
+async def test_pgadapter_bulk_load_paths(bench_report) -> None:
+    rows = env_int("PGA_COPY_ROWS", 100_000)
+    insert_batch = env_int("PGA_COPY_INSERT_BATCH", 500)
+
+    try:
+        conn = await connect()
+    except OSError as e:
+        pytest.skip(f"pgAdapter not reachable: {e}")
+
+    report = bench_report("pgadapter_copy")
+    report.note(f"atomic rows/commit={rows_per_commit(len(COLUMNS))}")
+    try:
+        await conn.execute(f"DROP TABLE IF EXISTS {TABLE}")
+        await conn.execute(
+            f"CREATE TABLE {TABLE} (id BIGINT PRIMARY KEY, name VARCHAR(64), "
+            "score DOUBLE PRECISION, created_at TIMESTAMPTZ)"
+        )
+        offset = 0
+
+        start = time.perf_counter()
+        batch: list[str] = []
+        for row in generate_rows(offset, rows):
+            batch.append(f"({row[0]}, '{row[1]}', {row[2]}, '{row[3]}')")
+            if len(batch) == insert_batch:
+                await conn.execute(
+                    f"INSERT INTO {TABLE} ({', '.join(COLUMNS)}) VALUES {', '.join(batch)}"
+                )
+                batch.clear()
+        if batch:
+            await conn.execute(
+                f"INSERT INTO {TABLE} ({', '.join(COLUMNS)}) VALUES {', '.join(batch)}"
+            )
+        seconds = time.perf_counter() - start
+        report.add(
+            mode="insert_batches",
+            rows=rows,
+            chunks=-(-rows // insert_batch),
+            seconds=round(seconds, 3),
+            rows_s=rate(rows, seconds),
+        )
+        offset += rows
+
+        for mode in ("atomic", "partitioned"):
+            result = await copy_rows(
+                conn, TABLE, COLUMNS, generate_rows(offset, rows), mode=mode
+            )
+            report.add(**result.summary())
+            assert result.rows == rows
+            offset += rows
+
+        loaded = await conn.fetchval(f"SELECT count(*) FROM {TABLE}")
+        assert loaded == offset, f"expected {offset} rows, found {loaded}"
+        await conn.execute(f"DROP TABLE IF EXISTS {TABLE}")
+    finally:
+        await conn.close()
@@ -0,0 +1,134 @@
+"""pgAdapter protocol-mode benchmark: simple vs extended vs batched DML.
+
+Each unit of work writes `batch` rows inside one transaction using:
+
+- `simple`: one simple-query `INSERT` (literal values) per row
+- `prepared`: one extended-protocol execution of a prepared `INSERT` per row
+- `pipelined`: asyncpg `executemany`, which pipelines Bind/Execute messages
+  and syncs once per batch
+- `batch_dml`: pgAdapter's `START BATCH DML` ... `RUN BATCH`, which buffers
+  the statements client-side and sends them to Spanner as one `ExecuteBatchDml`
+
+Reads compare `read_simple` and `read_prepared` point lookups. Latency is per
+unit (one batch, or one read), throughput is rows/sec.
+
+Knobs:
+
+- `PGA_PROTO_BATCHES` (default `1,10,100`)
+- `PGA_PROTO_ROWS` (default 1000): rows written per (mode, batch size)
+- `PGA_PROTO_READS` (default 500)
+"""
+
+import time
+
+import asyncpg
+import pytest
+
+from tests.utils.bench import env_int, env_ints, latency_summary, rate
+from tests.utils.pgadapter import connect
+
+TABLE = "proto_bench"
+INSERT = f"INSERT INTO {TABLE} (id, name) VALUES ($1, $2)"
+
+
+def _literal_insert(i: int) -> str:
+    return f"INSERT INTO {TABLE} (id, name) VALUES ({i}, 'row-{i}')"
+
+
+async def _write_unit(
+    conn: asyncpg.Connection,
+    mode: str,
+    ids: range,
+    stmt: asyncpg.prepared_stmt.PreparedStatement,
+) -> None:
+    if mode == "batch_dml":
+        await conn.execute("START BATCH DML")
+        for i in ids:
+            await conn.execute(_literal_insert(i))
+        await conn.execute("RUN BATCH")
+        return
+    async with conn.transaction():
+        if mode == "simple":
+            for i in ids:
+                await conn.execute(_literal_insert(i))
+        elif mode == "prepared":
+            for i in ids:
+                await stmt.fetch(i, f"row-{i}")
+        elif mode == "pipelined":
+            await conn.executemany(INSERT, [(i, f"row-{i}") for i in ids])
+        else:
+            raise ValueError(f"unknown mode: {mode}")
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(0)
+async def test_pgadapter_protocol_modes(bench_report) -> None:
+    batches = env_ints("PGA_PROTO_BATCHES", "1,10,100")
+    rows = env_int("PGA_PROTO_ROWS", 1000)
+    reads = env_int("PGA_PROTO_READS", 500)
+
+    try:
+        conn = await connect()
+    except OSError as e:
+        pytest.skip(f"pgAdapter not reachable: {e}")
+
+    report = bench_report("pgadapter_protocol")
+    try:
+        await conn.execute(f"DROP TABLE IF EXISTS {TABLE}")
+        await conn.execute(
+            f"CREATE TABLE {TABLE} (id BIGINT PRIMARY KEY, name VARCHAR(64))"
+        )
+        stmt = await conn.prepare(INSERT)
+        next_id = 0
+        for batch in batches:
+            for mode in ("simple", "prepared", "pipelined", "batch_dml"):
+                samples: list[float] = []
+                start = time.perf_counter()
+                for lo in range(next_id, next_id + rows, batch):
+                    ids = range(lo, min(lo + batch, next_id + rows))
+                    t0 = time.perf_counter()
+                    await _write_unit(conn, mode, ids, stmt)
+                    samples.append(time.perf_counter() - t0)
+                elapsed = time.perf_counter() - start
+                next_id += rows
+                lat = latency_summary(samples)
+                report.add(
+                    mode=mode,
+                    batch=batch,
+                    rows=rows,
+                    rows_s=rate(rows, elapsed),
+                    unit_p50_ms=lat["p50_ms"],
+                    unit_p99_ms=lat["p99_ms"],
+                )
+
+        written = await conn.fetchval(f"SELECT count(*) FROM {TABLE}")
+        assert written == next_id, f"expected {next_id} rows, found {written}"
+
+        select = f"SELECT name FROM {TABLE} WHERE id = $1"
+        prepared_select = await conn.prepare(select)
+        for mode in ("read_simple", "read_prepared"):
+            samples = []
+            start = time.perf_counter()
+            for n in range(reads):
+                key = (n * 7919) % next_id
+                t0 = time.perf_counter()
+                if mode == "read_simple":
+                    # execute() without args uses the simple-query protocol
+                    # (rows are read off the wire but not returned).
+                    await conn.execute(f"SELECT name FROM {TABLE} WHERE id = {key}")
+                else:
+                    await prepared_select.fetchval(key)
+                samples.append(time.perf_counter() - t0)
+            elapsed = time.perf_counter() - start
+            lat = latency_summary(samples)
+            report.add(
+                mode=mode,
+                batch=1,
+                rows=reads,
+                rows_s=rate(reads, elapsed),
+                unit_p50_ms=lat["p50_ms"],
+                unit_p99_ms=lat["p99_ms"],
+            )
+        await conn.execute(f"DROP TABLE IF EXISTS {TABLE}")
+    finally:
+        await conn.close()
@@ -0,0 +1,186 @@
+"""PostGIS spatial index benchmark (GiST vs SP-GiST vs BRIN).
+
+Generates point, line and polygon datasets with NumPy (a mix of uniform
+background and Gaussian city clusters in a 100 km EPSG:3857 square), loads
+them into `postgres-18` and, for each index type, reports build time, index
+size and latency for:
+
+- `dwithin`: `ST_DWithin(geom, point, radius)`
+- `bbox`: `geom && ST_MakeEnvelope(...)`
+- `knn`: `ORDER BY geom <-> point LIMIT 10` (BRIN cannot order; reported n/a)
+
+Rows are stored in grid-cell order so BRIN sees the physical locality it
+depends on. Knobs:
+
+- `PG_GEO_SIZES` (default `10000,100000,1000000`): rows per dataset
+- `PG_GEO_KINDS` (default `point,line,polygon`)
+- `PG_GEO_INDEXES` (default `gist,spgist,brin`)
+- `PG_GEO_QUERIES` (default 200): queries per (index, query type)
+- `PG_GEO_RADIUS` (default 250): `ST_DWithin` radius / half bbox side, metres
+"""
+
+import time
+
+import asyncpg
+import numpy as np
+import pytest
+
+from tests.utils.bench import env_float, env_int, env_ints, env_list, latency_summary
+from tests.utils.postgres import connect, explain_analyze, plan_node_types
+
+EXTENT = 100_000.0  # metres
+SRID = 3857
+KNN_K = 10
+QUERIES = {
+    "dwithin": (
+        "SELECT count(*) FROM {table} "
+        f"WHERE ST_DWithin(geom, ST_SetSRID(ST_MakePoint($1, $2), {SRID}), $3)"
+    ),
+    "bbox": (
+        "SELECT count(*) FROM {table} WHERE geom && ST_MakeEnvelope("
+        "$1::float8 - $3::float8, $2::float8 - $3::float8, "
+        f"$1::float8 + $3::float8, $2::float8 + $3::float8, {SRID})"
+    ),
+    "knn": (
+        "SELECT id FROM {table} "
+        f"ORDER BY geom <-> ST_SetSRID(ST_MakePoint($1, $2), {SRID}) LIMIT {KNN_K}"
+    ),
+}
+
+
+def _centers(rng: np.random.Generator, n: int) -> np.ndarray:
+    """70% of rows around a few Gaussian clusters, 30% uniform background."""
+    clustered = int(n * 0.7)
+    hubs = rng.uniform(0.1 * EXTENT, 0.9 * EXTENT, size=(12, 2))
+    which = rng.integers(0, len(hubs), size=clustered)
+    pts = hubs[which] + rng.normal(0, EXTENT * 0.03, size=(clustered, 2))
+    background = rng.uniform(0, EXTENT, size=(n - clustered, 2))
+    return np.clip(np.vstack([pts, background]), 0, EXTENT)
+
+
+def _grid_order(xy: np.ndarray, cells: int = 256) -> np.ndarray:
+    cell = np.floor(xy / EXTENT * (cells - 1)).astype(np.int64)
+    return np.lexsort((cell[:, 0], cell[:, 1]))
+
+
+def generate_wkt(kind: str, n: int, seed: int = 7) -> list[str]:
+    """Return `n` WKT geometries of `kind`, in grid-cell order."""
+    rng = np.random.default_rng(seed)
+    xy = _centers(rng, n)
+    xy = xy[_grid_order(xy)]
+    if kind == "point":
+        return [f"POINT({x:.2f} {y:.2f})" for x, y in xy]
+    if kind == "line":
+        # 4-vertex random walks with ~50 m steps
+        steps = rng.normal(0, 50, size=(n, 3, 2)).cumsum(axis=1)
+        verts = np.concatenate([xy[:, None, :], xy[:, None, :] + steps], axis=1)
+        return [
+            "LINESTRING(" + ", ".join(f"{x:.2f} {y:.2f}" for x, y in v) + ")"
+            for v in verts
+        ]
+    if kind == "polygon":
+        # Irregular hexagons, 20-120 m radius (building/parcel sized)
+        angles = np.linspace(0, 2 * np.pi, 7)[:-1]
+        radii = rng.uniform(20, 120, size=(n, 1)) * rng.uniform(0.7, 1.0, size=(n, 6))
+        vx = xy[:, 0:1] + radii * np.cos(angles)
+        vy = xy[:, 1:2] + radii * np.sin(angles)
+        out = []
+        for rx, ry in zip(vx, vy):
+            ring = ", ".join(f"{x:.2f} {y:.2f}" for x, y in zip(rx, ry))
+            out.append(f"POLYGON(({ring}, {rx[0]:.2f} {ry[0]:.2f}))")
+        return out
+    raise ValueError(f"unknown geometry kind: {kind}")
+
+
+async def _load(conn: asyncpg.Connection, table: str, wkt: list[str]) -> None:
+    await conn.execute(f"DROP TABLE IF EXISTS {table}, {table}_stage;")
+    await conn.execute(f"CREATE UNLOGGED TABLE {table}_stage (id int, wkt text);")
+    await conn.copy_records_to_table(
+        f"{table}_stage", records=enumerate(wkt), columns=["id", "wkt"]
+    )
+    await conn.execute(
+        f"CREATE TABLE {table} AS "
+        f"SELECT id, ST_GeomFromText(wkt, {SRID}) AS geom "
+        f"FROM {table}_stage ORDER BY id;"
+    )
+    await conn.execute(f"DROP TABLE {table}_stage;")
+
+
+async def _run_queries(
+    conn: asyncpg.Connection, sql: str, probes: np.ndarray, radius: float
+) -> tuple[dict[str, float], bool]:
+    params = [
+        (float(x), float(y)) if "<->" in sql else (float(x), float(y), radius)
+        for x, y in probes
+    ]
+    first = (await explain_analyze(conn, sql, *params[0]))["Plan"]
+    used_index = any("Index" in node for node in plan_node_types(first))
+    samples: list[float] = []
+    for args in params:
+        start = time.perf_counter()
+        await conn.fetch(sql, *args)
+        samples.append(time.perf_counter() - start)
+    return latency_summary(samples), used_index
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(0)
+async def test_postgis_spatial_index_comparison(bench_report) -> None:
+    sizes = env_ints("PG_GEO_SIZES", "10000,100000,1000000")
+    kinds = env_list("PG_GEO_KINDS", "point,line,polygon")
+    indexes = env_list("PG_GEO_INDEXES", "gist,spgist,brin")
+    n_queries = env_int("PG_GEO_QUERIES", 200)
+    radius = env_float("PG_GEO_RADIUS", 250.0)
+
+    probes = _centers(np.random.default_rng(99), n_queries)
+    report = bench_report("postgis_index")
+    report.note(f"extent={EXTENT:.0f}m srid={SRID} radius={radius}m k={KNN_K}")
+
+    conn = await connect()
+    try:
+        try:
+            await conn.execute("CREATE EXTENSION IF NOT EXISTS postgis;")
+        except asyncpg.PostgresError as e:
+            pytest.skip(f"postgis not available: {e}")
+        for kind, size in ((k, s) for k in kinds for s in sizes):
+            table = f"geo_bench_{kind}"
+            await _load(conn, table, generate_wkt(kind, size))
+            for method in indexes:
+                idx = f"{table}_{method}_idx"
+                start = time.perf_counter()
+                await conn.execute(
+                    f"CREATE INDEX {idx} ON {table} USING {method} (geom);"
+                )
+                build_s = time.perf_counter() - start
+                await conn.execute(f"ANALYZE {table};")
+                idx_mb = await conn.fetchval(
+                    f"SELECT pg_relation_size('{idx}') / 1048576.0;"
+                )
+                for qname, template in QUERIES.items():
+                    row = {
+                        "kind": kind,
+                        "rows": size,
+                        "index": method,
+                        "build_s": round(build_s, 3),
+                        "index_mb": round(float(idx_mb), 2),
+                        "query": qname,
+                    }
+                    if qname == "knn" and method == "brin":
+                        report.add(**row, used_index="n/a")
+                        continue
+                    latency, used = await _run_queries(
+                        conn, template.format(table=table), probes, radius
+                    )
+                    report.add(
+                        **row,
+                        used_index=used,
+                        p50_ms=latency["p50_ms"],
+                        p95_ms=latency["p95_ms"],
+                        p99_ms=latency["p99_ms"],
+                    )
+                await conn.execute(f"DROP INDEX {idx};")
+            await conn.execute(f"DROP TABLE {table};")
+    finally:
+        await conn.close()
+
+    assert report.rows, "no dataset produced results"
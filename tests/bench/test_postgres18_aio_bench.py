@@ -0,0 +1,237 @@
+"""PostgreSQL 18 asynchronous I/O profiling (`io_method` sweep).
+
+Restarts `postgres-18` under each combination of `io_method`, `io_workers`
+and `effective_io_concurrency`, then measures cold-cache read throughput for:
+
+- sequential scan (`count(*)` over the whole table)
+- bitmap heap scan (random 0.5% of rows through a secondary index)
+- `VACUUM (DISABLE_PAGE_SKIPPING)` (reads every heap page)
+
+Settings are applied with `ALTER SYSTEM` and reset afterwards. A server that
+cannot start is unreachable for that reset, so `io_uring` is first tried on a
+throwaway cluster inside the container (same seccomp profile, same build) and
+its configurations are skipped when that fails. Knobs:
+
+- `PG_AIO_TABLE_GB` (default 2): size of the generated table
+- `PG_AIO_METHODS` (default `sync,worker`): add `io_uring` to include it when
+  the container allows io_uring syscalls
+- `PG_AIO_WORKERS` (default `3,8`): `io_workers` values (worker method only)
+- `PG_AIO_EIC` (default `16,64`): `effective_io_concurrency` values
+- `PG_AIO_DROP_CACHES` (default 1): drop the host page cache before each run
+  (starts a privileged helper container); with `0` only shared_buffers is
+  cold and rows are labelled `page_cache=os-cached`
+"""
+
+import itertools
+import os
+import time
+
+import pytest
+
+from tests.utils.bench import env_float, env_ints, env_list
+from tests.utils.helpers import get_container
+from tests.utils.postgres import (
+    connect,
+    explain_analyze,
+    plan_node_types,
+    wait_for_postgres,
+)
+from tests.utils.result import Error, Ok
+
+TABLE = "aio_bench"
+BLOCK_SIZE = 8192
+IO_METHODS = {"sync", "worker", "io_uring"}
+SETTINGS = ("io_method", "io_workers", "effective_io_concurrency")
+# Start and stop a scratch cluster with io_method=io_uring (exit code 0 = works).
+IO_URING_PROBE = """
+d=$(mktemp -d) || exit 1
+initdb -D "$d/data" -A trust >/dev/null \\
+  && pg_ctl -D "$d/data" -l "$d/log" -w -t 30 \\
+       -o "-c io_method=io_uring -c listen_addresses='' -k $d" start >/dev/null \\
+  && pg_ctl -D "$d/data" -w stop >/dev/null
+rc=$?
+rm -rf "$d"
+exit $rc
+"""
+
+
+def _configs() -> list[dict[str, object]]:
+    methods = env_list("PG_AIO_METHODS", "sync,worker")
+    unknown = set(methods) - IO_METHODS
+    if unknown:
+        pytest.fail(f"unknown io_method(s) in PG_AIO_METHODS: {sorted(unknown)}")
+    workers = env_ints("PG_AIO_WORKERS", "3,8")
+    eics = env_ints("PG_AIO_EIC", "16,64")
+    configs: list[dict[str, object]] = []
+    for method, eic in itertools.product(methods, eics):
+        # io_workers only matters for io_method=worker
+        for w in workers if method == "worker" else [None]:
+            configs.append(
+                {"io_method": method, "io_workers": w, "effective_io_concurrency": eic}
+            )
+    return configs
+
+
+def _io_uring_supported(container) -> bool:
+    """Whether postgres in `container` can start with `io_method=io_uring`."""
+    result = container.exec_run(["sh", "-c", IO_URING_PROBE], user="postgres")
+    return result.exit_code == 0
+
+
+async def _ensure_table(target_bytes: int) -> int:
+    """Create and fill the benchmark table up to `target_bytes`; return its size."""
+    conn = await connect()
+    try:
+        await conn.execute("SET synchronous_commit = off;")
+        await conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {TABLE} (id bigint, k int, pad text);"
+        )
+        size = await conn.fetchval(f"SELECT pg_relation_size('{TABLE}');")
+        next_id = await conn.fetchval(f"SELECT coalesce(max(id), 0) FROM {TABLE};")
+        batch = 1_000_000
+        while size < target_bytes:
+            await conn.execute(
+                f"""
+                INSERT INTO {TABLE}
+                SELECT g, (random() * 1e9)::int, repeat(md5(g::text), 6)
+                FROM generate_series($1::bigint + 1, $1::bigint + $2) g;
+                """,
+                next_id,
+                batch,
+            )
+            next_id += batch
+            size = await conn.fetchval(f"SELECT pg_relation_size('{TABLE}');")
+        await conn.execute(f"CREATE INDEX IF NOT EXISTS {TABLE}_k_idx ON {TABLE} (k);")
+        await conn.execute(f"VACUUM (ANALYZE) {TABLE};")
+        return size
+    finally:
+        await conn.close()
+
+
+async def _apply_settings(container, config: dict[str, object]) -> dict[str, str]:
+    conn = await connect()
+    try:
+        for name in SETTINGS:
+            value = config.get(name)
+            if value is None:
+                await conn.execute(f"ALTER SYSTEM RESET {name};")
+            else:
+                await conn.execute(f"ALTER SYSTEM SET {name} = '{value}';")
+    finally:
+        await conn.close()
+    return await _restart(container)
+
+
+async def _restart(
+    container, docker_client=None, drop_caches: bool = False
+) -> dict[str, str]:
+    """Restart the server (cold shared_buffers) and return the effective settings."""
+    container.restart(timeout=60)
+    if drop_caches:
+        docker_client.containers.run(
+            "alpine:3",
+            ["sh", "-c", "sync; echo 3 > /proc/sys/vm/drop_caches"],
+            privileged=True,
+            remove=True,
+        )
+    await wait_for_postgres()
+    conn = await connect()
+    try:
+        return {name: await conn.fetchval(f"SHOW {name};") for name in SETTINGS}
+    finally:
+        await conn.close()
+
+
+async def _scan_throughput(sql: str, force_bitmap: bool) -> dict[str, object]:
+    conn = await connect()
+    try:
+        await conn.execute("SET max_parallel_workers_per_gather = 0;")
+        if force_bitmap:
+            await conn.execute("SET enable_seqscan = off;")
+            await conn.execute("SET enable_indexscan = off;")
+        result = await explain_analyze(conn, sql)
+    finally:
+        await conn.close()
+    plan = result["Plan"]
+    blocks = plan.get("Shared Read Blocks", 0) + plan.get("Shared Hit Blocks", 0)
+    seconds = result["Execution Time"] / 1000.0
+    mib = blocks * BLOCK_SIZE / 2**20
+    return {
+        "seconds": round(seconds, 3),
+        "mib": round(mib, 1),
+        "mib_s": round(mib / seconds, 1) if seconds else 0.0,
+        "read_blocks": plan.get("Shared Read Blocks", 0),
+        "nodes": plan_node_types(plan),
+    }
+
+
+async def _vacuum_throughput(size: int) -> dict[str, object]:
+    conn = await connect()
+    try:
+        start = time.perf_counter()
+        await conn.execute(f"VACUUM (DISABLE_PAGE_SKIPPING) {TABLE};")
+        seconds = time.perf_counter() - start
+    finally:
+        await conn.close()
+    mib = size / 2**20
+    return {
+        "seconds": round(seconds, 3),
+        "mib": round(mib, 1),
+        "mib_s": round(mib / seconds, 1) if seconds else 0.0,
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(0)
+async def test_postgres18_io_method_throughput(docker_client, bench_report) -> None:
+    match get_container(docker_client, "postgres-18"):
+        case Ok(container):
+            pass
+        case Error(msg):
+            pytest.skip(msg)
+
+    target = int(env_float("PG_AIO_TABLE_GB", 2.0) * 2**30)
+    drop_caches = os.environ.get("PG_AIO_DROP_CACHES", "1") != "0"
+    size = await _ensure_table(target)
+    report = bench_report("pg18_io_method")
+    report.note(f"table {TABLE}: {size / 2**30:.2f} GiB, drop_caches={drop_caches}")
+
+    workloads = {
+        "seqscan": lambda: _scan_throughput(f"SELECT count(*) FROM {TABLE}", False),
+        "bitmap": lambda: _scan_throughput(
+            f"SELECT count(*), sum(length(pad)) FROM {TABLE} WHERE k < 5000000",
+            True,
+        ),
+        "vacuum": lambda: _vacuum_throughput(size),
+    }
+
+    configs = _configs()
+    uring = any(c["io_method"] == "io_uring" for c in configs)
+    if uring and not _io_uring_supported(container):
+        report.note("io_method=io_uring skipped: server cannot start with it here")
+        configs = [c for c in configs if c["io_method"] != "io_uring"]
+
+    try:
+        for config in configs:
+            effective = await _apply_settings(container, config)
+            if effective["io_method"] != config["io_method"]:
+                report.note(f"io_method={config['io_method']} not applied: {effective}")
+                continue
+            for name, run in workloads.items():
+                await _restart(container, docker_client, drop_caches)
+                result = await run()
+                nodes = result.pop("nodes", [])
+                if name == "bitmap":
+                    assert "Bitmap Heap Scan" in nodes, f"expected bitmap plan: {nodes}"
+                report.add(
+                    io_method=effective["io_method"],
+                    io_workers=effective["io_workers"],
+                    eic=effective["effective_io_concurrency"],
+                    workload=name,
+                    page_cache="dropped" if drop_caches else "os-cached",
+                    **result,
+                )
+    finally:
+        await _apply_settings(container, {})
+
+    assert report.rows, "no configuration produced results"
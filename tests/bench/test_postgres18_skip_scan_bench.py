@@ -0,0 +1,158 @@
+"""PostgreSQL 18 B-tree skip scan vs dedicated index benchmark.
+
+For each leading-column cardinality, builds a table with a composite index on
+`(a, b)` and times queries that filter only on `b`:
+
+- `composite`: only `(a, b)` exists, so PG18 may use a skip scan
+- `dedicated`: an extra index on `(b)` exists
+
+It also times a batch of inserts under both layouts, so the read penalty of
+dropping the secondary index can be weighed against the write savings.
+`EXPLAIN (ANALYZE, BUFFERS)` plans are attached to the JSON report.
+
+Knobs:
+
+- `PG_SKIP_CARDINALITIES` (default `2,10,100,1000,10000`)
+- `PG_SKIP_ROWS` (default 1000000): rows per table
+- `PG_SKIP_REPEATS` (default 50): timed queries per layout
+- `PG_SKIP_INSERT_ROWS` (default 50000): rows in the insert batch
+- `PG_SKIP_TOLERANCE` (default 1.5): composite/dedicated p50 ratio still
+  counted as "skip scan good enough"; the verdict also requires the composite
+  plan to have skipped, i.e. more than one `Index Searches` on `(a, b)`
+"""
+
+import random
+import time
+
+import asyncpg
+import pytest
+
+from tests.utils.bench import env_float, env_int, env_ints, latency_summary
+from tests.utils.postgres import (
+    connect,
+    explain_analyze,
+    explain_text,
+    plan_index_searches,
+    plan_node_types,
+    plan_sum,
+)
+
+B_DOMAIN = 100_000
+QUERY = "SELECT count(*) FROM {table} WHERE b = $1"
+
+
+async def _build(conn: asyncpg.Connection, table: str, card: int, rows: int) -> None:
+    await conn.execute(f"DROP TABLE IF EXISTS {table};")
+    await conn.execute(f"CREATE TABLE {table} (a int, b int, payload text);")
+    await conn.execute(
+        f"""
+        INSERT INTO {table}
+        SELECT g % $1, (random() * $2)::int, md5(g::text)
+        FROM generate_series(1, $3) g;
+        """,
+        card,
+        B_DOMAIN,
+        rows,
+    )
+    await conn.execute(f"CREATE INDEX {table}_ab_idx ON {table} (a, b);")
+    await conn.execute(f"VACUUM (ANALYZE) {table};")
+
+
+async def _time_queries(
+    conn: asyncpg.Connection, table: str, keys: list[int]
+) -> dict[str, float]:
+    sql = QUERY.format(table=table)
+    # Warm up the plan cache and shared buffers before timing
+    await conn.fetchval(sql, keys[0])
+    samples: list[float] = []
+    for key in keys:
+        start = time.perf_counter()
+        await conn.fetchval(sql, key)
+        samples.append(time.perf_counter() - start)
+    return latency_summary(samples)
+
+
+async def _time_inserts(
+    conn: asyncpg.Connection, table: str, card: int, rows: int
+) -> float:
+    """Time an index-maintaining insert batch; rolled back to keep data stable."""
+    tr = conn.transaction()
+    await tr.start()
+    try:
+        start = time.perf_counter()
+        await conn.execute(
+            f"""
+            INSERT INTO {table}
+            SELECT g % $1, (random() * $2)::int, md5(g::text)
+            FROM generate_series(1, $3) g;
+            """,
+            card,
+            B_DOMAIN,
+            rows,
+        )
+        return time.perf_counter() - start
+    finally:
+        await tr.rollback()
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(0)
+async def test_postgres18_skip_scan_vs_dedicated_index(bench_report) -> None:
+    cardinalities = env_ints("PG_SKIP_CARDINALITIES", "2,10,100,1000,10000")
+    rows = env_int("PG_SKIP_ROWS", 1_000_000)
+    repeats = env_int("PG_SKIP_REPEATS", 50)
+    insert_rows = env_int("PG_SKIP_INSERT_ROWS", 50_000)
+    tolerance = env_float("PG_SKIP_TOLERANCE", 1.5)
+
+    rng = random.Random(42)
+    keys = [rng.randrange(B_DOMAIN) for _ in range(repeats)]
+    report = bench_report("pg18_skip_scan")
+    report.note(f"rows={rows} b_domain={B_DOMAIN} tolerance={tolerance}")
+
+    conn = await connect()
+    try:
+        for card in cardinalities:
+            table = f"skip_bench_{card}"
+            await _build(conn, table, card, rows)
+            sql = QUERY.format(table=table)
+            results: dict[str, dict[str, object]] = {}
+
+            for layout in ("composite", "dedicated"):
+                if layout == "dedicated":
+                    await conn.execute(f"CREATE INDEX {table}_b_idx ON {table} (b);")
+                    await conn.execute(f"ANALYZE {table};")
+                latency = await _time_queries(conn, table, keys)
+                plan = (await explain_analyze(conn, sql, keys[0]))["Plan"]
+                report.attach(
+                    f"{table}/{layout}", await explain_text(conn, sql, keys[0])
+                )
+                insert_s = await _time_inserts(conn, table, card, insert_rows)
+                results[layout] = {
+                    "p50_ms": latency["p50_ms"],
+                    "p95_ms": latency["p95_ms"],
+                    "nodes": ">".join(plan_node_types(plan)),
+                    "index_searches": plan_sum(plan, "Index Searches"),
+                    "ab_searches": plan_index_searches(plan, f"{table}_ab_idx"),
+                    "shared_hit": plan.get("Shared Hit Blocks", 0),
+                    "insert_rows_s": round(insert_rows / insert_s, 1),
+                }
+
+            ratio = (
+                results["composite"]["p50_ms"] / results["dedicated"]["p50_ms"]
+                if results["dedicated"]["p50_ms"]
+                else float("inf")
+            )
+            skipped = results["composite"]["ab_searches"] > 1
+            for layout, result in results.items():
+                report.add(cardinality=card, layout=layout, **result)
+            report.add(
+                cardinality=card,
+                layout="verdict",
+                p50_ratio=round(ratio, 2),
+                skip_scan_ok=skipped and ratio <= tolerance,
+            )
+            await conn.execute(f"DROP TABLE IF EXISTS {table};")
+    finally:
+        await conn.close()
+
+    assert report.rows, "no cardinality produced results"
@@ -0,0 +1,48 @@
+"""LISTEN/NOTIFY fan-out throughput and latency benchmark.
+
+Sweeps listener count, payload size and transaction batching against
+`postgres-18` using `tests.utils.pg_notify.run_fanout`. Hundreds of listener
+connections need `max_connections` headroom (see `POSTGRES_MAX_CONNECTIONS`
+in `compose.yaml`).
+
+Knobs:
+
+- `PG_NOTIFY_PUBLISHERS` (default `1,4`)
+- `PG_NOTIFY_LISTENERS` (default `1,10,100,250`)
+- `PG_NOTIFY_PAYLOADS` (default `32,1024,7000`): payload bytes
+- `PG_NOTIFY_BATCHES` (default `1,50`): notifications per transaction
+- `PG_NOTIFY_MESSAGES` (default 2000): notifications per run
+"""
+
+import itertools
+
+import pytest
+
+from tests.utils.bench import env_int, env_ints
+from tests.utils.pg_notify import run_fanout
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(0)
+async def test_postgres_notify_fanout(bench_report) -> None:
+    publishers = env_ints("PG_NOTIFY_PUBLISHERS", "1,4")
+    listeners = env_ints("PG_NOTIFY_LISTENERS", "1,10,100,250")
+    payloads = env_ints("PG_NOTIFY_PAYLOADS", "32,1024,7000")
+    batches = env_ints("PG_NOTIFY_BATCHES", "1,50")
+    messages = env_int("PG_NOTIFY_MESSAGES", 2000)
+
+    report = bench_report("pg_notify_fanout")
+    for pubs, subs, size, batch in itertools.product(
+        publishers, listeners, payloads, batches
+    ):
+        result = await run_fanout(
+            publishers=pubs,
+            listeners=subs,
+            messages=messages,
+            payload_size=size,
+            batch=batch,
+        )
+        report.add(payload=size, batch=batch, **result.summary())
+        assert result.delivered == result.sent * subs, (
+            f"lost notifications: {result.delivered}/{result.sent * subs}"
+        )
@@ -0,0 +1,216 @@
+"""Qdrant filtered search with and without payload indexes.
+
+Loads the shared embedding dataset (`tests.utils.vectors`, configured by
+`VEC_*`) twice, with payloads whose selectivity is controlled: every point
+draws `u ~ U[0, 1)` and, for each selectivity level `s`, matches when
+`u < s` through three differently typed fields:
+
+- `tag` (keyword array): contains `lt-<s>`
+- `code` (integer array): contains the level's index
+- `price` (float): `range` filter `price < s`
+
+All three therefore select exactly the same points for a level, so recall
+and latency are comparable across field types. The `plain` collection has no
+payload indexes; `indexed` gets `PUT /collections/{c}/index` for all three
+fields before upload, so its HNSW graph is built with Qdrant's extra
+payload-aware links (filterable HNSW) for every payload value matching more
+points than `full_scan_threshold`. With an index the planner can also
+estimate cardinality and switch to a payload-index scan plus exact scoring
+when a filter matches fewer points than that threshold. The threshold
+therefore defaults to a small share of the collection (2% of its vector
+bytes, at least Qdrant's 10 KB minimum), so the high-selectivity levels run
+filtered HNSW and the low ones fall back to the scan; the `path` column shows
+which side of the threshold each level is on (`hnsw`, `payload-scan`, or
+`exact` for the brute-force reference mode). Recall@k is against exact NumPy
+ground truth over the filtered subset.
+
+Knobs:
+
+- `QDRANT_FILTER_K` (default 10)
+- `QDRANT_FILTER_SELECTIVITY` (default `0.5,0.1,0.01,0.001`)
+- `QDRANT_FILTER_FIELDS` (default `tag,code,price`)
+- `QDRANT_FILTER_MODES` (default `hnsw,exact`)
+- `QDRANT_FILTER_FULL_SCAN_KB` (default 2% of `VEC_COUNT * VEC_DIM * 4`
+  bytes, at least 10): `hnsw_config.full_scan_threshold`
+- `QDRANT_FILTER_CONCURRENCY` (default 4): in-flight single-query requests
+"""
+
+import asyncio
+import time
+
+import aiohttp
+import numpy as np
+import pytest
+from aiohttp import ClientSession, ClientTimeout
+
+from tests.utils.bench import env_int, env_list, rate
+from tests.utils.qdrant import (
+    RestPoints,
+    qdrant_request,
+    recreate_collection,
+    upsert_points,
+    wait_green,
+)
+from tests.utils.vectors import dataset_from_env, ground_truth, recall_at_k
+
+LAYOUTS = {"plain": "bench_filter_plain", "indexed": "bench_filter_indexed"}
+INDEXES = {
+    "tag": "keyword",
+    "code": {"type": "integer", "lookup": True, "range": False},
+    "price": "float",
+}
+
+
+def _payload(n: int, levels: list[float], seed: int = 11) -> dict[str, np.ndarray]:
+    u = np.random.default_rng(seed).random(n)
+    tags = np.empty(n, dtype=object)
+    codes = np.empty(n, dtype=object)
+    for i, x in enumerate(u.tolist()):
+        hit = [j for j, s in enumerate(levels) if x < s]
+        tags[i] = [f"lt-{levels[j]:g}" for j in hit]
+        codes[i] = hit
+    return {"tag": tags, "code": codes, "price": u}
+
+
+def _filter(field: str, level: int, s: float) -> dict:
+    match field:
+        case "tag":
+            cond = {"key": "tag", "match": {"value": f"lt-{s:g}"}}
+        case "code":
+            cond = {"key": "code", "match": {"value": level}}
+        case "price":
+            cond = {"key": "price", "range": {"lt": s}}
+        case _:
+            raise ValueError(f"unknown filter field: {field}")
+    return {"must": [cond]}
+
+
+def _path(mode: str, layout: str, matched: int, dim: int, full_scan_kb: int) -> str:
+    """Search path the planner takes for a filter matching `matched` points."""
+    if mode == "exact":
+        return "exact"
+    # Without a payload index the planner cannot estimate cardinality.
+    if layout == "indexed" and matched * dim * 4 < full_scan_kb * 1024:
+        return "payload-scan"
+    return "hnsw"
+
+
+def _filtered_truth(
+    vectors: np.ndarray, queries: np.ndarray, mask: np.ndarray, k: int
+) -> np.ndarray:
+    rows = np.flatnonzero(mask)
+    top = ground_truth(vectors[rows], queries, min(k, len(rows)))
+    return rows[top]
+
+
+async def _search(
+    client: RestPoints,
+    queries: np.ndarray,
+    k: int,
+    concurrency: int,
+    params: dict,
+    query_filter: dict,
+) -> tuple[list[list[int]], float]:
+    found: list[list[int]] = [[] for _ in queries]
+    pending = iter(range(len(queries)))
+
+    async def worker() -> None:
+        for i in pending:
+            (found[i],) = await client.search(
+                queries[i : i + 1], k, params=params, query_filter=query_filter
+            )
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return found, time.perf_counter() - start
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(0)
+async def test_qdrant_payload_index_filtered_search(bench_report) -> None:
+    k = env_int("QDRANT_FILTER_K", 10)
+    levels = [
+        float(s) for s in env_list("QDRANT_FILTER_SELECTIVITY", "0.5,0.1,0.01,0.001")
+    ]
+    fields = env_list("QDRANT_FILTER_FIELDS", "tag,code,price")
+    modes = env_list("QDRANT_FILTER_MODES", "hnsw,exact")
+    concurrency = env_int("QDRANT_FILTER_CONCURRENCY", 4)
+    data = dataset_from_env()
+    vector_kb = len(data.vectors) * data.dim * 4 // 1024
+    full_scan_kb = env_int("QDRANT_FILTER_FULL_SCAN_KB", max(10, vector_kb // 50))
+    payload = _payload(len(data.vectors), levels)
+    ids = np.arange(len(data.vectors), dtype=np.int64)
+
+    async with ClientSession(timeout=ClientTimeout(total=600)) as http:
+        try:
+            await qdrant_request(http, "GET", "collections")
+        except aiohttp.ClientConnectionError as e:
+            pytest.skip(f"Qdrant not reachable: {e}")
+
+        report = bench_report("qdrant_filter")
+        report.note(
+            f"vectors={len(data.vectors)} dim={data.dim} queries={len(data.queries)} "
+            f"k={k} full_scan_threshold={full_scan_kb}KB concurrency={concurrency}"
+        )
+        for layout, collection in LAYOUTS.items():
+            await recreate_collection(
+                http,
+                collection,
+                {
+                    "vectors": {"size": data.dim, "distance": "Cosine"},
+                    "hnsw_config": {"full_scan_threshold": full_scan_kb},
+                    "optimizers_config": {"indexing_threshold": 1},
+                },
+            )
+            start = time.perf_counter()
+            if layout == "indexed":
+                for field, schema in INDEXES.items():
+                    await qdrant_request(
+                        http,
+                        "PUT",
+                        f"collections/{collection}/index",
+                        {"field_name": field, "field_schema": schema},
+                        wait=True,
+                    )
+            await upsert_points(http, collection, ids, data.vectors, payload)
+            await wait_green(http, collection, timeout=3600, indexed=len(ids))
+            report.note(f"{layout}: load + index {time.perf_counter() - start:.2f}s")
+
+        for level, s in enumerate(levels):
+            mask = payload["price"] < s
+            if not mask.any():
+                report.note(f"selectivity={s:g}: no matching points, skipped")
+                continue
+            truth = _filtered_truth(data.vectors, data.queries, mask, k)
+            for layout, collection in LAYOUTS.items():
+                for field in fields:
+                    for mode in modes:
+                        params = {"exact": True} if mode == "exact" else {}
+                        async with RestPoints(http, collection) as client:
+                            found, elapsed = await _search(
+                                client,
+                                data.queries,
+                                k,
+                                concurrency,
+                                params,
+                                _filter(field, level, s),
+                            )
+                        lat = client.timings.summary()
+                        report.add(
+                            selectivity=s,
+                            matched=int(mask.sum()),
+                            layout=layout,
+                            field=field,
+                            mode=mode,
+                            path=_path(
+                                mode, layout, int(mask.sum()), data.dim, full_scan_kb
+                            ),
+                            qps=rate(len(data.queries), elapsed),
+                            p50_ms=lat["p50_ms"],
+                            p99_ms=lat["p99_ms"],
+                            recall=recall_at_k(found, truth, truth.shape[1]),
+                        )
+        for collection in LAYOUTS.values():
+            await qdrant_request(http, "DELETE", f"collections/{collection}", ok=(404,))
+
+    assert all(row["recall"] > 0 for row in report.rows), "filtered search missed"
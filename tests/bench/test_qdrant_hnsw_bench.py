@@ -0,0 +1,190 @@
+"""Qdrant HNSW and quantization sweep: QPS, latency, memory and recall@k.
+
+Loads the shared embedding dataset (`tests.utils.vectors`, configured by
+`VEC_*`) into one collection per (`m`, `ef_construct`, quantization)
+combination. Points are uploaded with indexing disabled, then
+`indexing_threshold` is lowered so the HNSW graph (and quantized vectors) are
+built once; `build_s` is the time until every vector is indexed and
+`mem_mb` is the growth of Qdrant's allocated memory (`memory_allocated_bytes`
+from `/metrics`) over the empty collection.
+
+Each build is queried with every search-time `ef`; quantized builds run both
+without and with rescoring (original vectors re-rank `oversampling * k`
+candidates). One exact search row (`"exact": true` with quantization ignored,
+so it scores the original vectors whichever build serves it) gives the
+brute-force QPS baseline; its build columns are `-`. Recall@k is against exact
+NumPy ground truth.
+
+Knobs:
+
+- `QDRANT_HNSW_K` (default 10)
+- `QDRANT_HNSW_M` (default `8,16,32`)
+- `QDRANT_HNSW_EF_CONSTRUCT` (default `64,200`)
+- `QDRANT_HNSW_EF` (default `16,64,256`): search-time `hnsw_ef`
+- `QDRANT_HNSW_QUANTIZATION` (default `none,scalar,product,binary`)
+- `QDRANT_HNSW_OVERSAMPLING` (default 2.0)
+- `QDRANT_HNSW_BATCH` (default 1): queries per search request
+- `QDRANT_HNSW_CONCURRENCY` (default 4): in-flight requests
+"""
+
+import asyncio
+import itertools
+import time
+
+import aiohttp
+import numpy as np
+import pytest
+from aiohttp import ClientSession, ClientTimeout
+
+from tests.utils.bench import env_float, env_int, env_ints, env_list, rate
+from tests.utils.qdrant import (
+    RestPoints,
+    memory_bytes,
+    qdrant_request,
+    recreate_collection,
+    upsert_points,
+    wait_green,
+)
+from tests.utils.vectors import (
+    VectorDataset,
+    dataset_from_env,
+    ground_truth,
+    recall_at_k,
+)
+
+COLLECTION = "bench_hnsw"
+QUANTIZATION = {
+    "none": None,
+    "scalar": {"scalar": {"type": "int8", "quantile": 0.99, "always_ram": True}},
+    "product": {"product": {"compression": "x16", "always_ram": True}},
+    "binary": {"binary": {"always_ram": True}},
+}
+
+
+async def _build(
+    http: ClientSession, data: VectorDataset, m: int, ef_construct: int, quant: str
+) -> tuple[float, float]:
+    """Create and index the collection; returns (build seconds, MiB added)."""
+    body: dict[str, object] = {
+        "vectors": {"size": data.dim, "distance": "Cosine"},
+        "hnsw_config": {"m": m, "ef_construct": ef_construct},
+        "optimizers_config": {"indexing_threshold": 0},
+    }
+    if QUANTIZATION[quant] is not None:
+        body["quantization_config"] = QUANTIZATION[quant]
+    await recreate_collection(http, COLLECTION, body)
+    before = (await memory_bytes(http)).get("memory_allocated_bytes", 0.0)
+    ids = np.arange(len(data.vectors), dtype=np.int64)
+    await upsert_points(http, COLLECTION, ids, data.vectors, batch_size=1000)
+
+    start = time.perf_counter()
+    await qdrant_request(
+        http,
+        "PATCH",
+        f"collections/{COLLECTION}",
+        {"optimizers_config": {"indexing_threshold": 1}},
+    )
+    await wait_green(http, COLLECTION, timeout=3600, indexed=len(data.vectors))
+    build_s = time.perf_counter() - start
+    after = (await memory_bytes(http)).get("memory_allocated_bytes", 0.0)
+    return build_s, max(0.0, after - before) / 2**20
+
+
+async def _search(
+    client: RestPoints,
+    queries: np.ndarray,
+    k: int,
+    batch: int,
+    concurrency: int,
+    params: dict,
+) -> tuple[list[list[int]], float]:
+    found: list[list[int]] = [[] for _ in queries]
+    starts = iter(range(0, len(queries), batch))
+
+    async def worker() -> None:
+        for lo in starts:
+            hits = await client.search(queries[lo : lo + batch], k, params=params)
+            found[lo : lo + len(hits)] = hits
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return found, time.perf_counter() - start
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(0)
+async def test_qdrant_hnsw_quantization_sweep(bench_report) -> None:
+    k = env_int("QDRANT_HNSW_K", 10)
+    ms = env_ints("QDRANT_HNSW_M", "8,16,32")
+    ef_constructs = env_ints("QDRANT_HNSW_EF_CONSTRUCT", "64,200")
+    efs = env_ints("QDRANT_HNSW_EF", "16,64,256")
+    quants = env_list("QDRANT_HNSW_QUANTIZATION", "none,scalar,product,binary")
+    oversampling = env_float("QDRANT_HNSW_OVERSAMPLING", 2.0)
+    batch = env_int("QDRANT_HNSW_BATCH", 1)
+    concurrency = env_int("QDRANT_HNSW_CONCURRENCY", 4)
+    if unknown := set(quants) - set(QUANTIZATION):
+        raise ValueError(f"unknown quantization: {sorted(unknown)}")
+    data = dataset_from_env()
+    truth = ground_truth(data.vectors, data.queries, k)
+
+    async with ClientSession(timeout=ClientTimeout(total=600)) as http:
+        try:
+            await qdrant_request(http, "GET", "collections")
+        except aiohttp.ClientConnectionError as e:
+            pytest.skip(f"Qdrant not reachable: {e}")
+
+        report = bench_report("qdrant_hnsw")
+        report.note(
+            f"vectors={len(data.vectors)} dim={data.dim} queries={len(data.queries)} "
+            f"k={k} batch={batch} concurrency={concurrency} "
+            f"oversampling={oversampling:g}"
+        )
+        baseline = False
+        for m, ef_construct, quant in itertools.product(ms, ef_constructs, quants):
+            build_s, mem_mb = await _build(http, data, m, ef_construct, quant)
+            config = {
+                "m": m,
+                "ef_construct": ef_construct,
+                "quant": quant,
+                "build_s": round(build_s, 2),
+                "mem_mb": round(mem_mb, 1),
+            }
+            runs: list[tuple[str, int | None, dict]] = []
+            if not baseline:
+                exact = {"exact": True, "quantization": {"ignore": True}}
+                runs.append(("exact", None, exact))
+                baseline = True
+            for ef in efs:
+                if quant == "none":
+                    runs.append(("-", ef, {"hnsw_ef": ef}))
+                    continue
+                for rescore in (False, True):
+                    quantization = {"rescore": rescore}
+                    if rescore:
+                        quantization["oversampling"] = oversampling
+                    runs.append(
+                        (
+                            "rescore" if rescore else "no",
+                            ef,
+                            {"hnsw_ef": ef, "quantization": quantization},
+                        )
+                    )
+
+            for rescore, ef, params in runs:
+                async with RestPoints(http, COLLECTION) as client:
+                    found, elapsed = await _search(
+                        client, data.queries, k, batch, concurrency, params
+                    )
+                lat = client.timings.summary()
+                report.add(
+                    **(dict.fromkeys(config, "-") if ef is None else config),
+                    rescore=rescore,
+                    ef=ef if ef is not None else "exact",
+                    qps=rate(len(data.queries), elapsed),
+                    p50_ms=lat["p50_ms"],
+                    p99_ms=lat["p99_ms"],
+                    recall=recall_at_k(found, truth, k),
+                )
+        await qdrant_request(http, "DELETE", f"collections/{COLLECTION}", ok=(404,))
+
+    assert all(row["recall"] > 0 for row in report.rows), "search returned nothing"
@@ -0,0 +1,128 @@
+"""Qdrant full-collection export: prefetching and parallel range scrolls.
+
+Loads the shared embedding dataset (`tests.utils.vectors`, configured by
+`VEC_*`), then exports every point with its vector into a preallocated
+`VectorExport` with `scroll_points`:
+
+- `sequential`: follow `next_page_offset`, one request at a time
+- `prefetch`: the next page is requested while the current one is processed
+- `ranges`: the id space is split with `id_ranges` and scrolled in parallel
+
+A simulated per-page processing cost (`QDRANT_SCROLL_WORK_MS`) models a
+re-embedding job, so prefetch has caller work to overlap with. Every mode
+must return each point exactly once with the vector that was loaded.
+
+Knobs:
+
+- `QDRANT_SCROLL_PAGE` (default 1000)
+- `QDRANT_SCROLL_RANGES` (default `2,4`): parallel readers
+- `QDRANT_SCROLL_WORK_MS` (default 5)
+- `QDRANT_SCROLL_TRANSPORTS` (default `rest,grpc`)
+"""
+
+import asyncio
+import time
+
+import aiohttp
+import numpy as np
+import pytest
+from aiohttp import ClientSession, ClientTimeout
+
+from tests.utils.bench import (
+    env_float,
+    env_int,
+    env_ints,
+    env_list,
+    latency_summary,
+    rate,
+)
+from tests.utils.qdrant import (
+    RestPoints,
+    VectorExport,
+    id_ranges,
+    qdrant_request,
+    recreate_collection,
+    scroll_points,
+    upsert_points,
+)
+from tests.utils.qdrant_grpc import GrpcPoints
+from tests.utils.vectors import dataset_from_env
+
+COLLECTION = "bench_scroll"
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(0)
+async def test_qdrant_scroll_export(bench_report) -> None:
+    page = env_int("QDRANT_SCROLL_PAGE", 1000)
+    range_counts = env_ints("QDRANT_SCROLL_RANGES", "2,4")
+    work_s = env_float("QDRANT_SCROLL_WORK_MS", 5) / 1000
+    transports = env_list("QDRANT_SCROLL_TRANSPORTS", "rest,grpc")
+    data = dataset_from_env()
+    count = len(data.vectors)
+    ids = np.arange(count, dtype=np.int64)
+
+    async with ClientSession(timeout=ClientTimeout(total=600)) as http:
+        try:
+            await qdrant_request(http, "GET", "collections")
+        except aiohttp.ClientConnectionError as e:
+            pytest.skip(f"Qdrant not reachable: {e}")
+        if "grpc" in transports:
+            async with GrpcPoints(COLLECTION) as probe:
+                try:
+                    await probe.ready()
+                except TimeoutError:
+                    pytest.skip("Qdrant gRPC port not reachable")
+
+        await recreate_collection(
+            http, COLLECTION, {"vectors": {"size": data.dim, "distance": "Cosine"}}
+        )
+        await upsert_points(http, COLLECTION, ids, data.vectors)
+
+        report = bench_report("qdrant_scroll")
+        report.note(
+            f"points={count} dim={data.dim} page={page} work_ms={work_s * 1000:g}"
+        )
+        runs = [("sequential", False, 1), ("prefetch", True, 1)]
+        runs += [("ranges", True, n) for n in range_counts]
+        for transport in transports:
+            for mode, prefetch, parts in runs:
+                client = (
+                    GrpcPoints(COLLECTION)
+                    if transport == "grpc"
+                    else RestPoints(http, COLLECTION)
+                )
+                export = VectorExport(count, data.dim)
+                waits: list[float] = []
+                async with client:
+                    start = time.perf_counter()
+                    t0 = start
+                    async for result in scroll_points(
+                        client,
+                        page,
+                        with_vectors=True,
+                        prefetch=prefetch,
+                        ranges=id_ranges(0, count, parts) if parts > 1 else None,
+                    ):
+                        waits.append(time.perf_counter() - t0)
+                        export.add(result)
+                        await asyncio.sleep(work_s)
+                        t0 = time.perf_counter()
+                    elapsed = time.perf_counter() - start
+
+                got_ids, got_vectors = export.sorted()
+                assert export.size == count, f"{transport}/{mode}: {export.size}"
+                assert np.array_equal(got_ids, ids), f"{transport}/{mode}: id mismatch"
+                # Cosine collections store re-normalised vectors: compare with a tolerance.
+                np.testing.assert_allclose(got_vectors, data.vectors, atol=1e-5)
+                lat = latency_summary(waits)
+                report.add(
+                    transport=transport,
+                    mode=mode,
+                    readers=parts,
+                    points_s=rate(count, elapsed),
+                    page_wait_p50_ms=lat["p50_ms"],
+                    page_wait_max_ms=lat["max_ms"],
+                    decode_ms=client.timings.summary()["decode_ms"],
+                )
+        await qdrant_request(http, "DELETE", f"collections/{COLLECTION}", ok=(404,))
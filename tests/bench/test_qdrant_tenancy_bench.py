@@ -0,0 +1,278 @@
+"""Qdrant multitenancy layouts: one partitioned collection vs one per tenant.
+
+For each tenant count `N`, `N * QDRANT_TENANT_POINTS` embeddings are
+generated (`tests.utils.vectors.make_dataset`, dimension from `VEC_DIM`) and
+point `i` is assigned to tenant `i % N`. Two layouts are loaded in turn:
+
+- `shared`: one collection with a `tenant_id` keyword index created with
+  `is_tenant: true` before upload, and Qdrant's multitenancy HNSW settings
+  (`m: 0` disables the global graph, `payload_m` builds per-tenant links);
+  searches filter on `tenant_id`
+- `collections`: one collection per tenant (`tenant_<n>`), created and
+  loaded by `QDRANT_TENANT_CONCURRENCY` parallel workers
+
+A tenant holds only `QDRANT_TENANT_POINTS` vectors, far below Qdrant's default
+`full_scan_threshold` (10000 KB) and `indexing_threshold`, which would make
+every search a brute-force scan of the tenant and recall trivially 1.0. Both
+layouts therefore set `indexing_threshold: 1` and a low `full_scan_threshold`
+(`QDRANT_TENANT_FULL_SCAN_KB`), so the per-tenant `payload_m` graphs (and the
+per-collection graphs) are built and searched, and loading waits until every
+vector is indexed (`wait_green(..., indexed=...)`); `ingest_s` includes that
+indexing.
+
+Each row reports ingestion time (create + upload until confirmed),
+points/sec, Qdrant's allocated-memory growth and RSS (`/metrics`), and
+single-query latency, QPS and recall@k for a random sample of tenants
+(ground truth is exact NumPy search within the tenant's points).
+
+Knobs:
+
+- `QDRANT_TENANTS` (default `10,100,1000,10000`)
+- `QDRANT_TENANT_POINTS` (default 50): points per tenant
+- `QDRANT_TENANT_SAMPLE` (default 100): tenants queried per configuration
+- `QDRANT_TENANT_QUERIES` (default 5): queries per sampled tenant
+- `QDRANT_TENANT_K` (default 10)
+- `QDRANT_TENANT_FULL_SCAN_KB` (default 10, Qdrant's minimum):
+  `hnsw_config.full_scan_threshold`; at `VEC_DIM=128` that is 20 points
+- `QDRANT_TENANT_CONCURRENCY` (default 8): parallel collection loaders and
+  in-flight queries
+- `QDRANT_TENANT_MAX_COLLECTIONS` (default 10000): larger `N` skip the
+  per-tenant-collections layout (every collection costs files and threads)
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+import aiohttp
+import numpy as np
+import pytest
+from aiohttp import ClientSession, ClientTimeout
+
+from tests.utils.bench import env_int, env_ints, latency_summary, rate
+from tests.utils.qdrant import (
+    RestPoints,
+    memory_bytes,
+    qdrant_request,
+    recreate_collection,
+    upsert_points,
+    wait_green,
+)
+from tests.utils.vectors import ground_truth, make_dataset, recall_at_k
+
+SHARED = "bench_tenants"
+
+
+def _tenant_collection(tenant: int) -> str:
+    return f"tenant_{tenant}"
+
+
+async def _bounded(
+    calls: list[Callable[[], Awaitable[object]]], concurrency: int
+) -> None:
+    pending = iter(calls)
+
+    async def worker() -> None:
+        for call in pending:
+            await call()
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+
+def _collection_body(dim: int, full_scan_kb: int, hnsw: dict) -> dict:
+    return {
+        "vectors": {"size": dim, "distance": "Cosine"},
+        "hnsw_config": {**hnsw, "full_scan_threshold": full_scan_kb},
+        "optimizers_config": {"indexing_threshold": 1},
+    }
+
+
+async def _load_shared(
+    http: ClientSession, vectors: np.ndarray, tenants: int, full_scan_kb: int
+) -> None:
+    await recreate_collection(
+        http,
+        SHARED,
+        _collection_body(vectors.shape[1], full_scan_kb, {"m": 0, "payload_m": 16}),
+    )
+    await qdrant_request(
+        http,
+        "PUT",
+        f"collections/{SHARED}/index",
+        {
+            "field_name": "tenant_id",
+            "field_schema": {"type": "keyword", "is_tenant": True},
+        },
+        wait=True,
+    )
+    ids = np.arange(len(vectors), dtype=np.int64)
+    payload = {"tenant_id": np.char.add("t", (ids % tenants).astype(str))}
+    await upsert_points(http, SHARED, ids, vectors, payload, batch_size=1000)
+    await wait_green(http, SHARED, timeout=3600, indexed=len(vectors))
+
+
+async def _load_collections(
+    http: ClientSession,
+    vectors: np.ndarray,
+    tenants: int,
+    full_scan_kb: int,
+    concurrency: int,
+) -> None:
+    body = _collection_body(vectors.shape[1], full_scan_kb, {})
+
+    async def load(tenant: int) -> None:
+        rows = np.arange(tenant, len(vectors), tenants)
+        name = _tenant_collection(tenant)
+        await recreate_collection(http, name, body)
+        await upsert_points(http, name, rows, vectors[rows], concurrency=1)
+        await wait_green(http, name, timeout=3600, indexed=len(rows))
+
+    await _bounded([lambda t=t: load(t) for t in range(tenants)], concurrency)
+
+
+async def _drop(
+    http: ClientSession, layout: str, tenants: int, concurrency: int
+) -> None:
+    names = (
+        [SHARED]
+        if layout == "shared"
+        else [_tenant_collection(t) for t in range(tenants)]
+    )
+    await _bounded(
+        [
+            lambda name=name: qdrant_request(
+                http, "DELETE", f"collections/{name}", ok=(404,)
+            )
+            for name in names
+        ],
+        concurrency,
+    )
+
+
+async def _query(
+    http: ClientSession,
+    layout: str,
+    vectors: np.ndarray,
+    queries: np.ndarray,
+    tenants: int,
+    sample: list[int],
+    k: int,
+    concurrency: int,
+) -> tuple[list[float], float, float]:
+    """Query each sampled tenant with its share of `queries`.
+
+    Returns (per-query latencies, elapsed seconds, recall@k).
+    """
+    per = len(queries) // len(sample)
+    owner = [sample[i // per] for i in range(len(queries))]
+    kk = min(k, len(vectors) // tenants)
+    truth = np.empty((len(queries), kk), dtype=np.int64)
+    for n, tenant in enumerate(sample):
+        rows = np.arange(tenant, len(vectors), tenants)
+        part = slice(n * per, (n + 1) * per)
+        truth[part] = rows[ground_truth(vectors[rows], queries[part], kk)]
+
+    clients = {
+        t: RestPoints(http, SHARED if layout == "shared" else _tenant_collection(t))
+        for t in sample
+    }
+    found: list[list[int]] = [[] for _ in queries]
+    samples: list[float] = []
+
+    async def one(i: int) -> None:
+        tenant = owner[i]
+        query_filter = None
+        if layout == "shared":
+            match = {"key": "tenant_id", "match": {"value": f"t{tenant}"}}
+            query_filter = {"must": [match]}
+        t0 = time.perf_counter()
+        (found[i],) = await clients[tenant].search(
+            queries[i : i + 1], k, query_filter=query_filter
+        )
+        samples.append(time.perf_counter() - t0)
+
+    start = time.perf_counter()
+    await _bounded([lambda i=i: one(i) for i in range(len(queries))], concurrency)
+    elapsed = time.perf_counter() - start
+    return samples, elapsed, recall_at_k(found, truth, kk)
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(0)
+async def test_qdrant_multitenancy_layouts(bench_report) -> None:
+    tenant_counts = env_ints("QDRANT_TENANTS", "10,100,1000,10000")
+    per_tenant = env_int("QDRANT_TENANT_POINTS", 50)
+    sample_size = env_int("QDRANT_TENANT_SAMPLE", 100)
+    queries_per = env_int("QDRANT_TENANT_QUERIES", 5)
+    k = env_int("QDRANT_TENANT_K", 10)
+    full_scan_kb = env_int("QDRANT_TENANT_FULL_SCAN_KB", 10)
+    concurrency = env_int("QDRANT_TENANT_CONCURRENCY", 8)
+    max_collections = env_int("QDRANT_TENANT_MAX_COLLECTIONS", 10_000)
+    dim = env_int("VEC_DIM", 128)
+
+    async with ClientSession(timeout=ClientTimeout(total=600)) as http:
+        try:
+            await qdrant_request(http, "GET", "collections")
+        except aiohttp.ClientConnectionError as e:
+            pytest.skip(f"Qdrant not reachable: {e}")
+
+        report = bench_report("qdrant_tenancy")
+        report.note(
+            f"points_per_tenant={per_tenant} dim={dim} sample={sample_size} "
+            f"queries_per_tenant={queries_per} k={k} concurrency={concurrency} "
+            f"full_scan_threshold={full_scan_kb}KB"
+        )
+        rng = np.random.default_rng(3)
+        for tenants in tenant_counts:
+            sample = rng.choice(
+                tenants, size=min(sample_size, tenants), replace=False
+            ).tolist()
+            data = make_dataset(tenants * per_tenant, dim, len(sample) * queries_per)
+            layouts = ["shared"]
+            if tenants <= max_collections:
+                layouts.append("collections")
+            else:
+                report.note(f"tenants={tenants}: collections layout skipped")
+
+            for layout in layouts:
+                before = await memory_bytes(http)
+                start = time.perf_counter()
+                if layout == "shared":
+                    await _load_shared(http, data.vectors, tenants, full_scan_kb)
+                else:
+                    await _load_collections(
+                        http, data.vectors, tenants, full_scan_kb, concurrency
+                    )
+                ingest_s = time.perf_counter() - start
+                after = await memory_bytes(http)
+
+                samples, elapsed, recall = await _query(
+                    http,
+                    layout,
+                    data.vectors,
+                    data.queries,
+                    tenants,
+                    sample,
+                    k,
+                    concurrency,
+                )
+                lat = latency_summary(samples)
+                grown = after.get("memory_allocated_bytes", 0.0) - before.get(
+                    "memory_allocated_bytes", 0.0
+                )
+                report.add(
+                    tenants=tenants,
+                    layout=layout,
+                    points=len(data.vectors),
+                    ingest_s=round(ingest_s, 2),
+                    points_s=rate(len(data.vectors), ingest_s),
+                    mem_mb=round(max(0.0, grown) / 2**20, 1),
+                    rss_mb=round(after.get("memory_resident_bytes", 0.0) / 2**20, 1),
+                    qps=rate(len(samples), elapsed),
+                    p50_ms=lat["p50_ms"],
+                    p99_ms=lat["p99_ms"],
+                    recall=recall,
+                )
+                await _drop(http, layout, tenants, concurrency)
+
+    assert all(row["recall"] > 0 for row in report.rows), "tenant search missed"
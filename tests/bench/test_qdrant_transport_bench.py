@@ -0,0 +1,181 @@
+"""Qdrant REST vs gRPC benchmark: serialization cost, p99 and throughput.
+
+Loads the shared embedding dataset (`tests.utils.vectors`, configured by
+`VEC_*`) and then drives the same calls through `RestPoints` (JSON on 6333)
+and `GrpcPoints` (protobuf on 6334):
+
+- `search`: the query set as batched searches of each batch size
+- `upsert`: `wait=false` upserts of each batch size into a scratch collection
+- `scroll`: a full walk with vectors, one page per batch size
+
+Each row reports calls/sec, items/sec, p50/p99 call latency, the mean
+client-side encode and decode time per call and the mean request/response
+size, so JSON float encoding shows up next to the wire time. Search recall
+against exact ground truth confirms both transports do the same work.
+
+Knobs:
+
+- `QDRANT_TRANSPORT_K` (default 10)
+- `QDRANT_TRANSPORT_SEARCH_BATCHES` (default `1,16,64`): queries per call
+- `QDRANT_TRANSPORT_UPSERT_BATCHES` (default `64,256,1024`): points per call
+- `QDRANT_TRANSPORT_PAGES` (default `100,1000`): scroll page sizes
+- `QDRANT_TRANSPORT_UPSERT_POINTS` (default 20000): points upserted per run
+- `QDRANT_TRANSPORT_CONCURRENCY` (default 4): in-flight calls
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+import aiohttp
+import numpy as np
+import pytest
+from aiohttp import ClientSession, ClientTimeout
+
+from tests.utils.bench import env_int, env_ints, rate
+from tests.utils.qdrant import (
+    RestPoints,
+    count_points,
+    qdrant_request,
+    recreate_collection,
+    upsert_points,
+    wait_green,
+)
+from tests.utils.qdrant_grpc import GrpcPoints
+from tests.utils.vectors import dataset_from_env, ground_truth, recall_at_k
+
+COLLECTION = "bench_transport"
+SCRATCH = "bench_transport_upsert"
+
+
+async def _drive(
+    calls: list[Callable[[], Awaitable[object]]], concurrency: int
+) -> float:
+    pending = iter(calls)
+
+    async def worker() -> None:
+        for call in pending:
+            await call()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - start
+
+
+def _clients(
+    http: ClientSession, collection: str
+) -> list[tuple[str, Callable[[], RestPoints | GrpcPoints]]]:
+    return [
+        ("rest", lambda: RestPoints(http, collection)),
+        ("grpc", lambda: GrpcPoints(collection)),
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(0)
+async def test_qdrant_rest_vs_grpc(bench_report) -> None:
+    k = env_int("QDRANT_TRANSPORT_K", 10)
+    search_batches = env_ints("QDRANT_TRANSPORT_SEARCH_BATCHES", "1,16,64")
+    upsert_batches = env_ints("QDRANT_TRANSPORT_UPSERT_BATCHES", "64,256,1024")
+    pages = env_ints("QDRANT_TRANSPORT_PAGES", "100,1000")
+    concurrency = env_int("QDRANT_TRANSPORT_CONCURRENCY", 4)
+    data = dataset_from_env()
+    upsert_n = min(len(data.vectors), env_int("QDRANT_TRANSPORT_UPSERT_POINTS", 20_000))
+    truth = ground_truth(data.vectors, data.queries, k)
+    ids = np.arange(len(data.vectors), dtype=np.int64)
+    vectors_config = {"vectors": {"size": data.dim, "distance": "Cosine"}}
+
+    async with ClientSession(timeout=ClientTimeout(total=600)) as http:
+        try:
+            await qdrant_request(http, "GET", "collections")
+        except aiohttp.ClientConnectionError as e:
+            pytest.skip(f"Qdrant not reachable: {e}")
+        async with GrpcPoints(COLLECTION) as probe:
+            try:
+                await probe.ready()
+            except TimeoutError:
+                pytest.skip("Qdrant gRPC port not reachable")
+
+        await recreate_collection(http, COLLECTION, vectors_config)
+        await upsert_points(http, COLLECTION, ids, data.vectors, batch_size=1000)
+        await wait_green(http, COLLECTION)
+
+        report = bench_report("qdrant_transport")
+        report.note(
+            f"vectors={len(data.vectors)} dim={data.dim} queries={len(data.queries)} "
+            f"k={k} concurrency={concurrency}"
+        )
+
+        for transport, make in _clients(http, COLLECTION):
+            for batch in search_batches:
+                async with make() as client:
+                    found: list[list[int]] = [[] for _ in data.queries]
+
+                    async def search(lo: int) -> None:
+                        hits = await client.search(data.queries[lo : lo + batch], k)
+                        found[lo : lo + len(hits)] = hits
+
+                    calls = [
+                        lambda lo=lo: search(lo)
+                        for lo in range(0, len(data.queries), batch)
+                    ]
+                    elapsed = await _drive(calls, concurrency)
+                report.add(
+                    op="search",
+                    transport=transport,
+                    batch=batch,
+                    calls_s=rate(len(calls), elapsed),
+                    items_s=rate(len(data.queries), elapsed),
+                    recall=recall_at_k(found, truth, k),
+                    **client.timings.summary(),
+                )
+
+        for transport, make in _clients(http, SCRATCH):
+            for batch in upsert_batches:
+                await recreate_collection(http, SCRATCH, vectors_config)
+                async with make() as client:
+                    calls = [
+                        lambda lo=lo: client.upsert(
+                            ids, data.vectors, None, lo, min(lo + batch, upsert_n)
+                        )
+                        for lo in range(0, upsert_n, batch)
+                    ]
+                    elapsed = await _drive(calls, concurrency)
+                report.add(
+                    op="upsert",
+                    transport=transport,
+                    batch=batch,
+                    calls_s=rate(len(calls), elapsed),
+                    items_s=rate(upsert_n, elapsed),
+                    **client.timings.summary(),
+                )
+
+        for transport, make in _clients(http, COLLECTION):
+            for page in pages:
+                async with make() as client:
+                    seen = 0
+                    offset: int | None = None
+                    start = time.perf_counter()
+                    while True:
+                        result = await client.scroll(page, offset, with_vectors=True)
+                        seen += len(result.ids)
+                        if (offset := result.next_offset) is None:
+                            break
+                    elapsed = time.perf_counter() - start
+                assert seen == len(data.vectors), f"{transport} scrolled {seen}"
+                report.add(
+                    op="scroll",
+                    transport=transport,
+                    batch=page,
+                    calls_s=rate(len(client.timings.total), elapsed),
+                    items_s=rate(seen, elapsed),
+                    **client.timings.summary(),
+                )
+
+        assert await count_points(http, COLLECTION) == len(data.vectors)
+        for name in (COLLECTION, SCRATCH):
+            await qdrant_request(http, "DELETE", f"collections/{name}", ok=(404,))
+
+    assert all(row["recall"] > 0 for row in report.rows if row["op"] == "search"), (
+        "vector search returned nothing"
+    )
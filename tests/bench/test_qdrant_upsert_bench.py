@@ -0,0 +1,91 @@
+"""Qdrant bulk upsert benchmark: batch size x parallel `wait=false` workers.
+
+Generates clustered embeddings (`tests.utils.vectors.make_dataset`, dimension
+from `VEC_DIM`) with three payload columns (`category` int, `tag` keyword,
+`price` float) and loads them with `upsert_points` into a fresh collection for
+every (batch size, workers) combination. Reports points/sec, MB/sec, batch
+acknowledgement latency and the time the final `wait=true` batch took to
+confirm; the exact point count is checked afterwards.
+
+Knobs:
+
+- `QDRANT_UPSERT_POINTS` (default 200000)
+- `QDRANT_UPSERT_BATCHES` (default `256,1024,4096`): points per request
+- `QDRANT_UPSERT_WORKERS` (default `1,4,8`): in-flight requests
+
+Qdrant's own `/metrics` are sampled during each load next to the client's
+acknowledged-points counter and attached as `metrics.<batch>x<workers>`.
+"""
+
+import aiohttp
+import numpy as np
+import pytest
+from aiohttp import ClientSession, ClientTimeout
+
+from tests.utils.bench import env_int, env_ints
+from tests.utils.prom import MetricsSampler, default_targets
+from tests.utils.qdrant import (
+    UpsertResult,
+    count_points,
+    qdrant_request,
+    recreate_collection,
+    upsert_points,
+)
+from tests.utils.vectors import make_dataset
+
+COLLECTION = "bench_upsert"
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(0)
+async def test_qdrant_parallel_upsert(bench_report) -> None:
+    points = env_int("QDRANT_UPSERT_POINTS", 200_000)
+    batches = env_ints("QDRANT_UPSERT_BATCHES", "256,1024,4096")
+    workers = env_ints("QDRANT_UPSERT_WORKERS", "1,4,8")
+    dim = env_int("VEC_DIM", 128)
+
+    rng = np.random.default_rng(7)
+    vectors = make_dataset(points, dim, 0).vectors
+    ids = np.arange(points, dtype=np.int64)
+    payload = {
+        "category": rng.integers(0, 50, size=points),
+        "tag": np.array([f"tag-{i}" for i in range(100)])[rng.integers(0, 100, points)],
+        "price": rng.uniform(1, 500, size=points).round(2),
+    }
+
+    async with ClientSession(timeout=ClientTimeout(total=600)) as http:
+        try:
+            await qdrant_request(http, "GET", "collections")
+        except aiohttp.ClientConnectionError as e:
+            pytest.skip(f"Qdrant not reachable: {e}")
+
+        report = bench_report("qdrant_upsert")
+        report.note(f"points={points} dim={dim}")
+        for batch in batches:
+            for concurrency in workers:
+                await recreate_collection(
+                    http,
+                    COLLECTION,
+                    {"vectors": {"size": dim, "distance": "Cosine"}},
+                )
+                result = UpsertResult()
+                async with MetricsSampler(
+                    http,
+                    targets=[default_targets()["qdrant"]],
+                    client={"acked_points": lambda: result.points},
+                ) as sampler:
+                    await upsert_points(
+                        http,
+                        COLLECTION,
+                        ids,
+                        vectors,
+                        payload,
+                        batch_size=batch,
+                        concurrency=concurrency,
+                        result=result,
+                    )
+                sampler.attach(report, f"metrics.{batch}x{concurrency}")
+                count = await count_points(http, COLLECTION)
+                assert count == points, f"stored {count}/{points} points"
+                report.add(batch=batch, workers=concurrency, **result.summary())
+        await qdrant_request(http, "DELETE", f"collections/{COLLECTION}", ok=(404,))
@@ -0,0 +1,141 @@
+"""Spanner emulator REST (9020) benchmark: partitioned vs single-stream reads.
+
+Seeds a GoogleSQL table through REST `commit` mutations (or `batchWrite`),
+then reads it back:
+
+- `single_stream`: one `executeStreamingSql` over the whole table
+- `partitioned`: `partitionQuery` in a strong read-only transaction, with the
+  partitions executed in parallel through a bounded pool of sessions
+
+Knobs:
+
+- `SPANNER_REST_ROWS` (default 50000)
+- `SPANNER_REST_POOLS` (default `1,4,8`): concurrent partition readers
+- `SPANNER_REST_MAX_PARTITIONS` (default 16)
+- `SPANNER_REST_WRITE` (default `commit`): `commit` or `batch_write`
+"""
+
+import asyncio
+import os
+import time
+
+import pytest
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+
+from tests.utils.bench import env_int, env_ints, rate
+from tests.utils.http import HttpError
+from tests.utils.spanner_rest import SpannerRestClient, mutation
+
+TABLE = "RestBench"
+COLUMNS = ["Id", "Name", "Score"]
+DDL = [
+    f"CREATE TABLE {TABLE} (Id INT64 NOT NULL, Name STRING(64), Score FLOAT64) "
+    "PRIMARY KEY (Id)"
+]
+SQL = f"SELECT Id, Name, Score FROM {TABLE}"
+WRITE_BATCH = 2000  # 3 columns -> 6k mutations, well under the 80k limit
+
+
+async def _seed(client: SpannerRestClient, session: str, rows: int, how: str) -> float:
+    batches = [
+        [[i, f"name-{i}", i / 7.0] for i in range(lo, min(lo + WRITE_BATCH, rows))]
+        for lo in range(0, rows, WRITE_BATCH)
+    ]
+    start = time.perf_counter()
+    if how == "batch_write":
+        groups = [[mutation("insertOrUpdate", TABLE, COLUMNS, b)] for b in batches]
+        for resp in await client.batch_write(session, groups):
+            status = resp.get("status", {})
+            assert status.get("code", 0) == 0, f"batchWrite group failed: {status}"
+    else:
+        for b in batches:
+            await client.commit_mutations(
+                session, [mutation("insertOrUpdate", TABLE, COLUMNS, b)]
+            )
+    return time.perf_counter() - start
+
+
+async def _single_stream(client: SpannerRestClient, session: str) -> int:
+    return sum([1 async for _ in client.execute_streaming_sql(session, SQL)])
+
+
+async def _partitioned(
+    client: SpannerRestClient, sessions: list[str], max_partitions: int
+) -> tuple[int, int]:
+    tx_id, tokens = await client.partition_query(sessions[0], SQL, max_partitions)
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    for token in tokens:
+        queue.put_nowait(token)
+    counts: list[int] = []
+
+    async def reader(session: str) -> None:
+        while not queue.empty():
+            token = queue.get_nowait()
+            n = 0
+            async for _ in client.execute_streaming_sql(
+                session, SQL, transaction={"id": tx_id}, partitionToken=token
+            ):
+                n += 1
+            counts.append(n)
+
+    await asyncio.gather(*(reader(s) for s in sessions))
+    return sum(counts), len(tokens)
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(0)
+async def test_spanner_rest_partitioned_vs_single_stream(bench_report) -> None:
+    rows = env_int("SPANNER_REST_ROWS", 50_000)
+    pools = env_ints("SPANNER_REST_POOLS", "1,4,8")
+    max_partitions = env_int("SPANNER_REST_MAX_PARTITIONS", 16)
+    write_mode = os.environ.get("SPANNER_REST_WRITE", "commit")
+
+    timeout = ClientTimeout(total=600)
+    connector = TCPConnector(limit=max(pools) + 2)
+    async with ClientSession(timeout=timeout, connector=connector) as http:
+        client = SpannerRestClient(
+            http, project=os.environ.get("PROJECT_ID", "test-project")
+        )
+        try:
+            await client.ensure_instance()
+        except (OSError, HttpError) as e:
+            pytest.skip(f"Spanner REST endpoint unavailable: {e}")
+        await client.recreate_database(DDL)
+
+        sessions = [await client.create_session() for _ in range(max(pools))]
+        report = bench_report("spanner_rest_reads")
+        try:
+            seed_s = await _seed(client, sessions[0], rows, write_mode)
+            report.note(
+                f"seeded {rows} rows via {write_mode}: {rate(rows, seed_s)} rows/s"
+            )
+
+            start = time.perf_counter()
+            n = await _single_stream(client, sessions[0])
+            seconds = time.perf_counter() - start
+            assert n == rows, f"single stream read {n}/{rows} rows"
+            report.add(
+                mode="single_stream",
+                pool=1,
+                partitions=1,
+                rows=n,
+                seconds=round(seconds, 3),
+                rows_s=rate(n, seconds),
+            )
+
+            for pool in pools:
+                start = time.perf_counter()
+                n, parts = await _partitioned(client, sessions[:pool], max_partitions)
+                seconds = time.perf_counter() - start
+                assert n == rows, f"partitioned read {n}/{rows} rows"
+                report.add(
+                    mode="partitioned",
+                    pool=pool,
+                    partitions=parts,
+                    rows=n,
+                    seconds=round(seconds, 3),
+                    rows_s=rate(n, seconds),
+                )
+        finally:
+            for s in sessions:
+                await client.delete_session(s)
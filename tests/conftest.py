@@ -5,17 +5,38 @@ Intentional separation:
   `tests/e2e/conftest.py` on purpose to keep unit/integration runs lightweight
   and free from Docker imports.
 - Do not move that file here unless you also change its path-based scoping.
+- The one exception is `docker_client`, shared by e2e tests and benchmarks;
+  it imports `docker` lazily and skips when the daemon is unreachable.
 
 Shared, fast fixtures for unit/integration tests live here.
 """
 
 from pathlib import Path
+import asyncio
 import os
+import aiohttp
+import asyncpg
 import pytest
 import pytest_asyncio
 from aiohttp import ClientSession, ClientTimeout, TCPConnector
 from dotenv import load_dotenv
 
+from tests.utils.es import (
+    SEED_INDEX,
+    create_snapshot,
+    ensure_fs_repository,
+    restore_snapshot,
+    seed_corpus,
+    seed_snapshot_name,
+    snapshot_exists,
+)
+from tests.utils.http import HttpError
+from tests.utils.pg_template import TemplateClones, template_name
+from tests.utils.postgres import conn_params
+
+# Opt-in per-test pg_stat_statements capture (`--pg-stats` / PG_STATS=1)
+pytest_plugins = ["tests.utils.pg_stats"]
+
 
 def pytest_sessionstart(session: pytest.Session) -> None:
     """Load environment variables early for local runs.
@@ -29,6 +50,19 @@ def pytest_sessionstart(session: pytest.Session) -> None:
             load_dotenv(dotenv_path=env_path, override=False)
 
 
+@pytest.fixture(scope="session")
+def docker_client():
+    """Shared Docker client or skip if unavailable."""
+    try:
+        import docker  # type: ignore
+
+        client = docker.from_env()
+        client.ping()
+        return client
+    except Exception as e:  # pragma: no cover - env dependent
+        pytest.skip(f"docker not available: {e}")
+
+
 @pytest.fixture(scope="session")
 def project_id() -> str:
     """Common project id used by local emulators/tests."""
@@ -42,3 +76,64 @@ async def http_client() -> ClientSession:
     connector = TCPConnector(force_close=True)
     async with ClientSession(timeout=timeout, connector=connector) as session:
         yield session
+
+
+@pytest.fixture(scope="session")
+def pg_template() -> TemplateClones:
+    """Seeded PostgreSQL template database, prepared once per session/worker."""
+    clones = TemplateClones(template_name())
+    try:
+        asyncio.run(clones.prepare())
+    except (OSError, asyncpg.PostgresError) as e:
+        pytest.skip(f"postgres template unavailable: {e}")
+    yield clones
+    clones.close()
+
+
+@pytest_asyncio.fixture()
+async def pg_clone_db(pg_template: TemplateClones) -> str:
+    """Name of an isolated database cloned from `pg_template` (dropped in background)."""
+    name = await pg_template.clone()
+    yield name
+    pg_template.drop_later(name)
+
+
+@pytest_asyncio.fixture()
+async def pg_conn(pg_clone_db: str) -> asyncpg.Connection:
+    """Connection to this test's cloned database."""
+    conn = await asyncpg.connect(**{**conn_params(), "database": pg_clone_db})
+    yield conn
+    await conn.close()
+
+
+@pytest.fixture(scope="session")
+def es_seed_snapshot() -> str:
+    """Snapshot of the seeded Elasticsearch corpus index.
+
+    Taken once and reused across runs while `ES_SEED_DOCS`, the corpus
+    generator and its mapping are unchanged (see `seed_snapshot_name`);
+    tests get their own copy through `es_seeded_index`.
+    """
+    docs = int(os.environ.get("ES_SEED_DOCS", "20000"))
+    snapshot = seed_snapshot_name(docs)
+
+    async def prepare() -> None:
+        async with ClientSession(timeout=ClientTimeout(total=600)) as http:
+            await ensure_fs_repository(http)
+            if not await snapshot_exists(http, snapshot):
+                await seed_corpus(http, SEED_INDEX, docs)
+                await create_snapshot(http, snapshot, [SEED_INDEX])
+
+    try:
+        asyncio.run(prepare())
+    except (aiohttp.ClientConnectionError, HttpError) as e:
+        pytest.skip(f"elasticsearch seed snapshot unavailable: {e}")
+    return snapshot
+
+
+@pytest_asyncio.fixture()
+async def es_seeded_index(es_seed_snapshot: str) -> str:
+    """Name of the seeded corpus index, restored fresh from snapshot for this test."""
+    async with ClientSession(timeout=ClientTimeout(total=120)) as http:
+        await restore_snapshot(http, es_seed_snapshot, [SEED_INDEX])
+    yield SEED_INDEX
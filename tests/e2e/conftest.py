@@ -1,6 +1,6 @@
 """Common e2e test fixtures for Docker-based scenarios.
 
-- Provides a shared `docker_client` with ping/skip handling.
+- Uses the shared `docker_client` from `tests/conftest.py`.
 - Ensures emulator Docker network and required services are present.
 - Helpers to build images and run CLI commands inside containers.
 """
@@ -38,19 +38,6 @@ def e2e_network_name() -> str:
     return os.environ.get("EMULATOR_NETWORK", "emulator-network")
 
 
-@pytest.fixture(scope="session")
-def docker_client():
-    """Shared Docker client or skip if unavailable."""
-    try:
-        import docker  # type: ignore
-
-        client = docker.from_env()
-        client.ping()
-        return client
-    except Exception as e:  # pragma: no cover - env dependent
-        pytest.skip(f"docker not available: {e}")
-
-
 @pytest.fixture
 def ensure_network(docker_client, e2e_network_name: str) -> Callable[[], None]:
     """Return a callable that skips if the emulator network is missing."""
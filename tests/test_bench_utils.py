@@ -0,0 +1,40 @@
+from pathlib import Path
+
+from tests.utils.bench import BenchReport, latency_summary, rate
+
+
+def test_latency_summary_percentiles_in_ms() -> None:
+    samples = [i / 1000.0 for i in range(1, 101)]  # 1..100 ms
+    summary = latency_summary(samples)
+    assert summary["n"] == 100
+    assert summary["p50_ms"] == 50.5
+    assert summary["max_ms"] == 100.0
+    assert summary["p99_ms"] > summary["p95_ms"] > summary["p50_ms"]
+
+
+def test_latency_summary_handles_empty_and_single() -> None:
+    assert latency_summary([])["n"] == 0
+    single = latency_summary([0.002])
+    assert single["p50_ms"] == single["p99_ms"] == 2.0
+
+
+def test_rate_guards_zero_elapsed() -> None:
+    assert rate(10, 0) == 0.0
+    assert rate(10, 4) == 2.5
+
+
+def test_bench_report_render_and_json(tmp_path: Path) -> None:
+    report = BenchReport(name="demo")
+    report.add(mode="a", qps=1.5)
+    report.add(mode="bb", qps=20.0, extra=1)
+    report.note("hello")
+    report.attach("plan", "Seq Scan on t")
+    lines = report.render()
+    assert lines[0] == "== demo =="
+    assert lines[1].split() == ["mode", "qps", "extra"]
+    assert lines[-2] == "note: hello"
+    assert lines[-1].startswith("artifacts: 1")
+    path = report.write_json(tmp_path)
+    assert path.read_text().count('"mode"') == 2
+    assert "Seq Scan on t" in path.read_text()
+    assert (tmp_path / "demo.plan.txt").read_text() == "Seq Scan on t"
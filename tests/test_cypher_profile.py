@@ -0,0 +1,79 @@
+import pytest
+
+from tests.utils.cypher_profile import (
+    QueryProfile,
+    compare,
+    drop_statement,
+    operator_tree,
+    plan_shape,
+    profile_totals,
+    render_plan_diff,
+)
+
+PROFILE = {
+    "operatorType": "ProduceResults@neo4j",
+    "rows": 1,
+    "dbHits": 0,
+    "pageCacheHits": 1,
+    "pageCacheMisses": 0,
+    "children": [
+        {
+            "operatorType": "NodeIndexSeek@neo4j",
+            "rows": 1,
+            "dbHits": 2,
+            "pageCacheHits": 3,
+            "pageCacheMisses": 1,
+            "args": {"Details": "UNIQUE p:Person(id) WHERE id = $id"},
+            "children": [],
+        }
+    ],
+}
+
+
+def test_drop_statement_handles_index_kinds() -> None:
+    assert (
+        drop_statement("CREATE TEXT INDEX idx_name IF NOT EXISTS FOR (n:A) ON (n.x)")
+        == "DROP INDEX idx_name IF EXISTS"
+    )
+    assert (
+        drop_statement("create constraint c1 for (n:A) require n.id is unique")
+        == "DROP CONSTRAINT c1 IF EXISTS"
+    )
+    with pytest.raises(ValueError):
+        drop_statement("CREATE INDEX FOR (n:A) ON (n.x)")
+
+
+def test_profile_totals_and_tree() -> None:
+    assert profile_totals(PROFILE) == {
+        "rows": 1,
+        "db_hits": 2,
+        "page_hits": 4,
+        "page_misses": 1,
+    }
+    assert operator_tree(PROFILE) == [
+        "ProduceResults rows=1 db_hits=0",
+        "  NodeIndexSeek rows=1 db_hits=2  UNIQUE p:Person(id) WHERE id = $id",
+    ]
+    assert plan_shape(PROFILE) == ["ProduceResults", "NodeIndexSeek"]
+
+
+def test_compare_flags_plan_changes() -> None:
+    scan = QueryProfile(
+        "q",
+        {"rows": 1, "db_hits": 40, "page_hits": 0, "page_misses": 0},
+        ["ProduceResults", "  NodeByLabelScan"],
+        ["ProduceResults", "NodeByLabelScan"],
+        8.0,
+    )
+    seek = QueryProfile(
+        "q",
+        {"rows": 1, "db_hits": 2, "page_hits": 0, "page_misses": 0},
+        ["ProduceResults", "  NodeIndexSeek"],
+        ["ProduceResults", "NodeIndexSeek"],
+        2.0,
+    )
+    (row,) = compare([scan], [seek])
+    assert row["speedup"] == 4.0
+    assert row["plan_changed"] is True
+    diff = render_plan_diff([scan], [seek])
+    assert "-  NodeByLabelScan" in diff and "+  NodeIndexSeek" in diff
@@ -1,6 +1,10 @@
+import os
+
 import pytest
 import docker
 
+from tests.utils.es import es_request
+
 
 @pytest.mark.asyncio
 async def test_elasticsearch_container_starts(http_client):
@@ -36,3 +40,24 @@ async def test_elasticsearch_container_starts(http_client):
     assert health_data["status"] in ["green", "yellow"], (
         f"Elasticsearch cluster is not healthy: {health_data['status']}"
     )
+
+
+@pytest.mark.asyncio
+async def test_elasticsearch_seeded_index_is_restored_per_test(
+    http_client, es_seeded_index
+):
+    """The snapshot-backed fixture hands out a complete, writable copy."""
+    expected = int(os.environ.get("ES_SEED_DOCS", "20000"))
+    count = await es_request(http_client, "GET", f"{es_seeded_index}/_count")
+    assert count["count"] == expected
+
+    # Mutations stay local to this test; the next restore brings them back.
+    await es_request(
+        http_client,
+        "POST",
+        f"{es_seeded_index}/_delete_by_query",
+        {"query": {"term": {"category": "cat-0"}}},
+        refresh=True,
+    )
+    count = await es_request(http_client, "GET", f"{es_seeded_index}/_count")
+    assert count["count"] < expected
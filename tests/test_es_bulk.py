@@ -0,0 +1,76 @@
+import json
+
+from tests.utils.es import (
+    AdaptiveBackoff,
+    chunk_actions,
+    index_actions,
+    seed_snapshot_name,
+    split_bulk_items,
+)
+
+
+def test_index_actions_are_ndjson_pairs() -> None:
+    (action,) = index_actions("idx", [{"id": 7, "t": "x"}], id_field="id")
+    meta, source, tail = action.decode().split("\n")
+    assert json.loads(meta) == {"index": {"_index": "idx", "_id": "7"}}
+    assert json.loads(source) == {"id": 7, "t": "x"}
+    assert tail == ""
+
+
+def test_chunk_actions_respects_count_and_bytes() -> None:
+    actions = [b"x" * 10] * 7
+    assert [len(c) for c in chunk_actions(actions, max_docs=3)] == [3, 3, 1]
+    assert [len(c) for c in chunk_actions(actions, max_docs=10, max_bytes=25)] == [
+        2,
+        2,
+        2,
+        1,
+    ]
+    # Oversized actions still go out, alone.
+    assert [len(c) for c in chunk_actions([b"y" * 50, b"z"], max_bytes=20)] == [1, 1]
+
+
+def test_split_bulk_items_retries_429_and_collects_errors() -> None:
+    chunk = [b"a", b"b", b"c"]
+    items = [
+        {"index": {"_id": "1", "status": 201}},
+        {"index": {"_id": "2", "status": 429, "error": {"type": "es_rejected"}}},
+        {
+            "index": {
+                "_id": "3",
+                "status": 400,
+                "error": {"type": "mapper_parsing_exception", "reason": "bad"},
+            }
+        },
+    ]
+    retry, errors = split_bulk_items(chunk, items)
+    assert retry == [b"b"]
+    assert errors == [
+        {
+            "op": "index",
+            "_id": "3",
+            "status": 400,
+            "type": "mapper_parsing_exception",
+            "reason": "bad",
+        }
+    ]
+
+
+def test_adaptive_backoff_grows_and_decays() -> None:
+    b = AdaptiveBackoff(initial=0.1, maximum=0.3)
+    b.throttled()
+    b.throttled()
+    b.throttled()
+    assert b.delay == 0.3
+    b.succeeded()
+    assert b.delay == 0.15
+    b.succeeded()
+    b.succeeded()
+    assert b.delay == 0.0
+
+
+def test_seed_snapshot_name_is_versioned() -> None:
+    name = seed_snapshot_name(500)
+    assert name.startswith("seed-articles-500-")
+    assert seed_snapshot_name(500) == name
+    assert seed_snapshot_name(500, shards=2) != name
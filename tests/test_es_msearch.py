@@ -0,0 +1,102 @@
+import asyncio
+import json
+
+import pytest
+import pytest_asyncio
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
+
+from tests.utils.es import MsearchBatcher, SearchTimings, msearch_payload
+from tests.utils.http import HttpError
+
+
+def test_msearch_payload_alternates_header_and_body() -> None:
+    payload = msearch_payload([("a", {"size": 1}), ("b", {"query": {"match_all": {}}})])
+    lines = payload.decode().split("\n")
+    assert [json.loads(line) for line in lines[:-1]] == [
+        {"index": "a"},
+        {"size": 1},
+        {"index": "b"},
+        {"query": {"match_all": {}}},
+    ]
+    assert lines[-1] == ""
+
+
+def test_search_timings_separate_server_and_overhead() -> None:
+    t = SearchTimings()
+    t.record(4, 0.010)
+    t.record(6, 0.010)
+    s = t.summary()
+    assert s["queries"] == 2
+    assert s["took_p50_ms"] == 5.0
+    assert s["client_p50_ms"] == 10.0
+    assert s["overhead_p50_ms"] == 5.0
+
+
+@pytest_asyncio.fixture()
+async def msearch_server(monkeypatch: pytest.MonkeyPatch):
+    """Fake `_msearch` endpoint; set `server.reply(searches) -> (status, body)`."""
+
+    async def handle(request: web.Request) -> web.Response:
+        lines = (await request.text()).strip().split("\n")
+        searches = [json.loads(line) for line in lines[1::2]]
+        status, body = server.reply(searches)
+        return web.json_response(body, status=status)
+
+    app = web.Application()
+    app.router.add_post("/_msearch", handle)
+    server = TestServer(app)
+    await server.start_server()
+    monkeypatch.setenv("ELASTICSEARCH_HOST", server.host)
+    monkeypatch.setenv("ELASTICSEARCH_PORT", str(server.port))
+    yield server
+    await server.close()
+
+
+async def _search_all(bodies: list[dict]) -> list[object]:
+    async with ClientSession() as http:
+        async with MsearchBatcher(http, max_batch=len(bodies)) as batcher:
+            return await asyncio.wait_for(
+                asyncio.gather(
+                    *(batcher.search("idx", b) for b in bodies), return_exceptions=True
+                ),
+                5,
+            )
+
+
+@pytest.mark.asyncio
+async def test_msearch_batcher_maps_responses_and_item_errors(msearch_server) -> None:
+    def reply(searches: list[dict]) -> tuple[int, dict]:
+        responses = [
+            {"error": {"type": "boom"}, "status": 400}
+            if s["size"] == 1
+            else {"took": 1, "hits": {"total": s["size"]}}
+            for s in searches
+        ]
+        return 200, {"responses": responses}
+
+    msearch_server.reply = reply
+    ok, failed, other = await _search_all([{"size": 0}, {"size": 1}, {"size": 2}])
+    assert ok["hits"]["total"] == 0 and other["hits"]["total"] == 2
+    assert isinstance(failed, HttpError) and failed.status == 400
+
+
+@pytest.mark.asyncio
+async def test_msearch_batcher_fails_searches_missing_from_response(
+    msearch_server,
+) -> None:
+    msearch_server.reply = lambda searches: (200, {"responses": [{"took": 1}]})
+    first, second, third = await _search_all([{"size": 0}] * 3)
+    assert first == {"took": 1}
+    for missing in (second, third):
+        assert isinstance(missing, HttpError)
+        assert "1 responses for 3 searches" in str(missing)
+
+
+@pytest.mark.asyncio
+async def test_msearch_batcher_fails_every_search_on_request_error(
+    msearch_server,
+) -> None:
+    msearch_server.reply = lambda searches: (503, {"error": "unavailable"})
+    results = await _search_all([{"size": 0}] * 2)
+    assert all(isinstance(r, HttpError) and r.status == 503 for r in results)
@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+
+from tests.utils.http import run_workers
+
+
+@pytest.mark.asyncio
+async def test_run_workers_handles_every_item_with_bounded_lookahead() -> None:
+    pulled: list[int] = []
+    done: list[int] = []
+
+    def items():
+        for i in range(20):
+            pulled.append(i)
+            yield i
+
+    async def handle(i: int) -> None:
+        # Queued (2 * concurrency) + in flight + the one being put.
+        assert len(pulled) - len(done) <= 7
+        await asyncio.sleep(0)
+        done.append(i)
+
+    await run_workers(items(), handle, concurrency=2)
+    assert sorted(done) == list(range(20))
+
+
+@pytest.mark.asyncio
+async def test_run_workers_stops_and_raises_first_failure() -> None:
+    pulled: list[int] = []
+
+    def items():
+        for i in range(1000):
+            pulled.append(i)
+            yield i
+
+    async def handle(i: int) -> None:
+        await asyncio.sleep(0)
+        if i == 3:
+            raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await run_workers(items(), handle, concurrency=2)
+    assert len(pulled) < 20
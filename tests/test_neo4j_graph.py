@@ -0,0 +1,17 @@
+from tests.utils.neo4j_graph import batched, node_merge_query, rel_merge_query
+
+
+def test_batched_streams_fixed_size_chunks() -> None:
+    rows = ({"id": i} for i in range(7))
+    assert [len(b) for b in batched(rows, 3)] == [3, 3, 1]
+    assert list(batched([], 3)) == []
+
+
+def test_merge_queries_unwind_on_key() -> None:
+    assert node_merge_query("Person", "id") == (
+        "UNWIND $rows AS row MERGE (n:Person {id: row.id}) SET n += row"
+    )
+    q = rel_merge_query("Person", "City", "LIVES_IN", "id")
+    assert "MATCH (a:Person {id: row.src})" in q
+    assert "MATCH (b:City {id: row.dst})" in q
+    assert q.endswith("MERGE (a)-[r:LIVES_IN]->(b) SET r += row.props")
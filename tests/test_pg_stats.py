@@ -0,0 +1,40 @@
+from tests.utils.pg_stats import Snapshot, diff_snapshots, format_diff
+
+
+def _stmt(calls: float, time_ms: float, rows: float, hit: float) -> dict[str, float]:
+    return {
+        "calls": calls,
+        "total_exec_time": time_ms,
+        "rows": rows,
+        "shared_blks_hit": hit,
+        "shared_blks_read": 0.0,
+    }
+
+
+def test_diff_snapshots_keeps_only_executed_statements() -> None:
+    a, b, c = (10, 5, 1, True), (10, 5, 2, True), (10, 5, 3, True)
+    io = {"reads": 0.0, "writes": 0.0, "extends": 0.0, "hits": 100.0, "evictions": 0.0}
+    before = Snapshot(
+        statements={a: _stmt(1, 2.0, 1, 10), b: _stmt(3, 9.0, 3, 30)},
+        io=io,
+        texts={a: "SELECT 1", b: "SELECT 2"},
+    )
+    after = Snapshot(
+        statements={
+            a: _stmt(1, 2.0, 1, 10),  # untouched during the test
+            b: _stmt(5, 10.0, 8, 31),
+            c: _stmt(2, 40.0, 0, 7),  # first seen during the test
+        },
+        io={**io, "hits": 160.0},
+        texts={a: "SELECT 1", b: "SELECT 2", c: "UPDATE t SET x = $1"},
+    )
+    diff = diff_snapshots(before, after)
+    queries = [d["query"] for d in diff["statements"]]
+    assert queries == ["UPDATE t SET x = $1", "SELECT 2"]
+    assert diff["statements"][1]["rows"] == 5
+    assert diff["io"]["hits"] == 60
+
+    text = format_diff(diff)
+    assert text.splitlines()[0].startswith("io: ")
+    assert "top by rows:" in text
+    assert "UPDATE t SET x = $1" in text
@@ -0,0 +1,19 @@
+import pytest
+
+from tests.utils.pgadapter import _csv_stream, rows_per_commit
+
+
+def test_rows_per_commit_respects_mutation_limit() -> None:
+    assert rows_per_commit(4) == 20_000
+    assert rows_per_commit(4, secondary_indexes=1) == 10_000
+    assert rows_per_commit(100, limit=50) == 1
+
+
+@pytest.mark.asyncio
+async def test_csv_stream_encodes_blocks_and_counts_rows() -> None:
+    rows = iter([(1, "a,b", None), (2, 'q"t', 1.5), (3, "x", 0)])
+    sent = [0]
+    blocks = [b async for b in _csv_stream(rows, sent, block=2)]
+    assert len(blocks) == 2
+    assert sent == [3]
+    assert b"".join(blocks).decode() == '1,"a,b",\n2,"q""t",1.5\n3,x,0\n'
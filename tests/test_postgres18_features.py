@@ -2,7 +2,7 @@ import re
 
 import pytest
 
-from tests.utils.postgres import connect, ensure_generated_table
+from tests.utils.postgres import connect, generated_kind
 
 
 UUID_V7_RE = re.compile(
@@ -36,15 +36,12 @@ async def test_uuidv7_exists_and_returns_valid_uuid() -> None:
 
 
 @pytest.mark.asyncio
-async def test_generated_column_virtual_or_stored_behaves() -> None:
-    conn = await connect()
-    try:
-        kind = await ensure_generated_table(conn, "pg18_gen_test_py")
-        assert kind in {"v", "s"}, f"unexpected attgenerated kind: {kind!r}"
-
-        await conn.execute("INSERT INTO pg18_gen_test_py(x) VALUES (5);")
-        row = await conn.fetchrow("SELECT x, y FROM pg18_gen_test_py LIMIT 1;")
-        assert row["x"] == 5
-        assert row["y"] == 10
-    finally:
-        await conn.close()
+async def test_generated_column_virtual_or_stored_behaves(pg_conn) -> None:
+    # pg18_gen_test_py is seeded in the template; each clone starts empty.
+    kind = await generated_kind(pg_conn, "pg18_gen_test_py")
+    assert kind in {"v", "s"}, f"unexpected attgenerated kind: {kind!r}"
+
+    await pg_conn.execute("INSERT INTO pg18_gen_test_py(x) VALUES (5);")
+    row = await pg_conn.fetchrow("SELECT x, y FROM pg18_gen_test_py LIMIT 1;")
+    assert row["x"] == 5
+    assert row["y"] == 10
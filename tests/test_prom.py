@@ -0,0 +1,68 @@
+import json
+import math
+
+import pytest
+
+from tests.utils.prom import SeriesStore, iter_samples, parse_sample
+
+
+def test_parse_sample_handles_labels_comments_and_specials() -> None:
+    assert parse_sample("# HELP x y") is None
+    assert parse_sample("") is None
+    assert parse_sample("up 1") == ("up", "", 1.0)
+    assert parse_sample('m{a="x y",b="}{"} 2.5 1700000000') == (
+        "m",
+        '{a="x y",b="}{"}',
+        2.5,
+    )
+    name, labels, value = parse_sample(r'm{a="q\"}"} +Inf')
+    assert (name, labels, value) == ("m", r'{a="q\"}"}', math.inf)
+    assert math.isnan(parse_sample("m NaN")[2])
+
+
+@pytest.mark.asyncio
+async def test_iter_samples_across_chunk_boundaries() -> None:
+    text = b'# TYPE a counter\na_total{x="1"} 3\nb 4\nc 5'
+
+    async def chunks():
+        for i in range(0, len(text), 7):
+            yield text[i : i + 7]
+
+    assert [s async for s in iter_samples(chunks())] == [
+        ("a_total", '{x="1"}', 3.0),
+        ("b", "", 4.0),
+        ("c", "", 5.0),
+    ]
+
+
+def test_series_store_aligns_late_series_and_summarises() -> None:
+    store = SeriesStore()
+    store.tick(100.0)
+    store.set("client:docs", 0)
+    store.tick(101.0)
+    store.set("client:docs", 500)
+    store.set("es:rejected", 1)
+    store.tick(102.0)
+    store.set("client:docs", 800)
+    assert len(store.series["es:rejected"]) == 3
+    assert math.isnan(store.series["es:rejected"][0])
+    (row,) = store.summary()
+    assert row == {
+        "series": "client:docs",
+        "first": 0,
+        "last": 800,
+        "peak_rate_s": 500.0,
+    }
+    doc = json.loads(store.to_json())
+    assert doc["t"] == [0.0, 1.0, 2.0]
+    assert doc["series"]["es:rejected"] == [None, 1.0, None]
+
+
+def test_series_store_summary_without_time_delta() -> None:
+    store = SeriesStore()
+    store.tick(100.0)
+    store.set("client:docs", 0)
+    store.tick(100.0)
+    store.set("client:docs", 5)
+    (row,) = store.summary()
+    assert row["peak_rate_s"] == 0.0
@@ -0,0 +1,122 @@
+import json
+
+import numpy as np
+import pytest
+
+from tests.utils.qdrant import (
+    CallTimings,
+    ScrollPage,
+    UpsertResult,
+    export_vectors,
+    id_ranges,
+    point_batch,
+    scroll_points,
+)
+from tests.utils.qdrant_grpc import upsert_request
+
+
+def test_point_batch_is_column_oriented_slice() -> None:
+    ids = np.arange(5, dtype=np.int64)
+    vectors = np.arange(10, dtype=np.float32).reshape(5, 2)
+    payload = {"cat": np.array([1, 2, 3, 4, 5]), "tag": np.array(list("abcde"))}
+    body = json.loads(point_batch(ids, vectors, payload, 3, 5))
+    assert body == {
+        "batch": {
+            "ids": [3, 4],
+            "vectors": [[6.0, 7.0], [8.0, 9.0]],
+            "payloads": [{"cat": 4, "tag": "d"}, {"cat": 5, "tag": "e"}],
+        }
+    }
+    assert "payloads" not in json.loads(point_batch(ids, vectors, None, 0, 1))["batch"]
+
+
+def test_upsert_result_summary() -> None:
+    result = UpsertResult(
+        points=2000, bytes=2**20, batches=2, seconds=2.0, confirm_seconds=0.0125
+    )
+    result.batch_latencies += [0.01, 0.03]
+    summary = result.summary()
+    assert summary["points_s"] == 1000.0
+    assert summary["mb_s"] == 0.5
+    assert summary["confirm_ms"] == 12.5
+
+
+@pytest.mark.asyncio
+async def test_call_timings_timed_records_bytes_and_phases() -> None:
+    async def send(data: bytes) -> bytes:
+        return data * 2
+
+    timings = CallTimings()
+    out = await timings.timed(lambda: b"abc", send, bytes.decode)
+    assert out == "abcabc"
+    assert (timings.bytes_out, timings.bytes_in) == (3, 6)
+    assert len(timings.encode) == len(timings.decode) == len(timings.total) == 1
+
+
+def test_grpc_upsert_request_matches_rest_batch() -> None:
+    ids = np.arange(4, dtype=np.int64)
+    vectors = np.arange(8, dtype=np.float32).reshape(4, 2)
+    payload = {"cat": np.array([1, 2, 3, 4]), "tag": np.array(list("abcd"))}
+    request = upsert_request("c", ids, vectors, payload, 1, 3, wait=True)
+    rest = json.loads(point_batch(ids, vectors, payload, 1, 3))["batch"]
+    assert request.wait and request.collection_name == "c"
+    assert [p.id.num for p in request.points] == rest["ids"]
+    assert [list(p.vectors.vector.dense.data) for p in request.points] == rest[
+        "vectors"
+    ]
+    assert [
+        {"cat": p.payload["cat"].integer_value, "tag": p.payload["tag"].string_value}
+        for p in request.points
+    ] == rest["payloads"]
+
+
+class _MemoryPoints:
+    """In-memory stand-in with `RestPoints.scroll` semantics (id order)."""
+
+    def __init__(self, vectors: np.ndarray) -> None:
+        self.vectors = vectors
+        self.calls: list[int | None] = []
+
+    async def scroll(
+        self, limit: int, offset: int | None = None, with_vectors: bool = False
+    ) -> ScrollPage:
+        self.calls.append(offset)
+        lo = offset or 0
+        hi = min(lo + limit, len(self.vectors))
+        return ScrollPage(
+            ids=list(range(lo, hi)),
+            vectors=self.vectors[lo:hi].tolist() if with_vectors else None,
+            next_offset=hi if hi < len(self.vectors) else None,
+        )
+
+
+def test_id_ranges_cover_span() -> None:
+    assert id_ranges(0, 10, 3) == [(0, 4), (4, 8), (8, 10)]
+    assert id_ranges(5, 6, 4) == [(5, 6)]
+
+
+@pytest.mark.asyncio
+async def test_scroll_points_follows_offsets_and_ranges() -> None:
+    client = _MemoryPoints(np.zeros((25, 2), dtype=np.float32))
+    pages = [p.ids async for p in scroll_points(client, limit=10, prefetch=False)]
+    assert pages == [list(range(0, 10)), list(range(10, 20)), list(range(20, 25))]
+    assert client.calls == [None, 10, 20]
+
+    ids = [
+        i
+        async for p in scroll_points(client, limit=4, ranges=id_ranges(0, 25, 3))
+        for i in p.ids
+    ]
+    assert sorted(ids) == list(range(25))
+
+
+@pytest.mark.asyncio
+async def test_export_vectors_fills_preallocated_arrays() -> None:
+    vectors = np.arange(40, dtype=np.float32).reshape(20, 2)
+    export = await export_vectors(
+        _MemoryPoints(vectors), 20, 2, limit=6, ranges=id_ranges(0, 20, 2)
+    )
+    ids, out = export.sorted()
+    assert export.size == 20
+    assert ids.tolist() == list(range(20))
+    np.testing.assert_array_equal(out, vectors)
@@ -0,0 +1,59 @@
+import pytest
+
+from tests.utils.spanner_rest import (
+    decode_value,
+    iter_json_array,
+    merge_chunk,
+    mutation,
+)
+
+
+async def _chunks(*parts: str | bytes):
+    for p in parts:
+        yield p.encode() if isinstance(p, str) else p
+
+
+@pytest.mark.asyncio
+async def test_iter_json_array_handles_split_elements() -> None:
+    body = '[{"values": ["1", "a"]},\n {"values": ["2", "b, ]"], "chunkedValue": true}]'
+    # Split inside strings, between elements and right after the bracket.
+    parts = [body[:1], body[1:9], body[9:30], body[30:]]
+    items = [i async for i in iter_json_array(_chunks(*parts))]
+    assert items == [
+        {"values": ["1", "a"]},
+        {"values": ["2", "b, ]"], "chunkedValue": True},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_json_array_multibyte_and_escapes_across_chunks() -> None:
+    raw = '[{"values": ["café", "a\\"]}"]}, 7, "x", true]'.encode()
+    # One byte per chunk: splits "é" and the escaped quote.
+    parts = [raw[n : n + 1] for n in range(len(raw))]
+    items = [i async for i in iter_json_array(_chunks(*parts))]
+    assert items == [{"values": ["café", 'a"]}']}, 7, "x", True]
+
+
+@pytest.mark.asyncio
+async def test_iter_json_array_empty() -> None:
+    assert [i async for i in iter_json_array(_chunks("[", " ]"))] == []
+
+
+def test_merge_chunk_strings_and_lists() -> None:
+    assert merge_chunk("ab", "cd") == "abcd"
+    assert merge_chunk(["a", "b"], ["c", "d"]) == ["a", "bc", "d"]
+    assert merge_chunk([1, 2], [3]) == [1, 2, 3]
+
+
+def test_decode_value_and_mutation_encoding() -> None:
+    assert decode_value("42", "INT64") == 42
+    assert decode_value(1.5, "FLOAT64") == 1.5
+    assert decode_value(None, "INT64") is None
+    m = mutation("insertOrUpdate", "t", ["id", "ok"], [[7, True]])
+    assert m == {
+        "insertOrUpdate": {
+            "table": "t",
+            "columns": ["id", "ok"],
+            "values": [["7", True]],
+        }
+    }
@@ -0,0 +1,22 @@
+import numpy as np
+
+from tests.utils.vectors import ground_truth, make_dataset, recall_at_k
+
+
+def test_dataset_is_seeded_and_normalised() -> None:
+    a = make_dataset(500, 16, 10, seed=3)
+    b = make_dataset(500, 16, 10, seed=3)
+    assert a.vectors.dtype == np.float32 and a.dim == 16
+    assert np.array_equal(a.vectors, b.vectors)
+    assert np.allclose(np.linalg.norm(a.queries, axis=1), 1.0, atol=1e-5)
+
+
+def test_ground_truth_matches_full_sort_and_recall() -> None:
+    data = make_dataset(300, 8, 20, seed=1)
+    truth = ground_truth(data.vectors, data.queries, k=5, block=7)
+    expected = np.argsort(-(data.queries @ data.vectors.T), axis=1)[:, :5]
+    assert np.array_equal(truth, expected)
+    assert recall_at_k(truth.tolist(), truth, 5) == 1.0
+    half = [row[:2] + [-1, -2, -3] for row in truth.tolist()]
+    assert recall_at_k(half, truth, 5) == 0.4
+    assert recall_at_k([], truth, 5) == 0.0
@@ -0,0 +1,139 @@
+"""Shared helpers for the opt-in benchmarks under `tests/bench/`.
+
+Benchmarks collect rows into a `BenchReport`; the bench conftest renders every
+report in the pytest terminal summary and writes it as JSON under
+`BENCH_OUTPUT_DIR` (default: `bench-results/`).
+"""
+
+import json
+import os
+import re
+import statistics
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+def env_list(name: str, default: str) -> list[str]:
+    """Read a comma-separated env var into a list of non-empty items."""
+    raw = os.environ.get(name, default)
+    return [item.strip() for item in raw.split(",") if item.strip()]
+
+
+def env_ints(name: str, default: str) -> list[int]:
+    """Read a comma-separated env var into a list of ints."""
+    return [int(item) for item in env_list(name, default)]
+
+
+def env_int(name: str, default: int) -> int:
+    return int(os.environ.get(name, str(default)))
+
+
+def env_float(name: str, default: float) -> float:
+    return float(os.environ.get(name, str(default)))
+
+
+def latency_summary(samples: list[float]) -> dict[str, float]:
+    """Summarize latency samples (seconds) as milliseconds.
+
+    Returns count, mean, p50, p95, p99 and max. Empty input yields zeros.
+    """
+    if not samples:
+        return {
+            "n": 0,
+            "mean_ms": 0.0,
+            "p50_ms": 0.0,
+            "p95_ms": 0.0,
+            "p99_ms": 0.0,
+            "max_ms": 0.0,
+        }
+    ms = sorted(s * 1000.0 for s in samples)
+    if len(ms) == 1:
+        cuts = [ms[0]] * 99
+    else:
+        cuts = statistics.quantiles(ms, n=100, method="inclusive")
+    return {
+        "n": len(ms),
+        "mean_ms": round(statistics.fmean(ms), 3),
+        "p50_ms": round(cuts[49], 3),
+        "p95_ms": round(cuts[94], 3),
+        "p99_ms": round(cuts[98], 3),
+        "max_ms": round(ms[-1], 3),
+    }
+
+
+def rate(count: float, seconds: float) -> float:
+    """Return count/seconds rounded for reporting (0 when no time elapsed)."""
+    return round(count / seconds, 2) if seconds > 0 else 0.0
+
+
+@dataclass
+class BenchReport:
+    """Named table of benchmark result rows."""
+
+    name: str
+    rows: list[dict[str, object]] = field(default_factory=list)
+    notes: list[str] = field(default_factory=list)
+    # Large text blobs (query plans, profiles); not rendered, but written to
+    # the JSON and to `<name>.<key>.txt` so they diff cleanly across runs.
+    artifacts: dict[str, str] = field(default_factory=dict)
+
+    def add(self, **row: object) -> None:
+        self.rows.append(row)
+
+    def note(self, text: str) -> None:
+        self.notes.append(text)
+
+    def attach(self, key: str, text: str) -> None:
+        self.artifacts[key] = text
+
+    def columns(self) -> list[str]:
+        cols: list[str] = []
+        for row in self.rows:
+            for key in row:
+                if key not in cols:
+                    cols.append(key)
+        return cols
+
+    def render(self) -> list[str]:
+        """Render rows as a fixed-width text table (one string per line)."""
+        cols = self.columns()
+        cells = [[_fmt(row.get(c, "")) for c in cols] for row in self.rows]
+        widths = [
+            max([len(c)] + [len(line[i]) for line in cells]) for i, c in enumerate(cols)
+        ]
+        lines = [f"== {self.name} =="]
+        if cols:
+            lines.append("  ".join(c.ljust(w) for c, w in zip(cols, widths)))
+            lines.append("  ".join("-" * w for w in widths))
+            for line in cells:
+                lines.append("  ".join(v.ljust(w) for v, w in zip(line, widths)))
+        lines.extend(f"note: {n}" for n in self.notes)
+        if self.artifacts:
+            lines.append(f"artifacts: {len(self.artifacts)} (see JSON output)")
+        return lines
+
+    def write_json(self, out_dir: Path) -> Path:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        path = out_dir / f"{self.name}.json"
+        with path.open("w", encoding="utf-8") as fh:
+            json.dump(
+                {
+                    "name": self.name,
+                    "rows": self.rows,
+                    "notes": self.notes,
+                    "artifacts": self.artifacts,
+                },
+                fh,
+                indent=2,
+                default=str,
+            )
+        for key, text in self.artifacts.items():
+            safe = re.sub(r"[^\w.-]+", "_", key)
+            (out_dir / f"{self.name}.{safe}.txt").write_text(text, encoding="utf-8")
+        return path
+
+
+def _fmt(value: object) -> str:
+    if isinstance(value, float):
+        return f"{value:.3f}".rstrip("0").rstrip(".") if value else "0"
+    return str(value)
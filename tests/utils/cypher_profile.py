@@ -0,0 +1,215 @@
+"""Cypher workload profiler: `PROFILE` plans with and without declared schema.
+
+A workload is a YAML file:
+
+```yaml
+name: social
+setup:            # run once before profiling (data load)
+  - >-
+    UNWIND range(0, 9999) AS i CREATE (:Person {id: i})
+schema:           # named indexes/constraints; toggled off, then on
+  - CREATE CONSTRAINT person_id IF NOT EXISTS FOR (p:Person) REQUIRE p.id IS UNIQUE
+queries:
+  - name: by_id
+    cypher: >-
+      MATCH (p:Person {id: $id}) RETURN p
+    params: {id: 42}
+teardown:
+  - MATCH (p:Person) DETACH DELETE p
+```
+
+Every query is profiled once (db hits, rows, page cache hits/misses and the
+operator tree) and timed over `repeats` plain runs, first with every schema
+statement dropped and then with all of them created. `render_profiles` and
+`render_plan_diff` produce stable text (no timings) so runs can be diffed.
+"""
+
+import difflib
+import re
+import statistics
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import yaml
+from neo4j import AsyncDriver
+
+_SCHEMA_RE = re.compile(
+    r"^\s*CREATE\s+(?:\w+\s+)?(INDEX|CONSTRAINT)\s+(?!(?:FOR|IF)\b)(\w+)", re.IGNORECASE
+)
+
+
+@dataclass
+class WorkloadQuery:
+    name: str
+    cypher: str
+    params: dict[str, object] = field(default_factory=dict)
+
+
+@dataclass
+class Workload:
+    name: str
+    queries: list[WorkloadQuery]
+    setup: list[str] = field(default_factory=list)
+    schema: list[str] = field(default_factory=list)
+    teardown: list[str] = field(default_factory=list)
+
+
+def load_workload(path: Path) -> Workload:
+    doc = yaml.safe_load(path.read_text(encoding="utf-8"))
+    return Workload(
+        name=doc.get("name", path.stem),
+        queries=[WorkloadQuery(**q) for q in doc["queries"]],
+        setup=doc.get("setup", []),
+        schema=doc.get("schema", []),
+        teardown=doc.get("teardown", []),
+    )
+
+
+def drop_statement(create: str) -> str:
+    """`DROP INDEX|CONSTRAINT <name> IF EXISTS` for a named CREATE statement."""
+    match = _SCHEMA_RE.match(create)
+    if not match:
+        raise ValueError(f"schema statement must create a named index: {create}")
+    return f"DROP {match.group(1).upper()} {match.group(2)} IF EXISTS"
+
+
+def _operator(node: dict) -> str:
+    # Operator names carry a runtime suffix, e.g. `NodeIndexSeek@neo4j`.
+    return node.get("operatorType", "?").split("@")[0]
+
+
+def profile_totals(profile: dict) -> dict[str, int]:
+    """Sum db hits and page cache counters over the plan; rows from the root."""
+    totals = {"db_hits": 0, "page_hits": 0, "page_misses": 0}
+    stack = [profile]
+    while stack:
+        node = stack.pop()
+        totals["db_hits"] += node.get("dbHits", 0)
+        totals["page_hits"] += node.get("pageCacheHits", 0)
+        totals["page_misses"] += node.get("pageCacheMisses", 0)
+        stack.extend(node.get("children", []))
+    return {"rows": profile.get("rows", 0), **totals}
+
+
+def operator_tree(profile: dict, depth: int = 0) -> list[str]:
+    """Indented operator lines with per-operator rows and db hits."""
+    details = profile.get("args", {}).get("Details", "")
+    line = (
+        f"{'  ' * depth}{_operator(profile)}"
+        f" rows={profile.get('rows', 0)} db_hits={profile.get('dbHits', 0)}"
+    )
+    lines = [f"{line}  {details}" if details else line]
+    for child in profile.get("children", []):
+        lines.extend(operator_tree(child, depth + 1))
+    return lines
+
+
+def plan_shape(profile: dict) -> list[str]:
+    stack = [profile]
+    ops: list[str] = []
+    while stack:
+        node = stack.pop()
+        ops.append(_operator(node))
+        stack.extend(reversed(node.get("children", [])))
+    return ops
+
+
+@dataclass
+class QueryProfile:
+    name: str
+    totals: dict[str, int]
+    tree: list[str]
+    shape: list[str]
+    median_ms: float
+
+
+async def profile_query(
+    drv: AsyncDriver, query: WorkloadQuery, repeats: int = 5
+) -> QueryProfile:
+    async with drv.session() as session:
+        result = await session.run(f"PROFILE {query.cypher}", query.params)
+        summary = await result.consume()
+        samples: list[float] = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            await (await session.run(query.cypher, query.params)).consume()
+            samples.append(time.perf_counter() - start)
+    profile = summary.profile or {}
+    return QueryProfile(
+        name=query.name,
+        totals=profile_totals(profile),
+        tree=operator_tree(profile),
+        shape=plan_shape(profile),
+        median_ms=round(statistics.median(samples) * 1000, 3),
+    )
+
+
+async def _run_all(drv: AsyncDriver, statements: list[str]) -> None:
+    # Auto-commit, so setup/teardown may use `CALL {} IN TRANSACTIONS`.
+    async with drv.session() as session:
+        for stmt in statements:
+            await (await session.run(stmt)).consume()
+
+
+async def run_workload(
+    drv: AsyncDriver, workload: Workload, repeats: int = 5
+) -> dict[str, list[QueryProfile]]:
+    """Profile every query without, then with, the workload's schema."""
+    out: dict[str, list[QueryProfile]] = {}
+    # Start clean even if a previous run was interrupted.
+    await _run_all(drv, [drop_statement(s) for s in workload.schema])
+    await _run_all(drv, workload.teardown)
+    try:
+        await _run_all(drv, workload.setup)
+        out["without"] = [
+            await profile_query(drv, q, repeats) for q in workload.queries
+        ]
+        await _run_all(drv, workload.schema)
+        await drv.execute_query("CALL db.awaitIndexes(300)")
+        out["with"] = [await profile_query(drv, q, repeats) for q in workload.queries]
+    finally:
+        await _run_all(drv, [drop_statement(s) for s in workload.schema])
+        await _run_all(drv, workload.teardown)
+    return out
+
+
+def compare(
+    without: list[QueryProfile], with_: list[QueryProfile]
+) -> list[dict[str, object]]:
+    """One row per query: latency speedup, db-hit change and plan change."""
+    rows: list[dict[str, object]] = []
+    for a, b in zip(without, with_):
+        rows.append(
+            {
+                "query": a.name,
+                "ms_without": a.median_ms,
+                "ms_with": b.median_ms,
+                "speedup": round(a.median_ms / b.median_ms, 2) if b.median_ms else 0.0,
+                "db_hits_without": a.totals["db_hits"],
+                "db_hits_with": b.totals["db_hits"],
+                "page_misses_with": b.totals["page_misses"],
+                "rows": b.totals["rows"],
+                "plan_changed": a.shape != b.shape,
+                "plan_with": ">".join(b.shape),
+            }
+        )
+    return rows
+
+
+def render_profiles(profiles: list[QueryProfile]) -> str:
+    blocks = ["\n".join([f"## {p.name}", *p.tree]) for p in profiles]
+    return "\n\n".join(blocks) + "\n"
+
+
+def render_plan_diff(without: list[QueryProfile], with_: list[QueryProfile]) -> str:
+    """Unified diff of operator trees per query (empty section if unchanged)."""
+    out: list[str] = []
+    for a, b in zip(without, with_):
+        out.append(f"## {a.name}")
+        out.extend(
+            difflib.unified_diff(
+                a.tree, b.tree, "without-schema", "with-schema", lineterm=""
+            )
+        )
+    return "\n".join(out) + "\n"
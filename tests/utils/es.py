@@ -0,0 +1,638 @@
+"""Async Elasticsearch helpers over plain aiohttp (no client library).
+
+Defaults target the compose service (`http://localhost:9200`); override with
+`ELASTICSEARCH_HOST` and `ELASTICSEARCH_PORT`.
+
+`stream_bulk` is the ingestion pipeline: actions are pulled lazily from any
+iterable, packed into `_bulk` NDJSON chunks bounded by both document count and
+byte size, and sent by `concurrency` workers through a bounded queue (so a slow
+cluster throttles the generator instead of buffering the corpus). HTTP 429s,
+whole-request or per-item, are retried with a shared adaptive backoff; every
+other per-item failure is collected rather than raised.
+
+`pit_scan` walks large result sets: it opens a point-in-time, pages with
+`search_after` on `_shard_doc` while prefetching the next page, and can split
+the scan into parallel `slice`s.
+
+`MsearchBatcher` coalesces concurrent searches into `_msearch` requests and
+hands each caller its own response through a future.
+
+Snapshot helpers back the seeded-index fixtures: a corpus is indexed and
+snapshotted to a filesystem repository once, then restored per test (the
+compose service sets `path.repo` for this).
+"""
+
+import asyncio
+import hashlib
+import itertools
+import json
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Iterable, Iterator
+
+from aiohttp import ClientSession
+
+from tests.utils.bench import latency_summary, rate
+from tests.utils.http import HttpError, json_request, run_workers
+
+
+def base_url() -> str:
+    host = os.environ.get("ELASTICSEARCH_HOST", "localhost")
+    port = os.environ.get("ELASTICSEARCH_PORT", "9200")
+    return f"http://{host}:{port}"
+
+
+async def es_request(
+    http: ClientSession,
+    method: str,
+    path: str,
+    body: dict | None = None,
+    ok: tuple[int, ...] = (),
+    **params: object,
+) -> dict:
+    """JSON request against `base_url()`; statuses in `ok` are not errors."""
+    return await json_request(
+        http, method, f"{base_url()}/{path.lstrip('/')}", body, ok, **params
+    )
+
+
+async def recreate_index(http: ClientSession, index: str, body: dict) -> None:
+    await es_request(http, "DELETE", index, ok=(404,))
+    await es_request(http, "PUT", index, body, wait_for_active_shards=1)
+
+
+# ---- synthetic corpus ----
+
+CORPUS_MAPPINGS = {
+    "properties": {
+        "id": {"type": "long"},
+        "title": {"type": "text"},
+        "body": {"type": "text"},
+        "category": {"type": "keyword"},
+        "tags": {"type": "keyword"},
+        "price": {"type": "float"},
+        "ts": {"type": "date", "format": "epoch_second"},
+    }
+}
+_CATEGORIES = [f"cat-{i}" for i in range(20)]
+
+
+def _vocabulary(rng: random.Random, size: int = 5000) -> list[str]:
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    return ["".join(rng.choices(letters, k=rng.randint(3, 10))) for _ in range(size)]
+
+
+def make_corpus(n: int, seed: int = 7, body_words: int = 60) -> Iterator[dict]:
+    """Lazily generate `n` article-like documents with Zipf-ish word reuse."""
+    rng = random.Random(seed)
+    vocab = _vocabulary(rng)
+    cum = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(vocab))))
+    for i in range(n):
+        words = rng.choices(vocab, cum_weights=cum, k=body_words + 6)
+        yield {
+            "id": i,
+            "title": " ".join(words[:6]),
+            "body": " ".join(words[6:]),
+            "category": rng.choice(_CATEGORIES),
+            "tags": rng.sample(vocab[:200], 3),
+            "price": round(rng.uniform(1, 500), 2),
+            "ts": 1_700_000_000 + i * 17,
+        }
+
+
+# ---- bulk ingestion ----
+
+
+def index_actions(
+    index: str, docs: Iterable[dict], id_field: str | None = None
+) -> Iterator[bytes]:
+    """Encode `docs` as `index` actions (action line + source line)."""
+    for doc in docs:
+        meta: dict[str, object] = {"_index": index}
+        if id_field is not None:
+            meta["_id"] = str(doc[id_field])
+        yield (
+            json.dumps({"index": meta}, separators=(",", ":"))
+            + "\n"
+            + json.dumps(doc, separators=(",", ":"))
+            + "\n"
+        ).encode()
+
+
+def chunk_actions(
+    actions: Iterable[bytes], max_docs: int = 1000, max_bytes: int = 5 * 2**20
+) -> Iterator[list[bytes]]:
+    """Group encoded actions into chunks within both count and byte limits.
+
+    A single action larger than `max_bytes` is sent on its own.
+    """
+    chunk: list[bytes] = []
+    size = 0
+    for action in actions:
+        if chunk and (len(chunk) >= max_docs or size + len(action) > max_bytes):
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(action)
+        size += len(action)
+    if chunk:
+        yield chunk
+
+
+def split_bulk_items(
+    chunk: list[bytes], items: list[dict]
+) -> tuple[list[bytes], list[dict]]:
+    """Return (actions to retry because of 429, other per-item errors)."""
+    retry: list[bytes] = []
+    errors: list[dict] = []
+    for action, item in zip(chunk, items):
+        ((op, detail),) = item.items()
+        status = detail.get("status", 200)
+        if status == 429:
+            retry.append(action)
+        elif status >= 300:
+            error = detail.get("error", {})
+            errors.append(
+                {
+                    "op": op,
+                    "_id": detail.get("_id"),
+                    "status": status,
+                    "type": error.get("type") if isinstance(error, dict) else None,
+                    "reason": error.get("reason") if isinstance(error, dict) else error,
+                }
+            )
+    return retry, errors
+
+
+class AdaptiveBackoff:
+    """Shared delay that doubles on 429 and decays on success."""
+
+    def __init__(self, initial: float = 0.05, maximum: float = 5.0) -> None:
+        self.initial = initial
+        self.maximum = maximum
+        self.delay = 0.0
+
+    def throttled(self) -> None:
+        self.delay = min(self.maximum, max(self.initial, self.delay * 2))
+
+    def succeeded(self) -> None:
+        self.delay = self.delay / 2 if self.delay > self.initial else 0.0
+
+    async def wait(self) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay * random.uniform(0.5, 1.0))
+
+
+@dataclass
+class BulkResult:
+    docs: int = 0
+    bytes: int = 0
+    chunks: int = 0
+    throttled: int = 0
+    seconds: float = 0.0
+    errors: list[dict] = field(default_factory=list)
+    chunk_latencies: list[float] = field(default_factory=list)
+
+    def summary(self) -> dict[str, object]:
+        lat = latency_summary(self.chunk_latencies)
+        return {
+            "docs": self.docs,
+            "errors": len(self.errors),
+            "chunks": self.chunks,
+            "throttled": self.throttled,
+            "docs_s": rate(self.docs, self.seconds),
+            "mb_s": round(rate(self.bytes, self.seconds) / 2**20, 2),
+            "chunk_p50_ms": lat["p50_ms"],
+            "chunk_p99_ms": lat["p99_ms"],
+        }
+
+
+async def stream_bulk(
+    http: ClientSession,
+    actions: Iterable[bytes],
+    max_docs: int = 1000,
+    max_bytes: int = 5 * 2**20,
+    concurrency: int = 4,
+    max_retries: int = 8,
+    refresh: str | None = None,
+    result: BulkResult | None = None,
+) -> BulkResult:
+    """Send `actions` (see `index_actions`) through `_bulk` with backpressure.
+
+    `docs` counts successfully applied actions; failures are in `errors`
+    (including items still throttled after `max_retries`). Pass `result` to
+    watch progress while the load runs (e.g. from a metrics sampler).
+    """
+    result = result if result is not None else BulkResult()
+    backoff = AdaptiveBackoff()
+    url = f"{base_url()}/_bulk"
+    params = {"refresh": refresh} if refresh else {}
+    headers = {"Content-Type": "application/x-ndjson"}
+
+    async def send(chunk: list[bytes]) -> None:
+        for _ in range(max_retries):
+            await backoff.wait()
+            payload = b"".join(chunk)
+            start = time.perf_counter()
+            async with http.post(
+                url, data=payload, headers=headers, params=params
+            ) as resp:
+                if resp.status == 429:
+                    result.throttled += 1
+                    backoff.throttled()
+                    continue
+                if resp.status >= 300:
+                    raise HttpError(resp.status, await resp.text())
+                body = await resp.json(content_type=None)
+            result.chunk_latencies.append(time.perf_counter() - start)
+            result.chunks += 1
+            result.bytes += len(payload)
+            retry, errors = split_bulk_items(chunk, body.get("items", []))
+            result.errors.extend(errors)
+            result.docs += len(chunk) - len(retry) - len(errors)
+            if not retry:
+                backoff.succeeded()
+                return
+            result.throttled += 1
+            backoff.throttled()
+            chunk = retry
+        result.errors.extend(
+            {
+                "op": "index",
+                "status": 429,
+                "type": "throttled",
+                "reason": "retries exhausted",
+            }
+            for _ in chunk
+        )
+
+    start = time.perf_counter()
+    await run_workers(chunk_actions(actions, max_docs, max_bytes), send, concurrency)
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+# ---- point-in-time scans ----
+
+
+async def open_pit(http: ClientSession, index: str, keep_alive: str = "1m") -> str:
+    resp = await es_request(http, "POST", f"{index}/_pit", keep_alive=keep_alive)
+    return resp["id"]
+
+
+async def close_pit(http: ClientSession, pit_id: str) -> None:
+    await es_request(http, "DELETE", "_pit", {"id": pit_id}, ok=(404,))
+
+
+async def _slice_pages(
+    http: ClientSession,
+    pit_id: str,
+    query: dict,
+    size: int,
+    keep_alive: str,
+    prefetch: bool,
+    slice_: dict | None,
+) -> AsyncIterator[list[dict]]:
+    """Page one (optionally sliced) PIT with `search_after`.
+
+    With `prefetch`, the request for page n+1 is in flight while the caller
+    handles page n.
+    """
+    body: dict[str, object] = {
+        "size": size,
+        "query": query,
+        "pit": {"id": pit_id, "keep_alive": keep_alive},
+        "sort": [{"_shard_doc": "asc"}],
+        "track_total_hits": False,
+    }
+    if slice_ is not None:
+        body["slice"] = slice_
+    fetch: asyncio.Task | None = asyncio.create_task(
+        es_request(http, "POST", "_search", body)
+    )
+    try:
+        while fetch is not None:
+            resp = await fetch
+            fetch = None
+            hits = resp["hits"]["hits"]
+            if not hits:
+                return
+            body = {
+                **body,
+                "pit": {"id": resp.get("pit_id", pit_id), "keep_alive": keep_alive},
+                "search_after": hits[-1]["sort"],
+            }
+            more = len(hits) == size
+            if more and prefetch:
+                fetch = asyncio.create_task(es_request(http, "POST", "_search", body))
+            yield hits
+            if more and not prefetch:
+                fetch = asyncio.create_task(es_request(http, "POST", "_search", body))
+    finally:
+        if fetch is not None and not fetch.done():
+            fetch.cancel()
+
+
+async def pit_scan(
+    http: ClientSession,
+    index: str,
+    query: dict | None = None,
+    size: int = 1000,
+    slices: int = 1,
+    keep_alive: str = "1m",
+    prefetch: bool = True,
+) -> AsyncIterator[list[dict]]:
+    """Yield every matching hit of `index`, page by page, from one PIT.
+
+    With `slices > 1` the PIT is split with `slice` and the slices are read in
+    parallel; pages then arrive in no particular order. The PIT is closed when
+    the iterator finishes or is closed early.
+    """
+    query = query or {"match_all": {}}
+    pit_id = await open_pit(http, index, keep_alive)
+    try:
+        if slices <= 1:
+            async for page in _slice_pages(
+                http, pit_id, query, size, keep_alive, prefetch, None
+            ):
+                yield page
+            return
+
+        queue: asyncio.Queue[list[dict] | BaseException | None] = asyncio.Queue(
+            maxsize=slices * 2
+        )
+
+        async def reader(slice_id: int) -> None:
+            try:
+                async for page in _slice_pages(
+                    http,
+                    pit_id,
+                    query,
+                    size,
+                    keep_alive,
+                    prefetch,
+                    {"id": slice_id, "max": slices},
+                ):
+                    await queue.put(page)
+            except Exception as e:
+                await queue.put(e)
+                return
+            await queue.put(None)
+
+        readers = [asyncio.create_task(reader(i)) for i in range(slices)]
+        try:
+            done = 0
+            while done < slices:
+                item = await queue.get()
+                if item is None:
+                    done += 1
+                elif isinstance(item, BaseException):
+                    raise item
+                else:
+                    yield item
+        finally:
+            for r in readers:
+                r.cancel()
+    finally:
+        await close_pit(http, pit_id)
+
+
+# ---- batched _msearch ----
+
+
+def msearch_payload(searches: list[tuple[str, dict]]) -> bytes:
+    """Encode (index, body) pairs as `_msearch` NDJSON (header + body lines)."""
+    lines: list[str] = []
+    for index, body in searches:
+        lines.append(json.dumps({"index": index}, separators=(",", ":")))
+        lines.append(json.dumps(body, separators=(",", ":")))
+    return ("\n".join(lines) + "\n").encode()
+
+
+@dataclass
+class SearchTimings:
+    """Per-query server `took` vs client-observed latency, in milliseconds."""
+
+    took_ms: list[float] = field(default_factory=list)
+    client_ms: list[float] = field(default_factory=list)
+    requests: int = 0
+
+    def record(self, took_ms: float, client_s: float) -> None:
+        self.took_ms.append(float(took_ms))
+        self.client_ms.append(client_s * 1000)
+
+    def summary(self) -> dict[str, object]:
+        took = latency_summary([t / 1000 for t in self.took_ms])
+        client = latency_summary([c / 1000 for c in self.client_ms])
+        overhead = [(c - t) / 1000 for c, t in zip(self.client_ms, self.took_ms)]
+        return {
+            "queries": len(self.client_ms),
+            "requests": self.requests,
+            "took_p50_ms": took["p50_ms"],
+            "took_p99_ms": took["p99_ms"],
+            "client_p50_ms": client["p50_ms"],
+            "client_p99_ms": client["p99_ms"],
+            "overhead_p50_ms": latency_summary(overhead)["p50_ms"],
+        }
+
+
+class MsearchBatcher:
+    """Coalesce concurrent `search()` calls into `_msearch` requests.
+
+    Queries are buffered until `max_batch` are pending or `max_wait_ms` has
+    passed since the first one, then sent as one `_msearch`; at most
+    `concurrency` requests are in flight. Each caller awaits a future resolved
+    with its own response (or an `HttpError` for a failed sub-search). Timings
+    record each query's server `took` against the latency its caller saw, so
+    queueing + transport overhead can be told apart from search time.
+    """
+
+    def __init__(
+        self,
+        http: ClientSession,
+        max_batch: int = 32,
+        max_wait_ms: float = 2.0,
+        concurrency: int = 4,
+    ) -> None:
+        self.http = http
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.timings = SearchTimings()
+        self._slots = asyncio.Semaphore(concurrency)
+        self._pending: list[tuple[str, dict, asyncio.Future, float]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._inflight: set[asyncio.Task] = set()
+
+    async def search(self, index: str, body: dict) -> dict:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((index, body, future, time.perf_counter()))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self.max_wait, self._flush
+            )
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._pending:
+            batch = self._pending[: self.max_batch]
+            del self._pending[: self.max_batch]
+            task = asyncio.create_task(self._send(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _send(self, batch: list[tuple[str, dict, asyncio.Future, float]]) -> None:
+        payload = msearch_payload([(index, body) for index, body, _, _ in batch])
+        try:
+            async with self._slots:
+                self.timings.requests += 1
+                async with self.http.post(
+                    f"{base_url()}/_msearch",
+                    data=payload,
+                    headers={"Content-Type": "application/x-ndjson"},
+                ) as resp:
+                    if resp.status >= 300:
+                        raise HttpError(resp.status, await resp.text())
+                    responses = (await resp.json(content_type=None))["responses"]
+        except Exception as e:
+            for _, _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        now = time.perf_counter()
+        for (_, _, future, queued_at), result in zip(batch, responses):
+            if future.done():
+                continue
+            if "error" in result:
+                future.set_exception(
+                    HttpError(result.get("status", 500), json.dumps(result["error"]))
+                )
+                continue
+            self.timings.record(result.get("took", 0), now - queued_at)
+            future.set_result(result)
+        for _, _, future, _ in batch[len(responses) :]:
+            if not future.done():
+                future.set_exception(
+                    HttpError(
+                        500,
+                        f"_msearch returned {len(responses)} responses "
+                        f"for {len(batch)} searches",
+                    )
+                )
+
+    async def aclose(self) -> None:
+        """Send anything still buffered and wait for in-flight requests."""
+        self._flush()
+        if self._inflight:
+            await asyncio.gather(*self._inflight)
+
+    async def __aenter__(self) -> "MsearchBatcher":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.aclose()
+
+
+# ---- snapshot / restore fixtures ----
+
+SEED_INDEX = "seed_articles"
+
+SNAPSHOT_REPO = "fixtures"
+
+
+async def ensure_fs_repository(
+    http: ClientSession, repo: str = SNAPSHOT_REPO, location: str = SNAPSHOT_REPO
+) -> None:
+    """Register a shared-filesystem repository (`location` is under `path.repo`)."""
+    await es_request(
+        http,
+        "PUT",
+        f"_snapshot/{repo}",
+        {"type": "fs", "settings": {"location": location, "compress": False}},
+    )
+
+
+async def snapshot_exists(
+    http: ClientSession, snapshot: str, repo: str = SNAPSHOT_REPO
+) -> bool:
+    resp = await es_request(http, "GET", f"_snapshot/{repo}/{snapshot}", ok=(404,))
+    return bool(resp.get("snapshots"))
+
+
+async def create_snapshot(
+    http: ClientSession, snapshot: str, indices: list[str], repo: str = SNAPSHOT_REPO
+) -> None:
+    """(Re)take `snapshot` of `indices`, blocking until it completes."""
+    await es_request(http, "DELETE", f"_snapshot/{repo}/{snapshot}", ok=(404,))
+    resp = await es_request(
+        http,
+        "PUT",
+        f"_snapshot/{repo}/{snapshot}",
+        {"indices": ",".join(indices), "include_global_state": False},
+        wait_for_completion=True,
+    )
+    state = resp.get("snapshot", {}).get("state")
+    if state != "SUCCESS":
+        raise HttpError(500, f"snapshot {snapshot} finished in state {state}")
+
+
+async def restore_snapshot(
+    http: ClientSession, snapshot: str, indices: list[str], repo: str = SNAPSHOT_REPO
+) -> None:
+    """Replace `indices` with their copy in `snapshot`.
+
+    `wait_for_completion` makes the restore call return once the primaries
+    are recovered, so no `_cluster/health` polling is needed afterwards.
+    """
+    await es_request(http, "DELETE", ",".join(indices), ok=(404,))
+    await es_request(
+        http,
+        "POST",
+        f"_snapshot/{repo}/{snapshot}/_restore",
+        {
+            "indices": ",".join(indices),
+            "include_global_state": False,
+            "index_settings": {"index.number_of_replicas": 0},
+        },
+        wait_for_completion=True,
+    )
+
+
+def seed_snapshot_name(docs: int, shards: int = 1) -> str:
+    """Snapshot name for a `seed_corpus` load, versioned by its inputs.
+
+    Hashes the mappings, the load parameters and a sample of generated
+    documents, so changing the corpus or its mapping takes a new snapshot
+    instead of restoring a stale one.
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps(CORPUS_MAPPINGS, sort_keys=True).encode())
+    digest.update(f"docs={docs} shards={shards}".encode())
+    for doc in make_corpus(100):
+        digest.update(json.dumps(doc, sort_keys=True).encode())
+    return f"seed-articles-{docs}-{digest.hexdigest()[:12]}"
+
+
+async def seed_corpus(
+    http: ClientSession, index: str, docs: int, shards: int = 1
+) -> BulkResult:
+    """(Re)create `index` and load `docs` corpus documents, refreshed."""
+    await recreate_index(
+        http,
+        index,
+        {
+            "settings": {"number_of_shards": shards, "number_of_replicas": 0},
+            "mappings": CORPUS_MAPPINGS,
+        },
+    )
+    result = await stream_bulk(
+        http, index_actions(index, make_corpus(docs), id_field="id"), refresh="true"
+    )
+    if result.errors:
+        raise HttpError(500, f"seeding {index}: {result.errors[0]}")
+    return result
@@ -0,0 +1,77 @@
+"""Plumbing shared by the plain-aiohttp service clients and bulk loaders.
+
+`HttpError` and `json_request` back the Elasticsearch, Qdrant and Spanner REST
+helpers. `run_workers` is the bounded producer/worker pool behind the bulk
+loaders (`es.stream_bulk`, `qdrant.upsert_points`, `neo4j_graph.load_batches`):
+items are pulled lazily, so a slow server throttles the producer instead of
+the whole input being buffered, and the first failure stops the run.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Iterable, TypeVar
+
+from aiohttp import ClientSession
+
+T = TypeVar("T")
+
+
+class HttpError(RuntimeError):
+    """Non-2xx response from a service's HTTP API."""
+
+    def __init__(self, status: int, body: str) -> None:
+        super().__init__(f"HTTP {status}: {body[:500]}")
+        self.status = status
+        self.body = body
+
+
+async def json_request(
+    http: ClientSession,
+    method: str,
+    url: str,
+    body: dict | None = None,
+    ok: tuple[int, ...] = (),
+    **params: object,
+) -> dict:
+    """JSON request; statuses in `ok` are not errors, bool params are lowercased."""
+    query = {
+        k: str(v).lower() if isinstance(v, bool) else str(v) for k, v in params.items()
+    }
+    async with http.request(method, url, json=body, params=query) as resp:
+        if resp.status >= 300 and resp.status not in ok:
+            raise HttpError(resp.status, await resp.text())
+        return await resp.json(content_type=None)
+
+
+async def run_workers(
+    items: Iterable[T], handle: Callable[[T], Awaitable[None]], concurrency: int
+) -> None:
+    """Feed `items` to `concurrency` workers calling `handle` on each one.
+
+    At most `concurrency * 2` items wait in the queue. After a failure no new
+    items are handed out, the in-flight ones finish, and the first exception
+    is raised.
+    """
+    queue: asyncio.Queue[T | None] = asyncio.Queue(maxsize=concurrency * 2)
+    failures: list[Exception] = []
+
+    async def worker() -> None:
+        try:
+            while (item := await queue.get()) is not None:
+                if not failures:
+                    await handle(item)
+        except Exception as e:
+            failures.append(e)
+            # Keep draining so the producer never blocks on a full queue.
+            while await queue.get() is not None:
+                pass
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    for item in items:
+        if failures:
+            break
+        await queue.put(item)
+    for _ in workers:
+        await queue.put(None)
+    await asyncio.gather(*workers)
+    if failures:
+        raise failures[0]
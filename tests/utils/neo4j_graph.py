@@ -0,0 +1,158 @@
+"""Bolt access to the Neo4j service via the official async driver.
+
+Connection defaults match the compose service (`bolt://localhost:7687`,
+`neo4j` / `password`); override with `NEO4J_URI`, `NEO4J_USER` and
+`NEO4J_PASSWORD`.
+
+The loader streams rows from any iterable in `UNWIND $rows` batches through
+`tests.utils.http.run_workers`, a bounded queue in front of `concurrency`
+writers, so large generators are never materialised. Writes go through
+`execute_write`, which retries transient errors (deadlocks between concurrent
+relationship batches are the common one).
+"""
+
+import itertools
+import os
+import time
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+from neo4j import AsyncDriver, AsyncGraphDatabase
+
+from tests.utils.bench import rate
+from tests.utils.http import run_workers
+
+
+def driver() -> AsyncDriver:
+    return AsyncGraphDatabase.driver(
+        os.environ.get("NEO4J_URI", "bolt://localhost:7687"),
+        auth=(
+            os.environ.get("NEO4J_USER", "neo4j"),
+            os.environ.get("NEO4J_PASSWORD", "password"),
+        ),
+    )
+
+
+async def ensure_unique(drv: AsyncDriver, label: str, key: str) -> None:
+    """Create the uniqueness constraint that backs `MERGE` on `label.key`."""
+    await drv.execute_query(
+        f"CREATE CONSTRAINT {label.lower()}_{key}_unique IF NOT EXISTS "
+        f"FOR (n:{label}) REQUIRE n.{key} IS UNIQUE"
+    )
+
+
+async def delete_label(drv: AsyncDriver, label: str, batch: int = 10_000) -> None:
+    """Detach-delete every `label` node in batched implicit transactions."""
+    async with drv.session() as session:
+        result = await session.run(
+            f"MATCH (n:{label}) CALL (n) {{ DETACH DELETE n }} "
+            f"IN TRANSACTIONS OF {batch} ROWS"
+        )
+        await result.consume()
+
+
+def batched(rows: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    it = iter(rows)
+    while batch := list(itertools.islice(it, size)):
+        yield batch
+
+
+def node_merge_query(label: str, key: str) -> str:
+    return f"UNWIND $rows AS row MERGE (n:{label} {{{key}: row.{key}}}) SET n += row"
+
+
+def rel_merge_query(src: str, dst: str, rel_type: str, key: str) -> str:
+    """Rows are `{"src": ..., "dst": ..., "props": {...}}` keyed on `key`."""
+    return (
+        f"UNWIND $rows AS row "
+        f"MATCH (a:{src} {{{key}: row.src}}) "
+        f"MATCH (b:{dst} {{{key}: row.dst}}) "
+        f"MERGE (a)-[r:{rel_type}]->(b) SET r += row.props"
+    )
+
+
+@dataclass
+class LoadResult:
+    kind: str
+    batch_size: int
+    concurrency: int
+    items: int = 0
+    batches: int = 0
+    created: int = 0
+    seconds: float = 0.0
+
+    def summary(self) -> dict[str, object]:
+        return {
+            "kind": self.kind,
+            "batch": self.batch_size,
+            "concurrency": self.concurrency,
+            "items": self.items,
+            "created": self.created,
+            "seconds": round(self.seconds, 3),
+            "items_s": rate(self.items, self.seconds),
+        }
+
+
+async def load_batches(
+    drv: AsyncDriver,
+    query: str,
+    rows: Iterable[dict],
+    kind: str,
+    batch_size: int = 5000,
+    concurrency: int = 4,
+) -> LoadResult:
+    """Run `query` (which must `UNWIND $rows`) over `rows` in parallel batches."""
+    result = LoadResult(kind=kind, batch_size=batch_size, concurrency=concurrency)
+
+    async def write(tx, batch: list[dict]) -> int:
+        summary = await (await tx.run(query, rows=batch)).consume()
+        counters = summary.counters
+        return counters.nodes_created + counters.relationships_created
+
+    async def send(batch: list[dict]) -> None:
+        # Sessions are cheap; each borrows a pooled connection for one batch.
+        async with drv.session() as session:
+            result.created += await session.execute_write(write, batch)
+        result.items += len(batch)
+        result.batches += 1
+
+    start = time.perf_counter()
+    await run_workers(batched(rows, batch_size), send, concurrency)
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+async def load_nodes(
+    drv: AsyncDriver,
+    label: str,
+    key: str,
+    rows: Iterable[dict],
+    batch_size: int = 5000,
+    concurrency: int = 4,
+) -> LoadResult:
+    """MERGE `rows` as `label` nodes on the (constraint-backed) `key`."""
+    await ensure_unique(drv, label, key)
+    return await load_batches(
+        drv, node_merge_query(label, key), rows, "nodes", batch_size, concurrency
+    )
+
+
+async def load_rels(
+    drv: AsyncDriver,
+    src: str,
+    dst: str,
+    rel_type: str,
+    key: str,
+    rows: Iterable[dict],
+    batch_size: int = 5000,
+    concurrency: int = 4,
+) -> LoadResult:
+    """MERGE `rel_type` relationships between nodes looked up by `key`."""
+    return await load_batches(
+        drv,
+        rel_merge_query(src, dst, rel_type, key),
+        rows,
+        "rels",
+        batch_size,
+        concurrency,
+    )
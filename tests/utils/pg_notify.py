@@ -0,0 +1,150 @@
+"""LISTEN/NOTIFY fan-out harness on an asyncpg pool.
+
+`run_fanout` holds M listener connections on one channel, runs N publisher
+tasks that send `pg_notify` in transactions of `batch` notifications, and
+measures how long each notification takes to reach every listener. Payloads
+carry the publish timestamp, so latency is measured in-process with
+`time.perf_counter_ns()` and needs no clock sync. A separate connection samples
+`pg_notification_queue_usage()` every `usage_interval` seconds until delivery
+completes, and the peak is reported.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+
+import asyncpg
+
+from tests.utils.bench import latency_summary, rate
+from tests.utils.postgres import conn_params
+
+MAX_PAYLOAD = 7999  # server limit is 8000 bytes
+
+
+@dataclass
+class FanoutResult:
+    publishers: int
+    listeners: int
+    sent: int
+    delivered: int
+    seconds: float
+    latencies: list[float] = field(default_factory=list)
+    max_queue_usage: float = 0.0
+
+    def summary(self) -> dict[str, object]:
+        return {
+            "publishers": self.publishers,
+            "listeners": self.listeners,
+            "sent": self.sent,
+            "delivered": self.delivered,
+            "sent_s": rate(self.sent, self.seconds),
+            "delivered_s": rate(self.delivered, self.seconds),
+            "queue_usage": round(self.max_queue_usage, 4),
+            **latency_summary(self.latencies),
+        }
+
+
+def _payload(seq: int, size: int) -> str:
+    head = f"{seq}:{time.perf_counter_ns()}:"
+    return head + "x" * max(0, min(size, MAX_PAYLOAD) - len(head))
+
+
+async def run_fanout(
+    publishers: int,
+    listeners: int,
+    messages: int,
+    payload_size: int = 64,
+    batch: int = 1,
+    channel: str = "bench_invalidate",
+    timeout: float = 120.0,
+    usage_interval: float = 0.05,
+) -> FanoutResult:
+    """Publish `messages` notifications and wait for every listener to see them."""
+    expected = messages * listeners
+    latencies: list[float] = []
+    delivered = 0
+    done = asyncio.Event()
+
+    def on_notify(_conn, _pid, _channel, payload: str) -> None:
+        nonlocal delivered
+        sent_ns = int(payload.split(":", 2)[1])
+        latencies.append((time.perf_counter_ns() - sent_ns) / 1e9)
+        delivered += 1
+        if delivered >= expected:
+            done.set()
+
+    pool = await asyncpg.create_pool(
+        **conn_params(),
+        min_size=publishers + listeners + 1,
+        max_size=publishers + listeners + 1,
+    )
+    held: list[asyncpg.Connection] = []
+    usage = 0.0
+    stop = asyncio.Event()
+
+    async def sample_usage() -> None:
+        nonlocal usage
+        sql = "SELECT pg_notification_queue_usage()"
+        async with pool.acquire() as conn:
+            while True:
+                usage = max(usage, await conn.fetchval(sql))
+                if stop.is_set():
+                    return
+                try:
+                    await asyncio.wait_for(stop.wait(), usage_interval)
+                except TimeoutError:
+                    pass
+
+    sampler: asyncio.Task | None = None
+    try:
+        for _ in range(listeners):
+            conn = await pool.acquire()
+            await conn.add_listener(channel, on_notify)
+            held.append(conn)
+
+        per_publisher = [messages // publishers] * publishers
+        for i in range(messages % publishers):
+            per_publisher[i] += 1
+
+        async def publish(worker: int, count: int) -> None:
+            seq = worker * messages
+            async with pool.acquire() as conn:
+                while count > 0:
+                    n = min(batch, count)
+                    async with conn.transaction():
+                        for _ in range(n):
+                            await conn.execute(
+                                "SELECT pg_notify($1, $2)",
+                                channel,
+                                _payload(seq, payload_size),
+                            )
+                            seq += 1
+                    count -= n
+
+        sampler = asyncio.create_task(sample_usage())
+        start = time.perf_counter()
+        await asyncio.gather(*(publish(w, c) for w, c in enumerate(per_publisher)))
+        try:
+            await asyncio.wait_for(done.wait(), timeout)
+        except TimeoutError:
+            pass  # report partial delivery
+        seconds = time.perf_counter() - start
+        stop.set()
+        await sampler
+    finally:
+        if sampler is not None and not sampler.done():
+            sampler.cancel()
+        for conn in held:
+            await conn.remove_listener(channel, on_notify)
+            await pool.release(conn)
+        await pool.close()
+
+    return FanoutResult(
+        publishers=publishers,
+        listeners=listeners,
+        sent=messages,
+        delivered=delivered,
+        seconds=seconds,
+        latencies=latencies,
+        max_queue_usage=usage,
+    )
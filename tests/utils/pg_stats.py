@@ -0,0 +1,190 @@
+"""Per-test `pg_stat_statements` / `pg_stat_io` capture (pytest plugin).
+
+Enabled with `--pg-stats` or `PG_STATS=1`. For every Postgres-touching test
+(module name contains `postgres`, uses a `pg_*` fixture, or is marked
+`pg_stats`) the plugin snapshots both views around the test call and diffs
+them. The top statements by total time, rows and shared-buffer hits plus the
+I/O delta are attached to the test report as a `pg_stats` section and as a
+`pg_stats` user property (visible in junit XML). A suite-wide top list is
+printed in the terminal summary.
+
+`pg_stat_io` is flushed by each backend at most once per second, so its
+deltas are approximate for very short tests.
+"""
+
+import asyncio
+import os
+from dataclasses import dataclass
+
+import asyncpg
+import pytest
+
+from tests.utils.postgres import connect
+
+TOP_N = 5
+PG_FIXTURES = {"pg_conn", "pg_clone_db", "pg_template"}
+_STATEMENT_FIELDS = (
+    "calls",
+    "total_exec_time",
+    "rows",
+    "shared_blks_hit",
+    "shared_blks_read",
+)
+_IO_FIELDS = ("reads", "writes", "extends", "hits", "evictions")
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    statements: dict[tuple, dict[str, float]]
+    io: dict[str, float]
+    texts: dict[tuple, str]
+
+
+async def take_snapshot(conn: asyncpg.Connection) -> Snapshot:
+    rows = await conn.fetch(
+        """
+        SELECT userid, dbid, queryid, toplevel, query,
+               calls, total_exec_time, rows, shared_blks_hit, shared_blks_read
+        FROM pg_stat_statements
+        WHERE query NOT ILIKE '%pg_stat_statements%'
+          AND query NOT ILIKE '%pg_stat_io%'
+        """
+    )
+    statements: dict[tuple, dict[str, float]] = {}
+    texts: dict[tuple, str] = {}
+    for r in rows:
+        key = (r["userid"], r["dbid"], r["queryid"], r["toplevel"])
+        statements[key] = {f: float(r[f] or 0) for f in _STATEMENT_FIELDS}
+        texts[key] = r["query"]
+    io_row = await conn.fetchrow(
+        "SELECT "
+        + ", ".join(f"coalesce(sum({f}), 0)::float8 AS {f}" for f in _IO_FIELDS)
+        + " FROM pg_stat_io"
+    )
+    io = {f: float(io_row[f]) for f in _IO_FIELDS}
+    return Snapshot(statements=statements, io=io, texts=texts)
+
+
+def diff_snapshots(before: Snapshot, after: Snapshot) -> dict[str, object]:
+    """Return statement deltas (sorted by total time) and the I/O delta."""
+    deltas: list[dict[str, object]] = []
+    for key, cur in after.statements.items():
+        prev = before.statements.get(key, {})
+        delta = {f: cur[f] - prev.get(f, 0.0) for f in _STATEMENT_FIELDS}
+        if delta["calls"] <= 0:
+            continue
+        deltas.append({"query": after.texts.get(key, ""), **delta})
+    deltas.sort(key=lambda d: d["total_exec_time"], reverse=True)
+    io = {f: after.io.get(f, 0.0) - before.io.get(f, 0.0) for f in _IO_FIELDS}
+    return {"statements": deltas, "io": io}
+
+
+def top_by(
+    statements: list[dict[str, object]], field: str, n: int = TOP_N
+) -> list[dict[str, object]]:
+    return sorted(statements, key=lambda d: d[field], reverse=True)[:n]
+
+
+def format_diff(diff: dict[str, object], n: int = TOP_N) -> str:
+    statements = diff["statements"]
+    lines = ["io: " + " ".join(f"{k}={int(v)}" for k, v in diff["io"].items())]
+    for field in ("total_exec_time", "rows", "shared_blks_hit"):
+        lines.append(f"top by {field}:")
+        for d in top_by(statements, field, n):
+            query = " ".join(str(d["query"]).split())[:100]
+            lines.append(
+                f"  {d['total_exec_time']:9.3f} ms  calls={int(d['calls'])} "
+                f"rows={int(d['rows'])} hit={int(d['shared_blks_hit'])} "
+                f"read={int(d['shared_blks_read'])}  {query}"
+            )
+    return "\n".join(lines)
+
+
+# ---- pytest plugin hooks ----
+
+_state: dict[str, object] = {"enabled": False, "totals": {}}
+_DIFF_KEY = pytest.StashKey[dict]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--pg-stats",
+        action="store_true",
+        default=False,
+        help="capture pg_stat_statements / pg_stat_io deltas per Postgres test",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers", "pg_stats: capture pg_stat_statements deltas for this test"
+    )
+    _state["enabled"] = (
+        config.getoption("--pg-stats") or os.environ.get("PG_STATS") == "1"
+    )
+
+
+def _touches_postgres(item: pytest.Item) -> bool:
+    if item.get_closest_marker("pg_stats"):
+        return True
+    if PG_FIXTURES & set(getattr(item, "fixturenames", ())):
+        return True
+    return "postgres" in item.path.name
+
+
+async def _snapshot() -> Snapshot:
+    conn = await connect()
+    try:
+        await conn.execute("CREATE EXTENSION IF NOT EXISTS pg_stat_statements;")
+        return await take_snapshot(conn)
+    finally:
+        await conn.close()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item: pytest.Item):
+    if not (_state["enabled"] and _touches_postgres(item)):
+        yield
+        return
+    try:
+        before = asyncio.run(_snapshot())
+    except (OSError, asyncpg.PostgresError) as e:
+        item.user_properties.append(("pg_stats", f"unavailable: {e}"))
+        yield
+        return
+    yield
+    try:
+        after = asyncio.run(_snapshot())
+    except (OSError, asyncpg.PostgresError) as e:
+        item.user_properties.append(("pg_stats", f"unavailable: {e}"))
+        return
+    diff = diff_snapshots(before, after)
+    item.stash[_DIFF_KEY] = diff
+    item.user_properties.append(("pg_stats", format_diff(diff)))
+    totals: dict[str, dict[str, object]] = _state["totals"]
+    for d in diff["statements"]:
+        agg = totals.setdefault(
+            d["query"], {"query": d["query"], **{f: 0.0 for f in _STATEMENT_FIELDS}}
+        )
+        for f in _STATEMENT_FIELDS:
+            agg[f] += d[f]
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
+    outcome = yield
+    if call.when != "call" or _DIFF_KEY not in item.stash:
+        return
+    outcome.get_result().sections.append(
+        ("pg_stats", format_diff(item.stash[_DIFF_KEY]))
+    )
+
+
+def pytest_terminal_summary(terminalreporter) -> None:
+    totals: dict[str, dict[str, object]] = _state["totals"]
+    if not totals:
+        return
+    terminalreporter.section("pg_stat_statements (suite top by total time)")
+    diff = {"statements": list(totals.values()), "io": {}}
+    for line in format_diff(diff, n=10).splitlines()[1:]:
+        terminalreporter.write_line(line)
@@ -0,0 +1,178 @@
+"""Per-test PostgreSQL databases cloned from a seeded template.
+
+A template database is created and seeded once; each test then gets its own
+`CREATE DATABASE ... TEMPLATE` copy. On PG18 the copy uses
+`STRATEGY FILE_COPY` with `file_copy_method = clone` when the server accepts
+it and a probe clone is faster than the default `WAL_LOG` strategy. Dropping
+clones happens on a background thread so teardown does not block the next
+test.
+"""
+
+import asyncio
+import itertools
+import os
+import queue
+import threading
+import time
+from typing import Awaitable, Callable
+
+import asyncpg
+
+from tests.utils.postgres import conn_params, ensure_generated_table
+
+Seed = Callable[[asyncpg.Connection], Awaitable[None]]
+
+
+async def seed_default(conn: asyncpg.Connection) -> None:
+    """Default template seed: common extensions plus shared fixture tables."""
+    for ext in ("vector", "postgis"):
+        try:
+            await conn.execute(f"CREATE EXTENSION IF NOT EXISTS {ext};")
+        except asyncpg.PostgresError:
+            pass  # extension not installed in this image
+    await ensure_generated_table(conn, "pg18_gen_test_py")
+
+
+async def _admin_connect(clone: bool = False) -> asyncpg.Connection:
+    settings = {"file_copy_method": "clone"} if clone else {}
+    return await asyncpg.connect(**conn_params(), server_settings=settings)
+
+
+class TemplateClones:
+    """Create a seeded template once and hand out disposable clones of it."""
+
+    def __init__(self, template: str, seed: Seed = seed_default) -> None:
+        self.template = template
+        self.seed = seed
+        self.strategy = "WAL_LOG"
+        self._counter = itertools.count()
+        self._drops: queue.Queue[str | None] = queue.Queue()
+        self._dropper: threading.Thread | None = None
+
+    async def prepare(self) -> None:
+        """(Re)create the template, seed it and detect the fastest clone path."""
+        admin = await _admin_connect()
+        try:
+            # Literal prefix match: LIKE would treat `_` in the name as a wildcard.
+            stale = await admin.fetch(
+                """
+                SELECT datname FROM pg_database
+                WHERE left(datname, length($1)) = $1
+                  AND substr(datname, length($1) + 1) ~ '^[0-9]+$'
+                """,
+                f"{self.template}_c",
+            )
+            for row in stale:
+                await admin.execute(f'DROP DATABASE IF EXISTS "{row[0]}" WITH (FORCE);')
+            if await self._exists(admin, self.template):
+                # Template databases cannot be dropped directly.
+                await admin.execute(
+                    f'ALTER DATABASE "{self.template}" IS_TEMPLATE false;'
+                )
+            await admin.execute(
+                f'DROP DATABASE IF EXISTS "{self.template}" WITH (FORCE);'
+            )
+            await admin.execute(f'CREATE DATABASE "{self.template}";')
+        finally:
+            await admin.close()
+
+        seeded = await asyncpg.connect(**{**conn_params(), "database": self.template})
+        try:
+            await self.seed(seeded)
+        finally:
+            await seeded.close()
+
+        admin = await _admin_connect()
+        try:
+            # Block connections so no session can hold the template open
+            # while clones are being created.
+            await admin.execute(
+                f'ALTER DATABASE "{self.template}" '
+                "WITH IS_TEMPLATE true ALLOW_CONNECTIONS false;"
+            )
+        finally:
+            await admin.close()
+        self.strategy = await self._detect_strategy()
+
+    async def clone(self) -> str:
+        """Create a fresh database from the template and return its name."""
+        name = f"{self.template}_c{next(self._counter)}"
+        admin = await _admin_connect(clone=self.strategy == "FILE_COPY")
+        try:
+            await admin.execute(self._create_sql(name, self.strategy))
+        finally:
+            await admin.close()
+        return name
+
+    def drop_later(self, name: str) -> None:
+        """Queue a clone for dropping on the background thread."""
+        if self._dropper is None:
+            self._dropper = threading.Thread(
+                target=self._drop_loop, name="pg-clone-dropper", daemon=True
+            )
+            self._dropper.start()
+        self._drops.put(name)
+
+    def close(self) -> None:
+        """Wait for queued drops to finish."""
+        if self._dropper is not None:
+            self._drops.put(None)
+            self._dropper.join(timeout=60)
+            self._dropper = None
+
+    def _create_sql(self, name: str, strategy: str) -> str:
+        return (
+            f'CREATE DATABASE "{name}" TEMPLATE "{self.template}" STRATEGY {strategy};'
+        )
+
+    async def _detect_strategy(self) -> str:
+        """Pick the faster of WAL_LOG and FILE_COPY + clone for this server.
+
+        FILE_COPY checkpoints before and after copying, so cloning only wins
+        when the filesystem can share extents; measure instead of assuming.
+        """
+        timings: dict[str, float] = {}
+        for strategy in ("WAL_LOG", "FILE_COPY"):
+            probe = f"{self.template}_c_probe"
+            try:
+                admin = await _admin_connect(clone=strategy == "FILE_COPY")
+            except asyncpg.PostgresError:
+                continue  # pre-18 server or platform without clone support
+            try:
+                start = time.perf_counter()
+                await admin.execute(self._create_sql(probe, strategy))
+                timings[strategy] = time.perf_counter() - start
+                await admin.execute(f'DROP DATABASE IF EXISTS "{probe}";')
+            except asyncpg.PostgresError:
+                pass  # filesystem cannot clone files
+            finally:
+                await admin.close()
+        return min(timings, key=timings.__getitem__) if timings else "WAL_LOG"
+
+    @staticmethod
+    async def _exists(admin: asyncpg.Connection, name: str) -> bool:
+        return bool(
+            await admin.fetchval("SELECT 1 FROM pg_database WHERE datname = $1", name)
+        )
+
+    def _drop_loop(self) -> None:
+        while (name := self._drops.get()) is not None:
+            try:
+                asyncio.run(self._drop(name))
+            except Exception:
+                pass  # best effort; stale clones are removed by the next prepare()
+
+    @staticmethod
+    async def _drop(name: str) -> None:
+        admin = await _admin_connect()
+        try:
+            await admin.execute(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE);')
+        finally:
+            await admin.close()
+
+
+def template_name() -> str:
+    """Template name, unique per pytest-xdist worker when running in parallel."""
+    base = os.environ.get("POSTGRES_TEMPLATE_DB", "test_template")
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+    return f"{base}_{worker}" if worker else base
@@ -0,0 +1,260 @@
+"""Direct asyncpg access to pgAdapter (PostgreSQL wire protocol over Spanner).
+
+Connection defaults match the compose service (`localhost:55432`, user
+`user`, database `test-instance`); override with `PGADAPTER_HOST`,
+`PGADAPTER_PORT`, `PGADAPTER_USER` and `PGADAPTER_DB`.
+"""
+
+import asyncio
+import csv
+import io
+import itertools
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Iterable, Iterator
+
+import asyncpg
+import numpy as np
+
+from tests.utils.bench import latency_summary, rate
+
+# Spanner aborts surface as SQLSTATE 40001 through pgAdapter.
+ABORT_ERRORS = (asyncpg.exceptions.SerializationError,)
+
+
+def conn_params() -> dict:
+    return {
+        "host": os.environ.get("PGADAPTER_HOST", "localhost"),
+        "port": int(os.environ.get("PGADAPTER_PORT", "55432")),
+        "user": os.environ.get("PGADAPTER_USER", "user"),
+        "database": os.environ.get("PGADAPTER_DB", "test-instance"),
+        "ssl": False,
+    }
+
+
+async def connect() -> asyncpg.Connection:
+    return await asyncpg.connect(**conn_params())
+
+
+async def create_pool(size: int) -> asyncpg.Pool:
+    return await asyncpg.create_pool(**conn_params(), min_size=size, max_size=size)
+
+
+def key_sampler(
+    distribution: str, keys: int, seed: int = 0, skew: float = 1.2
+) -> np.ndarray:
+    """Return a shuffled stream of 100k key ids drawn from `distribution`.
+
+    - `uniform`: every key equally likely
+    - `zipf`: rank-based Zipf with exponent `skew` (>1)
+    - `hotspot`: 90% of operations hit the hottest 1% of keys
+    """
+    rng = np.random.default_rng(seed)
+    n = 100_000
+    if distribution == "uniform":
+        return rng.integers(0, keys, size=n)
+    if distribution == "zipf":
+        return (rng.zipf(skew, size=n) - 1) % keys
+    if distribution == "hotspot":
+        hot = max(1, keys // 100)
+        is_hot = rng.random(n) < 0.9
+        return np.where(
+            is_hot, rng.integers(0, hot, size=n), rng.integers(0, keys, size=n)
+        )
+    raise ValueError(f"unknown key distribution: {distribution}")
+
+
+async def seed_accounts(conn: asyncpg.Connection, table: str, keys: int) -> None:
+    """(Re)create `table` with `keys` rows, in batches under Spanner's limits."""
+    await conn.execute(f"DROP TABLE IF EXISTS {table}")
+    await conn.execute(
+        f"CREATE TABLE {table} (id BIGINT PRIMARY KEY, balance BIGINT NOT NULL)"
+    )
+    batch = 500
+    for lo in range(0, keys, batch):
+        ids = range(lo, min(lo + batch, keys))
+        values = ", ".join(f"({i}, 0)" for i in ids)
+        await conn.execute(f"INSERT INTO {table} (id, balance) VALUES {values}")
+
+
+@dataclass
+class ContentionResult:
+    workers: int
+    distribution: str
+    commits: int = 0
+    aborts: int = 0
+    failures: int = 0
+    seconds: float = 0.0
+    latencies: list[float] = field(default_factory=list)
+    retry_latencies: list[float] = field(default_factory=list)
+
+    def summary(self) -> dict[str, object]:
+        attempts = self.commits + self.aborts + self.failures
+        lat = latency_summary(self.latencies)
+        retry = latency_summary(self.retry_latencies)
+        return {
+            "workers": self.workers,
+            "distribution": self.distribution,
+            "commits": self.commits,
+            "commits_s": rate(self.commits, self.seconds),
+            "aborts": self.aborts,
+            "abort_rate": round(self.aborts / attempts, 4) if attempts else 0.0,
+            "gave_up": self.failures,
+            "p50_ms": lat["p50_ms"],
+            "p99_ms": lat["p99_ms"],
+            "retried": retry["n"],
+            "retry_p50_ms": retry["p50_ms"],
+            "retry_p99_ms": retry["p99_ms"],
+        }
+
+
+async def run_contention(
+    pool: asyncpg.Pool,
+    table: str,
+    workers: int,
+    transactions: int,
+    sampler: np.ndarray,
+    distribution: str,
+    keys_per_txn: int = 2,
+    max_attempts: int = 10,
+) -> ContentionResult:
+    """Run read-modify-write transactions over sampled keys, retrying aborts.
+
+    Each transaction reads `keys_per_txn` balances and moves one unit between
+    them. Aborted attempts are retried with jittered exponential backoff up to
+    `max_attempts`; latency is measured from the first attempt to commit.
+    """
+    result = ContentionResult(workers=workers, distribution=distribution)
+    cursor = iter(range(transactions))
+    select = f"SELECT balance FROM {table} WHERE id = $1"
+    update = f"UPDATE {table} SET balance = balance + $2 WHERE id = $1"
+
+    async def one(conn: asyncpg.Connection, n: int) -> None:
+        ids = [
+            int(sampler[(n * keys_per_txn + j) % len(sampler)])
+            for j in range(keys_per_txn)
+        ]
+        start = time.perf_counter()
+        for attempt in range(max_attempts):
+            try:
+                async with conn.transaction():
+                    for key in ids:
+                        await conn.fetchval(select, key)
+                    await conn.execute(update, ids[0], -1)
+                    await conn.execute(update, ids[-1], 1)
+            except ABORT_ERRORS:
+                result.aborts += 1
+                await asyncio.sleep(random.uniform(0, 0.005 * 2**attempt))
+                continue
+            elapsed = time.perf_counter() - start
+            result.commits += 1
+            result.latencies.append(elapsed)
+            if attempt:
+                result.retry_latencies.append(elapsed)
+            return
+        result.failures += 1
+
+    async def worker() -> None:
+        async with pool.acquire() as conn:
+            for n in cursor:
+                await one(conn, n)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+# Spanner caps a single commit at 80k mutations (one per written cell,
+# plus one per secondary-index entry).
+SPANNER_MUTATION_LIMIT = 80_000
+
+
+@dataclass
+class CopyResult:
+    mode: str
+    rows: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+
+    def summary(self) -> dict[str, object]:
+        return {
+            "mode": self.mode,
+            "rows": self.rows,
+            "chunks": self.chunks,
+            "seconds": round(self.seconds, 3),
+            "rows_s": rate(self.rows, self.seconds),
+        }
+
+
+def rows_per_commit(
+    columns: int, secondary_indexes: int = 0, limit: int = SPANNER_MUTATION_LIMIT
+) -> int:
+    """Largest row count whose mutations fit in one Spanner commit."""
+    return max(1, limit // (columns * (1 + secondary_indexes)))
+
+
+async def _csv_stream(
+    rows: Iterator[tuple], counter: list[int], block: int = 1000
+) -> AsyncIterator[bytes]:
+    """Encode rows as CSV in blocks, counting what was sent."""
+    while chunk := list(itertools.islice(rows, block)):
+        buf = io.StringIO()
+        csv.writer(buf, lineterminator="\n").writerows(chunk)
+        counter[0] += len(chunk)
+        yield buf.getvalue().encode()
+
+
+async def copy_rows(
+    conn: asyncpg.Connection,
+    table: str,
+    columns: list[str],
+    rows: Iterable[tuple],
+    mode: str = "atomic",
+    secondary_indexes: int = 0,
+    mutation_limit: int = SPANNER_MUTATION_LIMIT,
+) -> CopyResult:
+    """Stream `rows` into `table` with `COPY ... FROM STDIN` (CSV).
+
+    - `atomic`: rows are split client-side into one COPY (one commit) per
+      chunk that fits Spanner's mutation limit.
+    - `partitioned`: a single COPY under
+      `spanner.autocommit_dml_mode = 'partitioned_non_atomic'`, letting
+      pgAdapter split commits itself. Not atomic: a failure can leave a
+      partial load behind.
+    """
+    result = CopyResult(mode=mode)
+    it = iter(rows)
+    start = time.perf_counter()
+    if mode == "partitioned":
+        await conn.execute("SET SPANNER.AUTOCOMMIT_DML_MODE = 'PARTITIONED_NON_ATOMIC'")
+        try:
+            sent = [0]
+            await conn.copy_to_table(
+                table, source=_csv_stream(it, sent), columns=columns, format="csv"
+            )
+            result.rows, result.chunks = sent[0], 1
+        finally:
+            await conn.execute("SET SPANNER.AUTOCOMMIT_DML_MODE = 'TRANSACTIONAL'")
+    elif mode == "atomic":
+        per_commit = rows_per_commit(len(columns), secondary_indexes, mutation_limit)
+        while True:
+            chunk = itertools.islice(it, per_commit)
+            first = next(chunk, None)
+            if first is None:
+                break
+            sent = [0]
+            await conn.copy_to_table(
+                table,
+                source=_csv_stream(itertools.chain([first], chunk), sent),
+                columns=columns,
+                format="csv",
+            )
+            result.rows += sent[0]
+            result.chunks += 1
+    else:
+        raise ValueError(f"unknown copy mode: {mode}")
+    result.seconds = time.perf_counter() - start
+    return result
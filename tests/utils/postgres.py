@@ -1,3 +1,5 @@
+import asyncio
+import json
 import os
 
 import asyncpg
@@ -40,7 +42,11 @@ async def ensure_generated_table(conn: asyncpg.Connection, table: str) -> str:
     except Exception:
         await conn.execute(ddl_stored)
 
-    # Determine generated kind
+    return await generated_kind(conn, table)
+
+
+async def generated_kind(conn: asyncpg.Connection, table: str) -> str:
+    """Return the attgenerated flag of column `y`: 'v', 's' or '' if missing."""
     row = await conn.fetchrow(
         """
         SELECT a.attgenerated::text AS attgenerated
@@ -60,3 +66,68 @@ async def ensure_generated_table(conn: asyncpg.Connection, table: str) -> str:
         except Exception:
             return str(raw)
     return str(raw)
+
+
+async def wait_for_postgres(retries: int = 60, delay: float = 1.0) -> None:
+    """Poll until a connection succeeds (e.g. after a container restart)."""
+    last_error: Exception | None = None
+    for _ in range(retries):
+        try:
+            conn = await connect()
+        except Exception as e:
+            last_error = e
+            await asyncio.sleep(delay)
+            continue
+        await conn.close()
+        return
+    raise TimeoutError(f"postgres not reachable after {retries} attempts: {last_error}")
+
+
+async def explain_analyze(conn: asyncpg.Connection, sql: str, *args: object) -> dict:
+    """Run `EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)` and return the top-level entry.
+
+    The result holds `Plan` (with `Shared Hit Blocks` / `Shared Read Blocks`)
+    plus `Planning Time` and `Execution Time` in milliseconds.
+    """
+    raw = await conn.fetchval(
+        f"EXPLAIN (ANALYZE, BUFFERS, TIMING OFF, FORMAT JSON) {sql}", *args
+    )
+    doc = json.loads(raw) if isinstance(raw, str) else raw
+    return doc[0]
+
+
+def plan_node_types(plan: dict) -> list[str]:
+    """Flatten an EXPLAIN JSON plan tree into its node types (pre-order)."""
+    nodes = [plan.get("Node Type", "")]
+    for child in plan.get("Plans", []):
+        nodes.extend(plan_node_types(child))
+    return nodes
+
+
+def plan_index_searches(plan: dict, index: str) -> int:
+    """`Index Searches` (PG18) summed over the nodes that scan `index`.
+
+    More than one search from a single index scan means B-tree skip scan.
+    """
+    total = (
+        int(plan.get("Index Searches", 0) or 0)
+        if plan.get("Index Name") == index
+        else 0
+    )
+    for child in plan.get("Plans", []):
+        total += plan_index_searches(child, index)
+    return total
+
+
+def plan_sum(plan: dict, key: str) -> int:
+    """Sum a numeric EXPLAIN JSON field (e.g. `Index Searches`) over the tree."""
+    total = int(plan.get(key, 0) or 0)
+    for child in plan.get("Plans", []):
+        total += plan_sum(child, key)
+    return total
+
+
+async def explain_text(conn: asyncpg.Connection, sql: str, *args: object) -> str:
+    """Run `EXPLAIN (ANALYZE, BUFFERS)` and return the human-readable plan."""
+    rows = await conn.fetch(f"EXPLAIN (ANALYZE, BUFFERS) {sql}", *args)
+    return "\n".join(r[0] for r in rows)
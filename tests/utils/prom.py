@@ -0,0 +1,260 @@
+"""Prometheus metrics sampling alongside benchmarks.
+
+`MetricsSampler` scrapes every target at a fixed interval while a benchmark
+runs. All targets and any client-side counters (e.g. documents indexed so far)
+are read on the same tick, so server metrics line up with client throughput
+sample by sample. Responses are parsed incrementally as chunks arrive and
+only series matching each target's `include` pattern are kept, each as a
+compact `array('d')` aligned with the shared timestamps (NaN where a scrape
+missed).
+
+Default targets match the compose services:
+
+- `elasticsearch`: `elasticsearch-exporter` on `ELASTICSEARCH_EXPORTER_PORT`
+  (9114): JVM GC, heap, merges, refreshes, thread-pool rejections
+- `qdrant`: Qdrant's native `/metrics` on `QDRANT_REST_PORT` (6333)
+- `postgres`: `postgres-exporter` on `POSTGRES_EXPORTER_PORT` (9187)
+
+Set `PROM_INTERVAL` (seconds, default 1) to change the sampling interval.
+"""
+
+import asyncio
+import json
+import math
+import os
+import re
+import time
+from array import array
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable
+
+import aiohttp
+from aiohttp import ClientSession
+
+from tests.utils.bench import BenchReport, env_float
+
+
+@dataclass(frozen=True)
+class Target:
+    name: str
+    url: str
+    include: re.Pattern | None = None
+
+
+def default_targets() -> dict[str, Target]:
+    def url(env: str, port: str) -> str:
+        return f"http://localhost:{os.environ.get(env, port)}/metrics"
+
+    return {
+        "elasticsearch": Target(
+            "elasticsearch",
+            url("ELASTICSEARCH_EXPORTER_PORT", "9114"),
+            re.compile(
+                r"elasticsearch_(jvm_gc_collection_seconds_(count|sum)"
+                r"|jvm_memory_used_bytes|indices_merges_\w+|indices_refresh_\w+"
+                r"|indices_indexing_index_(total|time_seconds_total)"
+                r"|thread_pool_(rejected|active|queue)_count|indices_segments_count)"
+            ),
+        ),
+        "qdrant": Target(
+            "qdrant",
+            url("QDRANT_REST_PORT", "6333"),
+            re.compile(r"(rest|grpc)_responses_\w+|collections_\w+|memory_\w+"),
+        ),
+        "postgres": Target(
+            "postgres",
+            url("POSTGRES_EXPORTER_PORT", "9187"),
+            re.compile(
+                r"pg_stat_database_(xact_commit|blks_hit|blks_read|tup_\w+|deadlocks)"
+                r"|pg_stat_activity_count|pg_stat_bgwriter_\w+|pg_stat_checkpointer_\w+"
+            ),
+        ),
+    }
+
+
+# ---- text exposition parsing ----
+
+
+def parse_sample(line: str) -> tuple[str, str, float] | None:
+    """Parse one exposition line into (name, labels, value); None for comments.
+
+    `labels` is the raw `{...}` text (quoted values may contain spaces,
+    braces and escaped quotes), which is already a stable series key.
+    """
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    brace = line.find("{")
+    space = line.find(" ")
+    if brace != -1 and (space == -1 or brace < space):
+        i, quoted = brace + 1, False
+        while i < len(line):
+            ch = line[i]
+            if quoted and ch == "\\":
+                i += 2
+                continue
+            if ch == '"':
+                quoted = not quoted
+            elif ch == "}" and not quoted:
+                break
+            i += 1
+        name, labels, rest = line[:brace], line[brace : i + 1], line[i + 1 :]
+    else:
+        name, labels, rest = line[:space], "", line[space:]
+    value = rest.split()[0]
+    return name, labels, float(value)
+
+
+async def iter_samples(
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[tuple[str, str, float]]:
+    """Yield samples line by line as response chunks arrive."""
+    carry = b""
+    async for chunk in chunks:
+        lines = (carry + chunk).split(b"\n")
+        carry = lines.pop()
+        for raw in lines:
+            if (sample := parse_sample(raw.decode())) is not None:
+                yield sample
+    if carry and (sample := parse_sample(carry.decode())) is not None:
+        yield sample
+
+
+# ---- storage ----
+
+
+@dataclass
+class SeriesStore:
+    """Time series aligned on one shared timestamp array."""
+
+    t: array = field(default_factory=lambda: array("d"))
+    series: dict[str, array] = field(default_factory=dict)
+
+    def tick(self, ts: float) -> None:
+        self.t.append(ts)
+        for values in self.series.values():
+            values.append(math.nan)
+
+    def set(self, key: str, value: float) -> None:
+        values = self.series.get(key)
+        if values is None:
+            values = self.series[key] = array("d", [math.nan] * len(self.t))
+        values[-1] = value
+
+    def summary(self, limit: int = 30) -> list[dict[str, object]]:
+        """Series that changed, with first/last value and peak per-second rate."""
+        rows: list[dict[str, object]] = []
+        for key, values in self.series.items():
+            points = [(t, v) for t, v in zip(self.t, values) if not math.isnan(v)]
+            if len(points) < 2 or points[0][1] == points[-1][1]:
+                continue
+            # Equal timestamps give no rate; a changed series still reports 0.
+            peak = max(
+                (
+                    (v1 - v0) / (t1 - t0)
+                    for (t0, v0), (t1, v1) in zip(points, points[1:])
+                    if t1 > t0
+                ),
+                default=0.0,
+            )
+            rows.append(
+                {
+                    "series": key,
+                    "first": points[0][1],
+                    "last": points[-1][1],
+                    "peak_rate_s": round(peak, 3),
+                }
+            )
+        rows.sort(key=lambda r: abs(r["last"] - r["first"]), reverse=True)
+        return rows[:limit]
+
+    def to_json(self) -> str:
+        def clean(values: array) -> list[float | None]:
+            return [None if math.isnan(v) else round(v, 6) for v in values]
+
+        t0 = self.t[0] if self.t else 0.0
+        return json.dumps(
+            {
+                "t": [round(t - t0, 3) for t in self.t],
+                "series": {k: clean(v) for k, v in self.series.items()},
+            },
+            separators=(",", ":"),
+        )
+
+
+# ---- sampler ----
+
+
+class MetricsSampler:
+    """Scrape `targets` and read `client` counters every `interval` seconds.
+
+    Use as an async context manager around the measured work, then call
+    `attach(report)`. Unreachable targets are noted and dropped after their
+    first failure instead of failing the benchmark.
+    """
+
+    def __init__(
+        self,
+        http: ClientSession,
+        targets: list[Target] | None = None,
+        client: dict[str, Callable[[], float]] | None = None,
+        interval: float | None = None,
+    ) -> None:
+        self.http = http
+        self.targets = list(targets or default_targets().values())
+        self.client = client or {}
+        self.interval = interval or env_float("PROM_INTERVAL", 1.0)
+        self.store = SeriesStore()
+        self.errors: dict[str, str] = {}
+        self._task: asyncio.Task | None = None
+
+    async def _scrape(self, target: Target) -> None:
+        try:
+            async with self.http.get(target.url) as resp:
+                resp.raise_for_status()
+                async for name, labels, value in iter_samples(resp.content.iter_any()):
+                    if target.include is None or target.include.fullmatch(name):
+                        self.store.set(f"{target.name}:{name}{labels}", value)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            self.errors[target.name] = str(e) or type(e).__name__
+
+    async def sample(self) -> None:
+        """Take one aligned sample of every live target and client counter."""
+        self.store.tick(time.time())
+        for key, read in self.client.items():
+            self.store.set(f"client:{key}", float(read()))
+        live = [t for t in self.targets if t.name not in self.errors]
+        await asyncio.gather(*(self._scrape(t) for t in live))
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_at = loop.time()
+        while True:
+            await self.sample()
+            # Fixed schedule: a slow scrape shortens the next wait, not the rate.
+            next_at += self.interval
+            await asyncio.sleep(max(0.0, next_at - loop.time()))
+
+    async def __aenter__(self) -> "MetricsSampler":
+        self._task = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        await self.sample()  # closing sample so counters cover the whole run
+
+    def attach(self, report: BenchReport, key: str = "metrics") -> None:
+        """Add the time series (JSON artifact) and changed-series notes."""
+        report.attach(key, self.store.to_json())
+        for name, error in self.errors.items():
+            report.note(f"{key}: {name} unavailable ({error})")
+        for row in self.store.summary(limit=15):
+            report.note(
+                f"{key}: {row['series']} {row['first']:g} -> {row['last']:g} "
+                f"(peak {row['peak_rate_s']:g}/s)"
+            )
@@ -0,0 +1,507 @@
+"""Async Qdrant REST helpers over plain aiohttp (no client library).
+
+Defaults target the compose service (`http://localhost:6333`); override with
+`QDRANT_HOST` and `QDRANT_REST_PORT`.
+
+`upsert_points` is the bulk loader: ids, vectors and payload columns come in
+as NumPy arrays and are sliced into column-oriented `batch` upserts, sent by
+`concurrency` workers with `wait=false` (acknowledged once written to the
+WAL). The final batch is sent with `wait=true` after every other batch is
+acknowledged; a collection applies its updates in order, so its completion
+confirms the whole load has been applied.
+
+`RestPoints` is the REST transport for upsert, batched search and scroll; its
+gRPC twin is `tests.utils.qdrant_grpc.GrpcPoints`. Both record client-side
+encode and decode time separately from the round trip in `CallTimings`.
+
+`scroll_points` exports a collection page by page over either transport: it
+follows `next_page_offset` with the next page already in flight while the
+caller handles the current one, and can split the id space into ranges that
+are scrolled in parallel. `VectorExport` collects pages into preallocated
+NumPy arrays.
+"""
+
+import asyncio
+import bisect
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Awaitable, Callable, TypeVar
+
+import numpy as np
+from aiohttp import ClientSession
+
+from tests.utils.bench import latency_summary, rate
+from tests.utils.http import HttpError, json_request, run_workers
+from tests.utils.prom import iter_samples
+
+T = TypeVar("T")
+
+
+def base_url() -> str:
+    host = os.environ.get("QDRANT_HOST", "localhost")
+    port = os.environ.get("QDRANT_REST_PORT", "6333")
+    return f"http://{host}:{port}"
+
+
+async def qdrant_request(
+    http: ClientSession,
+    method: str,
+    path: str,
+    body: dict | None = None,
+    ok: tuple[int, ...] = (),
+    **params: object,
+) -> dict:
+    """JSON request against `base_url()`; statuses in `ok` are not errors."""
+    return await json_request(
+        http, method, f"{base_url()}/{path.lstrip('/')}", body, ok, **params
+    )
+
+
+async def recreate_collection(http: ClientSession, name: str, body: dict) -> None:
+    await qdrant_request(http, "DELETE", f"collections/{name}", ok=(404,))
+    await qdrant_request(http, "PUT", f"collections/{name}", body)
+
+
+async def count_points(http: ClientSession, collection: str) -> int:
+    resp = await qdrant_request(
+        http, "POST", f"collections/{collection}/points/count", {"exact": True}
+    )
+    return resp["result"]["count"]
+
+
+async def wait_green(
+    http: ClientSession, collection: str, timeout: float = 600.0, indexed: int = 0
+) -> float:
+    """Poll until optimizers are idle and `indexed` vectors are in HNSW.
+
+    Returns the seconds waited.
+    """
+    start = time.perf_counter()
+    while True:
+        resp = await qdrant_request(http, "GET", f"collections/{collection}")
+        info = resp["result"]
+        done = info.get("indexed_vectors_count") or 0
+        if info["status"] == "green" and done >= indexed:
+            return time.perf_counter() - start
+        if time.perf_counter() - start > timeout:
+            raise TimeoutError(f"{collection} not green after {timeout}s")
+        await asyncio.sleep(0.2)
+
+
+async def memory_bytes(http: ClientSession) -> dict[str, float]:
+    """Process memory gauges (`memory_*_bytes`) from Qdrant's `/metrics`."""
+    out: dict[str, float] = {}
+    async with http.get(f"{base_url()}/metrics") as resp:
+        if resp.status >= 300:
+            raise HttpError(resp.status, await resp.text())
+        async for name, labels, value in iter_samples(resp.content.iter_any()):
+            if name.startswith("memory_") and not labels:
+                out[name] = value
+    return out
+
+
+# ---- bulk upsert ----
+
+
+def point_batch(
+    ids: np.ndarray,
+    vectors: np.ndarray,
+    payload: dict[str, np.ndarray] | None,
+    lo: int,
+    hi: int,
+) -> bytes:
+    """Encode rows `lo:hi` as a column-oriented `PUT .../points` body."""
+    batch: dict[str, object] = {
+        "ids": ids[lo:hi].tolist(),
+        "vectors": vectors[lo:hi].tolist(),
+    }
+    if payload:
+        keys = list(payload)
+        columns = [payload[k][lo:hi].tolist() for k in keys]
+        batch["payloads"] = [dict(zip(keys, row)) for row in zip(*columns)]
+    return json.dumps({"batch": batch}, separators=(",", ":")).encode()
+
+
+@dataclass
+class UpsertResult:
+    points: int = 0
+    bytes: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+    confirm_seconds: float = 0.0
+    batch_latencies: list[float] = field(default_factory=list)
+
+    def summary(self) -> dict[str, object]:
+        lat = latency_summary(self.batch_latencies)
+        return {
+            "points": self.points,
+            "batches": self.batches,
+            "points_s": rate(self.points, self.seconds),
+            "mb_s": round(rate(self.bytes, self.seconds) / 2**20, 2),
+            "batch_p50_ms": lat["p50_ms"],
+            "batch_p99_ms": lat["p99_ms"],
+            "confirm_ms": round(self.confirm_seconds * 1000, 1),
+        }
+
+
+async def upsert_points(
+    http: ClientSession,
+    collection: str,
+    ids: np.ndarray,
+    vectors: np.ndarray,
+    payload: dict[str, np.ndarray] | None = None,
+    batch_size: int = 1000,
+    concurrency: int = 4,
+    result: UpsertResult | None = None,
+) -> UpsertResult:
+    """Upsert `ids`/`vectors` (plus optional payload columns) in batches.
+
+    `points` counts acknowledged points; `seconds` covers the whole load
+    including the confirming `wait=true` batch (`confirm_seconds`). Pass
+    `result` to watch progress while the load runs.
+    """
+    if len(ids) != len(vectors):
+        raise ValueError(f"{len(ids)} ids for {len(vectors)} vectors")
+    result = result if result is not None else UpsertResult()
+    url = f"{base_url()}/collections/{collection}/points"
+    headers = {"Content-Type": "application/json"}
+    bounds = [
+        (lo, min(lo + batch_size, len(ids))) for lo in range(0, len(ids), batch_size)
+    ]
+
+    async def send(lo: int, hi: int, wait: bool = False) -> None:
+        data = point_batch(ids, vectors, payload, lo, hi)
+        start = time.perf_counter()
+        async with http.put(
+            url, data=data, headers=headers, params={"wait": str(wait).lower()}
+        ) as resp:
+            if resp.status >= 300:
+                raise HttpError(resp.status, await resp.text())
+            await resp.read()
+        result.batch_latencies.append(time.perf_counter() - start)
+        result.batches += 1
+        result.bytes += len(data)
+        result.points += hi - lo
+
+    start = time.perf_counter()
+    await run_workers(bounds[:-1], lambda b: send(*b), concurrency)
+    if bounds:
+        confirm = time.perf_counter()
+        await send(*bounds[-1], wait=True)
+        result.confirm_seconds = time.perf_counter() - confirm
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+# ---- transports ----
+
+
+@dataclass
+class CallTimings:
+    """Per-call encode, decode and end-to-end seconds plus wire bytes."""
+
+    encode: list[float] = field(default_factory=list)
+    decode: list[float] = field(default_factory=list)
+    total: list[float] = field(default_factory=list)
+    bytes_out: int = 0
+    bytes_in: int = 0
+
+    def record(
+        self, encode: float, decode: float, total: float, sent: int, received: int
+    ) -> None:
+        self.encode.append(encode)
+        self.decode.append(decode)
+        self.total.append(total)
+        self.bytes_out += sent
+        self.bytes_in += received
+
+    async def timed(
+        self,
+        encode: Callable[[], bytes],
+        send: Callable[[bytes], Awaitable[bytes]],
+        decode: Callable[[bytes], T],
+    ) -> T:
+        """Run one call, recording encode, decode and round-trip time."""
+        start = time.perf_counter()
+        data = encode()
+        encoded = time.perf_counter()
+        raw = await send(data)
+        received = time.perf_counter()
+        out = decode(raw)
+        done = time.perf_counter()
+        self.record(encoded - start, done - received, done - start, len(data), len(raw))
+        return out
+
+    def summary(self) -> dict[str, object]:
+        lat = latency_summary(self.total)
+        calls = max(1, len(self.total))
+        return {
+            "calls": lat["n"],
+            "p50_ms": lat["p50_ms"],
+            "p99_ms": lat["p99_ms"],
+            "encode_ms": round(sum(self.encode) / calls * 1000, 3),
+            "decode_ms": round(sum(self.decode) / calls * 1000, 3),
+            "req_kb": round(self.bytes_out / calls / 1024, 1),
+            "resp_kb": round(self.bytes_in / calls / 1024, 1),
+        }
+
+
+@dataclass
+class ScrollPage:
+    ids: list[int]
+    vectors: list[list[float]] | None
+    next_offset: int | None
+
+
+class RestPoints:
+    """Upsert, batched search and scroll over REST (JSON bodies)."""
+
+    transport = "rest"
+
+    def __init__(self, http: ClientSession, collection: str) -> None:
+        self.http = http
+        self.collection = collection
+        self.timings = CallTimings()
+        self._url = f"{base_url()}/collections/{collection}/points"
+
+    async def __aenter__(self) -> "RestPoints":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        pass  # the session belongs to the caller
+
+    async def _call(
+        self,
+        method: str,
+        path: str,
+        build: Callable[[], bytes],
+        parse: Callable[[dict], T],
+        **params: str,
+    ) -> T:
+        async def send(data: bytes) -> bytes:
+            async with self.http.request(
+                method,
+                self._url + path,
+                data=data,
+                headers={"Content-Type": "application/json"},
+                params=params,
+            ) as resp:
+                raw = await resp.read()
+                if resp.status >= 300:
+                    raise HttpError(resp.status, raw.decode(errors="replace"))
+                return raw
+
+        return await self.timings.timed(build, send, lambda raw: parse(json.loads(raw)))
+
+    async def upsert(
+        self,
+        ids: np.ndarray,
+        vectors: np.ndarray,
+        payload: dict[str, np.ndarray] | None,
+        lo: int,
+        hi: int,
+        wait: bool = False,
+    ) -> None:
+        await self._call(
+            "PUT",
+            "",
+            lambda: point_batch(ids, vectors, payload, lo, hi),
+            lambda body: None,
+            wait=str(wait).lower(),
+        )
+
+    async def search(
+        self,
+        queries: np.ndarray,
+        k: int,
+        ef: int | None = None,
+        params: dict | None = None,
+        query_filter: dict | None = None,
+    ) -> list[list[int]]:
+        """Batched search; `params` adds search params (`exact`, `quantization`)
+        and `query_filter` is a payload filter applied to every query."""
+
+        def build() -> bytes:
+            search_params = ({"hnsw_ef": ef} if ef else {}) | (params or {})
+            extra = {"filter": query_filter} if query_filter else {}
+            searches = [
+                {"vector": q, "limit": k, "params": search_params} | extra
+                for q in queries.tolist()
+            ]
+            return json.dumps({"searches": searches}, separators=(",", ":")).encode()
+
+        return await self._call(
+            "POST",
+            "/search/batch",
+            build,
+            lambda body: [[hit["id"] for hit in hits] for hits in body["result"]],
+        )
+
+    async def scroll(
+        self, limit: int, offset: int | None = None, with_vectors: bool = False
+    ) -> ScrollPage:
+        def build() -> bytes:
+            body = {
+                "limit": limit,
+                "offset": offset,
+                "with_payload": False,
+                "with_vector": with_vectors,
+            }
+            return json.dumps(body, separators=(",", ":")).encode()
+
+        def parse(body: dict) -> ScrollPage:
+            points = body["result"]["points"]
+            return ScrollPage(
+                ids=[p["id"] for p in points],
+                vectors=[p["vector"] for p in points] if with_vectors else None,
+                next_offset=body["result"]["next_page_offset"],
+            )
+
+        return await self._call("POST", "/scroll", build, parse)
+
+
+# ---- collection export ----
+
+
+def id_ranges(lo: int, hi: int, parts: int) -> list[tuple[int, int]]:
+    """Split integer ids `[lo, hi)` into `parts` contiguous ranges."""
+    step = -(-(hi - lo) // max(1, parts))
+    return [(start, min(start + step, hi)) for start in range(lo, hi, step)]
+
+
+async def _scroll_range(
+    client,
+    limit: int,
+    with_vectors: bool,
+    prefetch: bool,
+    lo: int | None,
+    hi: int | None,
+) -> AsyncIterator[ScrollPage]:
+    """Scroll from id `lo` up to (excluding) id `hi`; pages come in id order.
+
+    With `prefetch`, the request for page n+1 is in flight while the caller
+    handles page n.
+    """
+    fetch: asyncio.Task | None = asyncio.create_task(
+        client.scroll(limit, lo, with_vectors)
+    )
+    try:
+        while fetch is not None:
+            page = await fetch
+            fetch = None
+            if hi is not None and page.ids and page.ids[-1] >= hi:
+                keep = bisect.bisect_left(page.ids, hi)
+                page = ScrollPage(
+                    page.ids[:keep],
+                    page.vectors[:keep] if page.vectors is not None else None,
+                    None,
+                )
+            after = page.next_offset
+            if after is not None and hi is not None and after >= hi:
+                after = None
+            if after is not None and prefetch:
+                fetch = asyncio.create_task(client.scroll(limit, after, with_vectors))
+            if page.ids:
+                yield page
+            if after is not None and not prefetch:
+                fetch = asyncio.create_task(client.scroll(limit, after, with_vectors))
+    finally:
+        if fetch is not None and not fetch.done():
+            fetch.cancel()
+
+
+async def scroll_points(
+    client,
+    limit: int = 1000,
+    with_vectors: bool = False,
+    prefetch: bool = True,
+    ranges: list[tuple[int, int]] | None = None,
+) -> AsyncIterator[ScrollPage]:
+    """Yield every point of the client's collection, page by page.
+
+    `client` is any object with an async `scroll(limit, offset, with_vectors)`
+    returning a `ScrollPage` - `RestPoints` or `qdrant_grpc.GrpcPoints`.
+    With `ranges` (integer ids, see `id_ranges`) each range is scrolled by its
+    own reader in parallel; pages then arrive in no particular order. Points
+    outside every range are not returned.
+    """
+    if not ranges:
+        async for page in _scroll_range(
+            client, limit, with_vectors, prefetch, None, None
+        ):
+            yield page
+        return
+
+    queue: asyncio.Queue[ScrollPage | BaseException | None] = asyncio.Queue(
+        maxsize=len(ranges) * 2
+    )
+
+    async def reader(lo: int, hi: int) -> None:
+        try:
+            async for page in _scroll_range(
+                client, limit, with_vectors, prefetch, lo, hi
+            ):
+                await queue.put(page)
+        except Exception as e:
+            await queue.put(e)
+            return
+        await queue.put(None)
+
+    readers = [asyncio.create_task(reader(lo, hi)) for lo, hi in ranges]
+    try:
+        done = 0
+        while done < len(readers):
+            item = await queue.get()
+            if item is None:
+                done += 1
+            elif isinstance(item, BaseException):
+                raise item
+            else:
+                yield item
+    finally:
+        for r in readers:
+            r.cancel()
+
+
+class VectorExport:
+    """Preallocated id and vector arrays filled from scroll pages."""
+
+    def __init__(self, count: int, dim: int) -> None:
+        self.ids = np.empty(count, dtype=np.int64)
+        self.vectors = np.empty((count, dim), dtype=np.float32)
+        self.size = 0
+
+    def add(self, page: ScrollPage) -> None:
+        if page.vectors is None:
+            raise ValueError("page was scrolled without vectors")
+        end = self.size + len(page.ids)
+        if end > len(self.ids):
+            raise ValueError(f"export overflow: {end} > {len(self.ids)} points")
+        self.ids[self.size : end] = page.ids
+        self.vectors[self.size : end] = page.vectors
+        self.size = end
+
+    def sorted(self) -> tuple[np.ndarray, np.ndarray]:
+        """(ids, vectors) trimmed to what was filled, ordered by id."""
+        order = np.argsort(self.ids[: self.size], kind="stable")
+        return self.ids[order], self.vectors[order]
+
+
+async def export_vectors(
+    client,
+    count: int,
+    dim: int,
+    limit: int = 1000,
+    prefetch: bool = True,
+    ranges: list[tuple[int, int]] | None = None,
+) -> VectorExport:
+    """Scroll every point with its vector into a `VectorExport`.
+
+    `client` is scrolled as in `scroll_points`.
+    """
+    export = VectorExport(count, dim)
+    async for page in scroll_points(client, limit, True, prefetch, ranges):
+        export.add(page)
+    return export
@@ -0,0 +1,187 @@
+"""Qdrant gRPC transport (compose port 6334) using `qdrant-client`'s stubs.
+
+`GrpcPoints` has the same upsert / batched search / scroll surface as
+`tests.utils.qdrant.RestPoints`. Requests are serialized to protobuf bytes
+explicitly and sent over a `grpc.aio` channel with identity (de)serializers,
+so `CallTimings` captures protobuf encode and decode cost the same way the
+REST path captures JSON. Override the endpoint with `QDRANT_HOST` and
+`QDRANT_GRPC_PORT`.
+"""
+
+import asyncio
+import itertools
+import os
+from typing import Callable, TypeVar
+
+import grpc
+import numpy as np
+from google.protobuf.message import Message
+from qdrant_client import grpc as pb
+
+from tests.utils.qdrant import CallTimings, ScrollPage
+
+T = TypeVar("T")
+_SERVICE = "/qdrant.Points"
+_OPTIONS = [
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+]
+
+
+def grpc_target() -> str:
+    host = os.environ.get("QDRANT_HOST", "localhost")
+    port = os.environ.get("QDRANT_GRPC_PORT", "6334")
+    return f"{host}:{port}"
+
+
+def _value(v: object) -> pb.Value:
+    if isinstance(v, bool):
+        return pb.Value(bool_value=v)
+    if isinstance(v, int):
+        return pb.Value(integer_value=v)
+    if isinstance(v, float):
+        return pb.Value(double_value=v)
+    return pb.Value(string_value=str(v))
+
+
+def upsert_request(
+    collection: str,
+    ids: np.ndarray,
+    vectors: np.ndarray,
+    payload: dict[str, np.ndarray] | None,
+    lo: int,
+    hi: int,
+    wait: bool,
+) -> pb.UpsertPoints:
+    keys = list(payload or {})
+    columns = [payload[k][lo:hi].tolist() for k in keys] if payload else []
+    rows = zip(*columns) if columns else itertools.repeat(())
+    return pb.UpsertPoints(
+        collection_name=collection,
+        wait=wait,
+        points=[
+            pb.PointStruct(
+                id=pb.PointId(num=pid),
+                vectors=pb.Vectors(vector=pb.Vector(dense=pb.DenseVector(data=vec))),
+                payload={k: _value(v) for k, v in zip(keys, row)},
+            )
+            for pid, vec, row in zip(ids[lo:hi].tolist(), vectors[lo:hi].tolist(), rows)
+        ],
+    )
+
+
+def _vector_data(vectors: pb.VectorsOutput) -> list[float]:
+    vec = vectors.vector
+    return list(vec.dense.data or vec.data)
+
+
+class GrpcPoints:
+    """Upsert, batched search and scroll over gRPC (protobuf bodies).
+
+    Use as an async context manager; it owns its channel.
+    """
+
+    transport = "grpc"
+
+    def __init__(self, collection: str, target: str | None = None) -> None:
+        self.collection = collection
+        self.timings = CallTimings()
+        self.channel = grpc.aio.insecure_channel(
+            target or grpc_target(), options=_OPTIONS
+        )
+        self._methods = {
+            name: self.channel.unary_unary(f"{_SERVICE}/{name}")
+            for name in ("Upsert", "SearchBatch", "Scroll")
+        }
+
+    async def __aenter__(self) -> "GrpcPoints":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.channel.close()
+
+    async def ready(self, timeout: float = 5.0) -> None:
+        """Wait for the channel to connect; raises `TimeoutError`."""
+        await asyncio.wait_for(self.channel.channel_ready(), timeout)
+
+    async def _call(
+        self,
+        method: str,
+        build: Callable[[], Message],
+        parse: Callable[[bytes], T],
+    ) -> T:
+        return await self.timings.timed(
+            lambda: build().SerializeToString(), self._methods[method], parse
+        )
+
+    async def upsert(
+        self,
+        ids: np.ndarray,
+        vectors: np.ndarray,
+        payload: dict[str, np.ndarray] | None,
+        lo: int,
+        hi: int,
+        wait: bool = False,
+    ) -> None:
+        await self._call(
+            "Upsert",
+            lambda: upsert_request(
+                self.collection, ids, vectors, payload, lo, hi, wait
+            ),
+            pb.PointsOperationResponse.FromString,
+        )
+
+    async def search(
+        self, queries: np.ndarray, k: int, ef: int | None = None
+    ) -> list[list[int]]:
+        params = pb.SearchParams(hnsw_ef=ef) if ef else None
+
+        def build() -> pb.SearchBatchPoints:
+            return pb.SearchBatchPoints(
+                collection_name=self.collection,
+                search_points=[
+                    pb.SearchPoints(
+                        collection_name=self.collection,
+                        vector=q,
+                        limit=k,
+                        params=params,
+                    )
+                    for q in queries.tolist()
+                ],
+            )
+
+        def parse(raw: bytes) -> list[list[int]]:
+            resp = pb.SearchBatchResponse.FromString(raw)
+            return [[hit.id.num for hit in batch.result] for batch in resp.result]
+
+        return await self._call("SearchBatch", build, parse)
+
+    async def scroll(
+        self, limit: int, offset: int | None = None, with_vectors: bool = False
+    ) -> ScrollPage:
+        def build() -> pb.ScrollPoints:
+            return pb.ScrollPoints(
+                collection_name=self.collection,
+                limit=limit,
+                offset=pb.PointId(num=offset) if offset is not None else None,
+                with_payload=pb.WithPayloadSelector(enable=False),
+                with_vectors=pb.WithVectorsSelector(enable=with_vectors),
+            )
+
+        def parse(raw: bytes) -> ScrollPage:
+            resp = pb.ScrollResponse.FromString(raw)
+            return ScrollPage(
+                ids=[p.id.num for p in resp.result],
+                vectors=(
+                    [_vector_data(p.vectors) for p in resp.result]
+                    if with_vectors
+                    else None
+                ),
+                next_offset=(
+                    resp.next_page_offset.num
+                    if resp.HasField("next_page_offset")
+                    else None
+                ),
+            )
+
+        return await self._call("Scroll", build, parse)
@@ -0,0 +1,331 @@
+"""Async client for the Spanner emulator REST API (port 9020).
+
+Covers the calls needed for local data-path testing without GCP:
+instance/database setup and DDL, sessions, `executeSql`,
+`executeStreamingSql` (with chunked-value merging), `partitionQuery`,
+`commit` with mutations and `batchWrite`.
+
+Streaming endpoints return a JSON array that is parsed incrementally, so rows
+are yielded as they arrive instead of after the whole body is buffered.
+"""
+
+import asyncio
+import codecs
+import json
+import re
+import os
+from typing import AsyncIterator
+
+from aiohttp import ClientResponse, ClientSession
+
+from tests.utils.http import HttpError
+
+JSONValue = object
+
+_JSON_TOKEN = re.compile(r'["\\\[\]{},\s]')
+
+
+def base_url() -> str:
+    host = os.environ.get("SPANNER_REST_HOST", "localhost")
+    port = os.environ.get("SPANNER_REST_PORT", "9020")
+    return f"http://{host}:{port}/v1"
+
+
+async def iter_json_array(chunks: AsyncIterator[bytes]) -> AsyncIterator[JSONValue]:
+    """Yield the elements of a streamed top-level JSON array as they complete.
+
+    Bytes are decoded incrementally (a chunk may end inside a multibyte
+    character) and each element is scanned once for its end, so it is parsed
+    once however many chunks it spans.
+    """
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0  # start of the pending element, or where to look for the next one
+    scan = 0  # how far the pending element has been scanned
+    depth = 0
+    in_string = False
+    started = False
+    pending = False
+    async for chunk in chunks:
+        buf = buf[pos:] + utf8.decode(chunk)
+        scan -= pos
+        pos = 0
+        while True:
+            if not pending:
+                while pos < len(buf) and buf[pos] in " \t\r\n,":
+                    pos += 1
+                if pos >= len(buf):
+                    break
+                if not started:
+                    if buf[pos] != "[":
+                        raise ValueError(f"expected JSON array, got {buf[pos]!r}")
+                    started = True
+                    pos += 1
+                    continue
+                if buf[pos] == "]":
+                    return
+                pending, scan = True, pos
+            end = None
+            while end is None:
+                m = _JSON_TOKEN.search(buf, scan)
+                if m is None:
+                    scan = len(buf)
+                    break
+                c, i = m.group(), m.start()
+                scan = i + 1
+                if in_string:
+                    if c == "\\":
+                        if i + 1 == len(buf):
+                            scan = i  # the escaped char is in the next chunk
+                            break
+                        scan = i + 2
+                    elif c == '"':
+                        in_string = False
+                        if depth == 0:
+                            end = i + 1
+                elif c == '"':
+                    in_string = True
+                elif c in "[{":
+                    depth += 1
+                elif depth == 0:
+                    end = i  # delimiter after a top-level number or literal
+                elif c in "]}":
+                    depth -= 1
+                    if depth == 0:
+                        end = i + 1
+            if end is None:
+                break  # element continues in the next chunk
+            value, _ = decoder.raw_decode(buf, pos)
+            yield value
+            pos, pending = end, False
+
+
+def merge_chunk(a: JSONValue, b: JSONValue) -> JSONValue:
+    """Merge a chunked value with its continuation (PartialResultSet rules)."""
+    if isinstance(a, str) and isinstance(b, str):
+        return a + b
+    if isinstance(a, list) and isinstance(b, list):
+        if a and b and isinstance(a[-1], (str, list)) and type(a[-1]) is type(b[0]):
+            return a[:-1] + [merge_chunk(a[-1], b[0])] + b[1:]
+        return a + b
+    raise ValueError(f"cannot merge chunked values of {type(a)} and {type(b)}")
+
+
+def decode_value(value: JSONValue, type_code: str) -> JSONValue:
+    """Decode a JSON-encoded Spanner value (INT64 arrives as a string)."""
+    if value is None:
+        return None
+    if type_code == "INT64":
+        return int(value)
+    if type_code == "FLOAT64":
+        return float(value)
+    return value
+
+
+class SpannerRestClient:
+    """Thin async wrapper over the emulator's REST surface for one database."""
+
+    def __init__(
+        self,
+        http: ClientSession,
+        project: str = "test-project",
+        instance: str = "test-instance",
+        database: str = "rest-bench",
+    ) -> None:
+        self.http = http
+        self.base = base_url()
+        self.instance_path = f"projects/{project}/instances/{instance}"
+        self.database_path = f"{self.instance_path}/databases/{database}"
+        self.project = project
+        self.instance = instance
+        self.database = database
+
+    # ---- transport ----
+
+    async def _request(self, method: str, path: str, body: dict | None = None) -> dict:
+        async with self.http.request(method, f"{self.base}/{path}", json=body) as resp:
+            await self._raise_for_status(resp)
+            return await resp.json(content_type=None)
+
+    async def _stream(self, path: str, body: dict) -> AsyncIterator[dict]:
+        async with self.http.post(f"{self.base}/{path}", json=body) as resp:
+            await self._raise_for_status(resp)
+            async for item in iter_json_array(resp.content.iter_any()):
+                yield item
+
+    @staticmethod
+    async def _raise_for_status(resp: ClientResponse) -> None:
+        if resp.status >= 300:
+            raise HttpError(resp.status, await resp.text())
+
+    async def _wait_operation(self, op: dict, timeout: float = 60.0) -> dict:
+        deadline = asyncio.get_running_loop().time() + timeout
+        while not op.get("done"):
+            if asyncio.get_running_loop().time() > deadline:
+                raise TimeoutError(f"operation {op.get('name')} did not finish")
+            await asyncio.sleep(0.2)
+            op = await self._request("GET", op["name"])
+        if "error" in op:
+            raise HttpError(500, json.dumps(op["error"]))
+        return op
+
+    # ---- admin ----
+
+    async def ensure_instance(self) -> None:
+        try:
+            await self._request("GET", self.instance_path)
+            return
+        except HttpError as e:
+            if e.status != 404:
+                raise
+        op = await self._request(
+            "POST",
+            f"projects/{self.project}/instances",
+            {
+                "instanceId": self.instance,
+                "instance": {
+                    "config": f"projects/{self.project}/instanceConfigs/emulator-config",
+                    "displayName": self.instance,
+                    "nodeCount": 1,
+                },
+            },
+        )
+        await self._wait_operation(op)
+
+    async def recreate_database(self, ddl: list[str]) -> None:
+        """Drop (if present) and create the database with `ddl` applied."""
+        try:
+            await self._request("DELETE", self.database_path)
+        except HttpError as e:
+            if e.status != 404:
+                raise
+        op = await self._request(
+            "POST",
+            f"{self.instance_path}/databases",
+            {
+                "createStatement": f"CREATE DATABASE `{self.database}`",
+                "extraStatements": ddl,
+            },
+        )
+        await self._wait_operation(op)
+
+    async def update_ddl(self, statements: list[str]) -> None:
+        op = await self._request(
+            "PATCH", f"{self.database_path}/ddl", {"statements": statements}
+        )
+        await self._wait_operation(op)
+
+    # ---- sessions ----
+
+    async def create_session(self) -> str:
+        session = await self._request("POST", f"{self.database_path}/sessions", {})
+        return session["name"]
+
+    async def delete_session(self, session: str) -> None:
+        await self._request("DELETE", session)
+
+    # ---- reads ----
+
+    async def execute_sql(self, session: str, sql: str, **extra: object) -> dict:
+        return await self._request(
+            "POST", f"{session}:executeSql", {"sql": sql, **extra}
+        )
+
+    async def execute_streaming_sql(
+        self, session: str, sql: str, **extra: object
+    ) -> AsyncIterator[list[JSONValue]]:
+        """Yield decoded rows from `executeStreamingSql`.
+
+        `extra` is merged into the request (e.g. `transaction`,
+        `partitionToken`, `params`/`paramTypes`).
+        """
+        fields: list[dict] = []
+        pending: list[JSONValue] = []
+        chunked = False
+        async for part in self._stream(
+            f"{session}:executeStreamingSql", {"sql": sql, **extra}
+        ):
+            if "metadata" in part and not fields:
+                fields = part["metadata"].get("rowType", {}).get("fields", [])
+            values = part.get("values", [])
+            if chunked and values and pending:
+                pending[-1] = merge_chunk(pending[-1], values[0])
+                values = values[1:]
+            pending.extend(values)
+            chunked = bool(part.get("chunkedValue"))
+            width = len(fields) or 1
+            # Hold back the last value while it may still be continued.
+            complete = len(pending) - (1 if chunked else 0)
+            rows = complete // width
+            for i in range(rows):
+                yield self._decode_row(pending[i * width : (i + 1) * width], fields)
+            del pending[: rows * width]
+
+    @staticmethod
+    def _decode_row(values: list[JSONValue], fields: list[dict]) -> list[JSONValue]:
+        return [
+            decode_value(v, f.get("type", {}).get("code", ""))
+            for v, f in zip(values, fields)
+        ] or values
+
+    async def partition_query(
+        self, session: str, sql: str, max_partitions: int
+    ) -> tuple[str, list[str]]:
+        """Begin a strong read-only transaction and partition `sql` within it.
+
+        Returns the transaction id and the partition tokens.
+        """
+        resp = await self._request(
+            "POST",
+            f"{session}:partitionQuery",
+            {
+                "sql": sql,
+                "transaction": {"begin": {"readOnly": {"strong": True}}},
+                "partitionOptions": {"maxPartitions": str(max_partitions)},
+            },
+        )
+        tokens = [p["partitionToken"] for p in resp.get("partitions", [])]
+        return resp["transaction"]["id"], tokens
+
+    # ---- writes ----
+
+    async def commit_mutations(self, session: str, mutations: list[dict]) -> dict:
+        """Apply `mutations` in a single-use read-write transaction."""
+        return await self._request(
+            "POST",
+            f"{session}:commit",
+            {"singleUseTransaction": {"readWrite": {}}, "mutations": mutations},
+        )
+
+    async def batch_write(self, session: str, groups: list[list[dict]]) -> list[dict]:
+        """Apply independent mutation groups; returns per-group statuses."""
+        body = {"mutationGroups": [{"mutations": g} for g in groups]}
+        return [r async for r in self._stream(f"{session}:batchWrite", body)]
+
+
+def mutation(
+    op: str, table: str, columns: list[str], rows: list[list[JSONValue]]
+) -> dict:
+    """Build an insert/update/insertOrUpdate/replace mutation.
+
+    INT64 values must be JSON strings; ints are converted here.
+    """
+    values = [
+        [str(v) if isinstance(v, int) and not isinstance(v, bool) else v for v in row]
+        for row in rows
+    ]
+    return {op: {"table": table, "columns": columns, "values": values}}
+
+
+def delete_mutation(table: str, keys: list[list[JSONValue]]) -> dict:
+    return {
+        "delete": {
+            "table": table,
+            "keySet": {
+                "keys": [
+                    [str(k) if isinstance(k, int) else k for k in key] for key in keys
+                ]
+            },
+        }
+    }
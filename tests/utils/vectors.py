@@ -0,0 +1,76 @@
+"""Shared synthetic embedding dataset and exact ground truth for vector benches.
+
+Every vector benchmark (Neo4j, Qdrant) draws from the same seeded generator so
+their QPS and recall numbers are comparable:
+
+- `VEC_COUNT` (default 20000): stored vectors
+- `VEC_DIM` (default 128)
+- `VEC_QUERIES` (default 200)
+- `VEC_SEED` (default 42)
+
+Vectors are a mixture of Gaussian clusters, L2-normalised, float32 (so cosine,
+dot and Euclidean rank identically). Queries come from the same mixture.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from tests.utils.bench import env_int
+
+
+@dataclass(frozen=True)
+class VectorDataset:
+    vectors: np.ndarray  # (count, dim) float32
+    queries: np.ndarray  # (queries, dim) float32
+
+    @property
+    def dim(self) -> int:
+        return int(self.vectors.shape[1])
+
+
+def _normalise(x: np.ndarray) -> np.ndarray:
+    return (x / np.linalg.norm(x, axis=1, keepdims=True)).astype(np.float32)
+
+
+def make_dataset(
+    count: int, dim: int, queries: int, seed: int = 42, clusters: int = 64
+) -> VectorDataset:
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim))
+
+    def draw(n: int) -> np.ndarray:
+        which = rng.integers(0, clusters, size=n)
+        return _normalise(centers[which] + rng.normal(scale=0.35, size=(n, dim)))
+
+    return VectorDataset(vectors=draw(count), queries=draw(queries))
+
+
+def dataset_from_env() -> VectorDataset:
+    return make_dataset(
+        env_int("VEC_COUNT", 20_000),
+        env_int("VEC_DIM", 128),
+        env_int("VEC_QUERIES", 200),
+        env_int("VEC_SEED", 42),
+    )
+
+
+def ground_truth(
+    vectors: np.ndarray, queries: np.ndarray, k: int, block: int = 256
+) -> np.ndarray:
+    """Exact top-`k` row indices by inner product, shape (queries, k)."""
+    out = np.empty((len(queries), k), dtype=np.int64)
+    for lo in range(0, len(queries), block):
+        scores = queries[lo : lo + block] @ vectors.T
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        order = np.take_along_axis(scores, top, axis=1).argsort(axis=1)[:, ::-1]
+        out[lo : lo + block] = np.take_along_axis(top, order, axis=1)
+    return out
+
+
+def recall_at_k(found: list[list[int]], truth: np.ndarray, k: int) -> float:
+    """Mean fraction of the exact top-`k` present in each returned list."""
+    if not found:
+        return 0.0
+    hits = sum(len(set(f[:k]) & set(t[:k].tolist())) for f, t in zip(found, truth))
+    return round(hits / (k * len(found)), 4)